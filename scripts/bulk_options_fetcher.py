@@ -9,6 +9,7 @@ import os
 import pandas as pd
 import requests
 import json
+import tempfile
 import time
 import concurrent.futures
 from datetime import datetime, timezone
@@ -35,6 +36,81 @@ class RuntimeBudgetExceeded(TimeoutError):
         self.successful_symbols = successful_symbols
         self.total_symbols = total_symbols
 
+
+# Expanded universe of highly liquid stocks with active options markets
+# Organized by category for better coverage across sectors
+BASE_PRIORITY_SYMBOLS: tuple[str, ...] = (
+    # Major Indices & ETFs (highest liquidity)
+    'SPY', 'QQQ', 'IWM', 'DIA', 'VXX', 'TLT', 'GLD', 'SLV', 'USO', 'XLE', 'XLF', 'XLK',
+    # Mega Cap Tech (FAANG+)
+    'AAPL', 'MSFT', 'GOOGL', 'GOOG', 'AMZN', 'META', 'NVDA', 'TSLA', 'NFLX',
+    # Semiconductors & Hardware
+    'AMD', 'INTC', 'QCOM', 'AVGO', 'MU', 'AMAT', 'LRCX', 'KLAC', 'ASML', 'TSM', 'ON', 'MRVL',
+    # Cloud & Enterprise Software
+    'CRM', 'ORCL', 'ADBE', 'NOW', 'SNOW', 'DDOG', 'MDB', 'WDAY', 'TEAM', 'ZS', 'CRWD', 'PANW',
+    # Fintech & Payments
+    'V', 'MA', 'PYPL', 'SQ', 'COIN', 'HOOD', 'SOFI', 'AFRM', 'UPST',
+    # E-Commerce & Retail
+    'SHOP', 'ETSY', 'W', 'CHWY', 'DASH', 'ABNB',
+    # Social Media & Communications
+    'SNAP', 'PINS', 'TWLO', 'ZM', 'DOCU', 'U',
+    # EVs & Auto Tech
+    'F', 'GM', 'RIVN', 'LCID', 'NIO', 'XPEV', 'LI',
+    # Energy & Renewables
+    'XOM', 'CVX', 'COP', 'SLB', 'HAL', 'PLUG', 'ENPH', 'RUN',
+    # Financials & Banks
+    'JPM', 'BAC', 'WFC', 'GS', 'MS', 'C', 'SCHW', 'AXP', 'BLK',
+    # Healthcare & Biotech
+    'JNJ', 'UNH', 'PFE', 'ABBV', 'LLY', 'TMO', 'ABT', 'DHR', 'MRNA', 'BNTX', 'REGN',
+    # Consumer Staples & Discretionary
+    'WMT', 'TGT', 'COST', 'HD', 'LOW', 'NKE', 'SBUX', 'MCD', 'DIS', 'CMCSA',
+    # Consumer Brands
+    'KO', 'PEP', 'PG', 'CL', 'EL', 'LULU',
+    # Gaming & Entertainment
+    'RBLX', 'EA', 'TTWO', 'ATVI',
+    # Industrials & Aerospace
+    'BA', 'CAT', 'DE', 'UPS', 'FDX', 'LMT', 'RTX', 'GE',
+    # AI & Emerging Tech
+    'AI', 'PLTR', 'PATH', 'BILL', 'S', 'NET', 'GTLB',
+    # Crypto-Related
+    'MARA', 'RIOT', 'CLSK', 'MSTR',
+    # High Volatility Stocks
+    'AMC', 'GME', 'BBBY', 'BYND',
+    # REITs & Real Estate
+    'SPG', 'PLD', 'AMT', 'CCI',
+    # Additional High-Volume Names
+    'ANET', 'SMCI', 'UBER', 'ROKU',
+)
+
+
+def build_priority_symbols(settings: "AppSettings" | None = None, base_symbols=BASE_PRIORITY_SYMBOLS):
+    """Combine static high-liquidity names with configured watchlists.
+
+    Needs only settings, so callers that want the universe do not have to build
+    a full fetcher (HTTP session and data adapter).
+    """
+
+    symbols = list(base_symbols)
+    try:
+        effective_settings = settings or get_settings()
+        for watchlist in effective_settings.watchlists.values():
+            symbols.extend(watchlist)
+    except Exception as exc:  # pragma: no cover - defensive
+        print(f"⚠️  Unable to load watchlist symbols from config: {exc}")
+
+    # Preserve order while removing duplicates and normalising case
+    seen = set()
+    unique_symbols = []
+    for raw_symbol in symbols:
+        symbol = str(raw_symbol).upper().strip()
+        if not symbol or symbol in seen:
+            continue
+        seen.add(symbol)
+        unique_symbols.append(symbol)
+
+    return unique_symbols
+
+
 class BulkOptionsFetcher:
     def __init__(self, settings: "AppSettings" | None = None):
         self.session = requests.Session()
@@ -64,53 +140,12 @@ class BulkOptionsFetcher:
 
         # Maximum expirations to evaluate per symbol when fetching chains
         self.max_expirations = 6
+        # Parallel symbol fetches per bulk request
+        self.max_workers = 20
+        # When False the fetcher neither reads, falls back to, nor writes the shared cache file
+        self.cache_enabled = True
 
-        # Expanded universe of highly liquid stocks with active options markets
-        # Organized by category for better coverage across sectors
-        base_symbols = [
-            # Major Indices & ETFs (highest liquidity)
-            'SPY', 'QQQ', 'IWM', 'DIA', 'VXX', 'TLT', 'GLD', 'SLV', 'USO', 'XLE', 'XLF', 'XLK',
-            # Mega Cap Tech (FAANG+)
-            'AAPL', 'MSFT', 'GOOGL', 'GOOG', 'AMZN', 'META', 'NVDA', 'TSLA', 'NFLX',
-            # Semiconductors & Hardware
-            'AMD', 'INTC', 'QCOM', 'AVGO', 'MU', 'AMAT', 'LRCX', 'KLAC', 'ASML', 'TSM', 'ON', 'MRVL',
-            # Cloud & Enterprise Software
-            'CRM', 'ORCL', 'ADBE', 'NOW', 'SNOW', 'DDOG', 'MDB', 'WDAY', 'TEAM', 'ZS', 'CRWD', 'PANW',
-            # Fintech & Payments
-            'V', 'MA', 'PYPL', 'SQ', 'COIN', 'HOOD', 'SOFI', 'AFRM', 'UPST',
-            # E-Commerce & Retail
-            'SHOP', 'ETSY', 'W', 'CHWY', 'DASH', 'ABNB',
-            # Social Media & Communications
-            'SNAP', 'PINS', 'TWLO', 'ZM', 'DOCU', 'U',
-            # EVs & Auto Tech
-            'F', 'GM', 'RIVN', 'LCID', 'NIO', 'XPEV', 'LI',
-            # Energy & Renewables
-            'XOM', 'CVX', 'COP', 'SLB', 'HAL', 'PLUG', 'ENPH', 'RUN',
-            # Financials & Banks
-            'JPM', 'BAC', 'WFC', 'GS', 'MS', 'C', 'SCHW', 'AXP', 'BLK',
-            # Healthcare & Biotech
-            'JNJ', 'UNH', 'PFE', 'ABBV', 'LLY', 'TMO', 'ABT', 'DHR', 'MRNA', 'BNTX', 'REGN',
-            # Consumer Staples & Discretionary
-            'WMT', 'TGT', 'COST', 'HD', 'LOW', 'NKE', 'SBUX', 'MCD', 'DIS', 'CMCSA',
-            # Consumer Brands
-            'KO', 'PEP', 'PG', 'CL', 'EL', 'LULU',
-            # Gaming & Entertainment
-            'RBLX', 'EA', 'TTWO', 'ATVI',
-            # Industrials & Aerospace
-            'BA', 'CAT', 'DE', 'UPS', 'FDX', 'LMT', 'RTX', 'GE',
-            # AI & Emerging Tech
-            'AI', 'PLTR', 'PATH', 'BILL', 'S', 'NET', 'GTLB',
-            # Crypto-Related
-            'MARA', 'RIOT', 'CLSK', 'MSTR',
-            # High Volatility Stocks
-            'AMC', 'GME', 'BBBY', 'BYND',
-            # REITs & Real Estate
-            'SPG', 'PLD', 'AMT', 'CCI',
-            # Additional High-Volume Names
-            'ANET', 'SMCI', 'UBER', 'ROKU',
-        ]
-
-        self.priority_symbols = self._build_priority_symbols(base_symbols, self.settings)
+        self.priority_symbols = self._build_priority_symbols(BASE_PRIORITY_SYMBOLS, self.settings)
         
         # Alternative data sources
         self.data_sources = {
@@ -123,25 +158,7 @@ class BulkOptionsFetcher:
     def _build_priority_symbols(self, base_symbols, settings=None):
         """Combine static high-liquidity names with configured watchlists."""
 
-        symbols = list(base_symbols)
-        try:
-            effective_settings = settings or get_settings()
-            for watchlist in effective_settings.watchlists.values():
-                symbols.extend(watchlist)
-        except Exception as exc:  # pragma: no cover - defensive
-            print(f"⚠️  Unable to load watchlist symbols from config: {exc}")
-
-        # Preserve order while removing duplicates and normalising case
-        seen = set()
-        unique_symbols = []
-        for raw_symbol in symbols:
-            symbol = str(raw_symbol).upper().strip()
-            if not symbol or symbol in seen:
-                continue
-            seen.add(symbol)
-            unique_symbols.append(symbol)
-
-        return unique_symbols
+        return build_priority_symbols(settings, base_symbols)
 
     def fetch_options_via_adapter(self, symbol, max_expirations: int = 3):
         """Fetch options data using the configured adapter."""
@@ -237,18 +254,20 @@ class BulkOptionsFetcher:
             return self.fetcher_settings.max_priority_symbols
         return None
 
-    def fetch_bulk_options_parallel(self, symbols=None, max_workers=20, max_symbols: int | None = None):
+    def fetch_bulk_options_parallel(self, symbols=None, max_workers=None, max_symbols: int | None = None):
         """
         Fetch options data for multiple symbols in parallel.
 
         Args:
             symbols: List of symbols to fetch (uses priority_symbols if None)
-            max_workers: Number of parallel workers (default: 20 for faster scans)
+            max_workers: Number of parallel workers (default: self.max_workers, 20)
             max_symbols: Limit number of symbols to fetch
 
         Returns:
             Combined DataFrame of all options data
         """
+        if max_workers is None:
+            max_workers = self.max_workers
         symbol_limit = self._resolve_symbol_limit(max_symbols)
         if symbols is None:
             symbols = self.priority_symbols
@@ -390,8 +409,16 @@ class BulkOptionsFetcher:
                 'options': data_dict
             }
 
-            with open(filename, 'w') as f:
-                json.dump(cache_data, f, indent=2, default=json_serializer)
+            # Write a sibling temp file and swap it in, so readers never see a partial cache
+            directory = os.path.dirname(os.path.abspath(filename))
+            fd, temp_path = tempfile.mkstemp(prefix=".options_cache.", suffix=".tmp", dir=directory)
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(cache_data, f, indent=2, default=json_serializer)
+                os.replace(temp_path, filename)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
 
             print(f"💾 Cached {len(data_dict)} options to {filename}")
 
@@ -495,6 +522,7 @@ class BulkOptionsFetcher:
                 seen.add(normal)
                 normalized_symbols.append(normal)
 
+        use_cache = use_cache and self.cache_enabled
         if use_cache:
             cached_data = self.load_from_cache(symbols=normalized_symbols)
             if cached_data is not None:
@@ -540,7 +568,9 @@ class BulkOptionsFetcher:
             else:
                 fresh_data.attrs["runtime_budget_exceeded"] = False
 
-            if timeout_error is None and has_future_contracts:
+            if not self.cache_enabled:
+                print("📂 Shared cache disabled; skipping cache save")
+            elif timeout_error is None and has_future_contracts:
                 self.save_to_cache(fresh_data)
             elif timeout_error is None:
                 print("⚠️  Live fetch returned only expired contracts; skipping cache save")
@@ -27,6 +27,7 @@ DEFAULT_SETTINGS: Dict[str, Any] = {
         "limit_per_symbol": 3,
         "batch_size": None,
         "rotation_mode": "round_robin",
+        "analysis_workers": 1,
     },
     "adapter": {
         "provider": "yfinance",
@@ -120,6 +121,7 @@ class ScannerSettings(BaseModel):
     limit_per_symbol: int = 3
     batch_size: Optional[int] = None
     rotation_mode: str = "round_robin"
+    analysis_workers: int = 1
 
     @field_validator("rotation_mode")
     @classmethod
@@ -129,6 +131,15 @@ class ScannerSettings(BaseModel):
             return "round_robin"
         return resolved
 
+    @field_validator("analysis_workers", mode="before")
+    @classmethod
+    def _normalize_analysis_workers(cls, value: Any) -> int:
+        try:
+            workers = int(value)
+        except (TypeError, ValueError):
+            return 1
+        return max(workers, 1)
+
 
 class SQLiteSettings(BaseModel):
     path: str = "data/options.db"
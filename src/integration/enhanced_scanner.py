@@ -17,7 +17,8 @@ from ..validation.data_quality import (
     OptionsDataQualityValidator, 
     DataQualityFilter, 
     DataQuality, 
-    QualityReport
+    QualityReport,
+    UNTRADEABLE_QUALITIES,
 )
 from ..math.probability import (
     OptionsProbabilityCalculator, 
@@ -347,7 +348,7 @@ class EnhancedOptionsScanner:
         # Adjust for data quality
         if quality_report.quality == DataQuality.INSTITUTIONAL:
             risk_adjusted += 5  # Bonus for excellent data
-        elif quality_report.quality in [DataQuality.LOW, DataQuality.REJECTED]:
+        elif quality_report.quality in UNTRADEABLE_QUALITIES:
             risk_adjusted -= 10  # Penalty for poor data
             
         # Adjust for time decay risk (high theta)
@@ -430,7 +431,7 @@ class EnhancedOptionsScanner:
         # Data quality tags
         if quality_report.quality == DataQuality.INSTITUTIONAL:
             tags.append("premium_data")
-        elif quality_report.quality in [DataQuality.LOW, DataQuality.REJECTED]:
+        elif quality_report.quality in UNTRADEABLE_QUALITIES:
             tags.append("data_concerns")
             
         # Risk tags
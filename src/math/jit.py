@@ -0,0 +1,88 @@
+"""Optional Numba acceleration for numeric kernels.
+
+Numba is not a hard dependency of the scanner. When it is installed
+:func:`njit` compiles the decorated kernel to machine code; otherwise the
+decorator hands the function back unchanged and :data:`prange` degrades to
+``range``. Callers that would be slower as an interpreted loop than as a
+NumPy expression should check :data:`NUMBA_AVAILABLE` and pick their array
+implementation instead.
+
+Importing Numba costs a few hundred milliseconds, so it is deferred until a
+kernel is first called (or :data:`prange` is first imported). Decorated
+kernels are placeholders until then: the first call imports Numba, compiles
+the kernel and puts the compiled dispatcher back in the defining module, so
+later calls (and kernels that call it) go straight to machine code.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib.util
+from typing import Any, Callable
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+def _numba() -> Any:
+    import numba
+
+    return numba
+
+
+class _LazyKernel:
+    """Compile ``func`` with ``numba.njit(**options)`` on first use."""
+
+    def __init__(self, func: Callable[..., Any], options: dict[str, Any]) -> None:
+        functools.update_wrapper(self, func)
+        self.py_func = func
+        self._options = options
+        self._dispatcher: Any = None
+
+    def dispatcher(self) -> Any:
+        if self._dispatcher is None:
+            module_globals = self.py_func.__globals__
+            # Numba resolves called kernels from the module globals at compile time,
+            # so any placeholders the kernel refers to are compiled and swapped first.
+            for name in self.py_func.__code__.co_names:
+                value = module_globals.get(name)
+                if isinstance(value, _LazyKernel):
+                    module_globals[name] = value.dispatcher()
+            self._dispatcher = _numba().njit(**self._options)(self.py_func)
+            if module_globals.get(self.__name__) is self:
+                module_globals[self.__name__] = self._dispatcher
+        return self._dispatcher
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.dispatcher()(*args, **kwargs)
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """Return a lazily compiled ``numba.njit`` kernel when available, otherwise a no-op decorator."""
+
+    if NUMBA_AVAILABLE:
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return _LazyKernel(args[0], {})
+        if args:
+            # Explicit signatures compile eagerly, so there is nothing to defer.
+            return _numba().njit(*args, **kwargs)
+
+        def lazy_decorator(func: Callable[..., Any]) -> _LazyKernel:
+            return _LazyKernel(func, kwargs)
+
+        return lazy_decorator
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        return func
+
+    return decorator
+
+
+def __getattr__(name: str) -> Any:
+    if name == "prange":
+        return _numba().prange if NUMBA_AVAILABLE else range
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["NUMBA_AVAILABLE", "njit", "prange"]
@@ -1,5 +1,8 @@
 from .option import OptionContract, OptionGreeks, OptionScore, ScoreBreakdown, ScoringResult
 from .serialization import (
+    dumps_json,
+    dumps_json_bytes,
+    loads_json,
     serialize_scan_request,
     serialize_scan_response,
     serialize_signal,
@@ -27,6 +30,9 @@ __all__ = [
     "ScanResponse",
     "ScanTarget",
     "Signal",
+    "dumps_json",
+    "dumps_json_bytes",
+    "loads_json",
     "serialize_scan_request",
     "serialize_scan_response",
     "serialize_signal",
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Any, Dict, List, Literal
+from typing import Any, Dict, List, Literal, Tuple
 
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
@@ -68,12 +68,14 @@ class OptionContract(BaseModel):
 
 
 class ScoreBreakdown(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     scorer: str
     weight: float
     raw_score: float
     weighted_score: float
-    reasons: List[str] = Field(default_factory=list)
-    tags: List[str] = Field(default_factory=list)
+    reasons: Tuple[str, ...] = ()
+    tags: Tuple[str, ...] = ()
 
 
 class OptionScore(BaseModel):
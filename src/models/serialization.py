@@ -2,8 +2,23 @@
 
 from __future__ import annotations
 
+import json
 from typing import Any, Dict
 
+try:  # pragma: no cover - exercised when orjson is installed
+    import orjson
+
+    _ORJSON_OPTIONS = (
+        orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_NON_STR_KEYS
+        # Keep dataclasses and datetimes on the ``default=str`` path like stdlib json.
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+except ModuleNotFoundError:  # pragma: no cover - executed in minimal environments
+    orjson = None
+    _ORJSON_OPTIONS = 0
+
 from .signal import ScanRequest, ScanResponse, Signal
 
 
@@ -25,7 +40,43 @@ def serialize_scan_response(response: ScanResponse) -> Dict[str, Any]:
     return response.model_dump()
 
 
+def dumps_json_bytes(payload: Any, *, indent: int | None = None) -> bytes:
+    """Serialize ``payload`` to UTF-8 JSON, using orjson when it is installed.
+
+    Values JSON cannot represent are rendered with ``str``. An ``indent`` of
+    ``None`` or ``0`` produces compact output. orjson only supports two-space
+    indentation and writes NaN/Infinity as ``null``.
+    """
+
+    if indent is not None and indent <= 0:
+        indent = None
+    if orjson is None:
+        return json.dumps(payload, indent=indent, default=str).encode("utf-8")
+    option = _ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if indent else 0)
+    return orjson.dumps(payload, option=option, default=str)
+
+
+def dumps_json(payload: Any, *, indent: int | None = None) -> str:
+    """Text form of :func:`dumps_json_bytes`."""
+
+    return dumps_json_bytes(payload, indent=indent).decode("utf-8")
+
+
+def loads_json(data: bytes | str) -> Any:
+    """Parse JSON text or bytes, using orjson when it is installed.
+
+    Both paths raise :class:`json.JSONDecodeError` on malformed input.
+    """
+
+    if orjson is None:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
 __all__ = [
+    "dumps_json",
+    "dumps_json_bytes",
+    "loads_json",
     "serialize_scan_request",
     "serialize_scan_response",
     "serialize_signal",
@@ -142,6 +142,7 @@ class InstitutionalOptionsScanner(SmartOptionsScanner):
         options_data: Optional[pd.DataFrame],
         *,
         allow_relaxed_fallback: bool = True,
+        scan_now: Optional[datetime] = None,
     ) -> List[Dict[str, Any]]:
         """Enhanced opportunity analysis using both legacy and new components."""
 
@@ -152,6 +153,7 @@ class InstitutionalOptionsScanner(SmartOptionsScanner):
         legacy_opportunities = super().analyze_opportunities(
             options_data,
             allow_relaxed_fallback=allow_relaxed_fallback,
+            scan_now=scan_now,
         )
         
         if not legacy_opportunities:
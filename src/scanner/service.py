@@ -3,26 +3,38 @@
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
+import math
 import os
 import sys
+import threading
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from math import ceil, isfinite, log, log1p
-from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Set, Tuple
+from types import MappingProxyType
+from typing import Any, BinaryIO, Callable, Dict, List, Mapping, Optional, Sequence, Set, Tuple
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
+from scipy.special import ndtr
 
 from scripts.bulk_options_fetcher import BulkOptionsFetcher
 from src.analysis import SwingSignal, SwingSignalAnalyzer
 from src.analysis.rejection_tracker import RejectionTracker
 from src.config import AppSettings, get_settings
+from src.models.serialization import dumps_json, dumps_json_bytes
 from src.scanner.historical_moves import HistoricalMoveAnalyzer
+from src.scanner import vectorized
 from src.scanner.iv_rank_history import IVRankHistory
 from src.scanner.universe import build_scan_universe
 from src.signals import OptionsSkewAnalyzer, SmartMoneyFlowDetector, RegimeDetector, VolumeProfileAnalyzer, SignalAggregator
-from src.validation import OptionsDataValidator, DataQuality
+from src.signals.base import CALL_CODE, OPTION_TYPE_CODE_COLUMN, PUT_CODE, option_type_codes
+from src.validation import OptionsDataValidator, UNTRADEABLE_QUALITIES
 
 
 def _parse_positive_float(value: str | None) -> Optional[float]:
@@ -48,6 +60,60 @@ def _parse_bool_env(name: str, default: bool = True) -> bool:
     return normalized in {"1", "true", "yes", "on", "relaxed", "wide"}
 
 
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+def _norm_pdf(x: float) -> float:
+    """Standard normal density without ``scipy.stats`` frozen-distribution dispatch."""
+
+    return math.exp(-0.5 * x * x) * _INV_SQRT_2PI
+
+
+DEFAULT_IMPLIED_VOLATILITY = 0.30
+MODEL_IV_COLUMN = "_model_iv"
+_GREEK_COLUMNS = ("_delta", "_gamma", "_theta", "_vega")
+
+
+@lru_cache(maxsize=1024)
+def _parse_expiration(expiration: Any) -> pd.Timestamp:
+    """Parse an expiration once; chains repeat a handful of dates across every contract."""
+
+    return pd.to_datetime(expiration)
+
+
+def _notna(value: Any) -> bool:
+    """Scalar ``pd.notna`` for quote fields; NaN is the only float unequal to itself."""
+
+    return value is not None and value == value
+
+
+def _model_iv(option: Mapping[str, Any]) -> float:
+    """Return the IV used by the pricing models, defaulting when the quote lacks one."""
+
+    model_iv = option.get(MODEL_IV_COLUMN)
+    if model_iv is not None:
+        return model_iv
+    raw_iv = option.get("impliedVolatility")
+    return float(raw_iv) if _notna(raw_iv) else DEFAULT_IMPLIED_VOLATILITY
+
+
+def _nearest_scenario(
+    moves: Sequence[float],
+    scenarios: Sequence[Dict[str, float]],
+    target: float,
+) -> Dict[str, float]:
+    """Return the scenario whose move is closest to ``target``; ``moves`` must be sorted."""
+
+    if not scenarios:
+        return {"roi_percent": 0.0, "net_profit": 0.0}
+    index = bisect_left(moves, target)
+    if index == len(moves):
+        return scenarios[-1]
+    if index > 0 and target - moves[index - 1] <= moves[index] - target:
+        return scenarios[index - 1]
+    return scenarios[index]
+
+
 @dataclass
 class ScanResult:
     """Container holding serialized scan opportunities and metadata."""
@@ -63,8 +129,45 @@ class ScanResult:
         }
 
     def to_json(self, *, indent: int | None = None) -> str:
-        return json.dumps(self.to_dict(), indent=indent, default=str)
+        return dumps_json(self.to_dict(), indent=indent)
 
+    def to_json_bytes(self, *, indent: int | None = None) -> bytes:
+        return dumps_json_bytes(self.to_dict(), indent=indent)
+
+    def dump(self, fp: BinaryIO, *, indent: int | None = None) -> None:
+        """Write the JSON payload to a binary stream followed by a newline.
+
+        Compact output is streamed one opportunity at a time so the full
+        document is never held in memory; indented output is buffered.
+        """
+
+        if indent and indent > 0:
+            fp.write(self.to_json_bytes(indent=indent))
+            fp.write(b"\n")
+            return
+        fp.write(b'{"opportunities":[')
+        for position, opportunity in enumerate(self.opportunities):
+            if position:
+                fp.write(b",")
+            fp.write(dumps_json_bytes(opportunity))
+        fp.write(b'],"metadata":')
+        fp.write(dumps_json_bytes(self.metadata))
+        fp.write(b',"totalEvaluated":')
+        fp.write(dumps_json_bytes(self.metadata.get("totalEvaluated", len(self.opportunities))))
+        fp.write(b"}\n")
+
+    def dump_lines(self, fp: BinaryIO) -> None:
+        """Write one JSON line per opportunity, then a ``__meta__`` line."""
+
+        for opportunity in self.opportunities:
+            fp.write(dumps_json_bytes(opportunity))
+            fp.write(b"\n")
+        fp.write(dumps_json_bytes({"__meta__": self.metadata}))
+        fp.write(b"\n")
+
+
+# A single contract: a DataFrame record dict in the scan loop, or a pandas Series.
+OptionRow = Mapping[str, Any]
 
 UniverseBuilder = Callable[[AppSettings, int, Optional[Mapping[str, Any]]], Tuple[List[str], Dict[str, Any]]]
 
@@ -72,7 +175,14 @@ UniverseBuilder = Callable[[AppSettings, int, Optional[Mapping[str, Any]]], Tupl
 class SmartOptionsScanner:
     """Core implementation extracted from the legacy smart scanner script."""
 
-    def __init__(self, max_symbols: int | None = None, *, batch_builder: UniverseBuilder | None = None):
+    def __init__(
+        self,
+        max_symbols: int | None = None,
+        *,
+        batch_builder: UniverseBuilder | None = None,
+        shared_cache: bool = True,
+        fetch_workers: int | None = None,
+    ):
         settings = get_settings()
         self.settings = settings
         configured_limit = settings.fetcher.max_priority_symbols
@@ -83,8 +193,12 @@ class SmartOptionsScanner:
         if isinstance(self.symbol_limit, int) and self.symbol_limit <= 0:
             self.symbol_limit = None
         self.fetcher = BulkOptionsFetcher(settings)
+        # Scans that run alongside others keep off the shared options_cache.json
+        self.fetcher.cache_enabled = shared_cache
+        if fetch_workers is not None:
+            self.fetcher.max_workers = fetch_workers
         self.universe_builder: UniverseBuilder = batch_builder or build_scan_universe
-        self.rotation_state: Dict[str, Any] | None = {"mode": settings.scanner.rotation_mode}
+        self._rotation_state_raw: Dict[str, Any] = {"mode": settings.scanner.rotation_mode}
         self.current_batch_symbols: List[str] = []
         self.cache_file = "options_cache.json"
         self.last_fetch_time: datetime | None = None
@@ -105,6 +219,7 @@ class SmartOptionsScanner:
         self.swing_analyzer: SwingSignalAnalyzer | None = None
         self._swing_signal_cache: Dict[str, Optional[Dict[str, Any]]] = {}
         self._swing_error_cache: Dict[str, str] = {}
+        self.analysis_workers: int = max(int(getattr(settings.scanner, "analysis_workers", 1) or 1), 1)
         self.user_portfolio_size = _parse_positive_float(os.getenv("USER_PORTFOLIO_SIZE"))
         self.user_daily_contract_budget = _parse_positive_float(os.getenv("USER_DAILY_CONTRACT_BUDGET"))
 
@@ -129,10 +244,22 @@ class SmartOptionsScanner:
             return universe_size
         return min(self.symbol_limit, universe_size)
 
+    @property
+    def rotation_state(self) -> Mapping[str, Any]:
+        """Read-only view of the universe rotation state carried between scans."""
+
+        return MappingProxyType(self._rotation_state_raw)
+
+    @rotation_state.setter
+    def rotation_state(self, state: Mapping[str, Any] | None) -> None:
+        self._rotation_state_raw = dict(state or {})
+
     def _next_symbol_batch(self) -> List[str]:
         batch_size = self.batch_size
         symbols, state = self.universe_builder(self.settings, batch_size, self.rotation_state)
-        self.rotation_state = dict(state)
+        # Adopt the builder's dict as-is; callers only ever see read-only views or copies of it.
+        if state is not self._rotation_state_raw:
+            self._rotation_state_raw = state if type(state) is dict else dict(state)
         self.current_batch_symbols = list(symbols)
         return self.current_batch_symbols
 
@@ -203,7 +330,12 @@ class SmartOptionsScanner:
 
         return False
 
-    def _filter_current_contracts(self, options_data: pd.DataFrame) -> pd.DataFrame:
+    def _filter_current_contracts(
+        self,
+        options_data: pd.DataFrame,
+        *,
+        now: datetime | None = None,
+    ) -> pd.DataFrame:
         """Remove expired contracts so analysis focuses on actionable trades."""
 
         if options_data is None or options_data.empty or "expiration" not in options_data.columns:
@@ -213,13 +345,12 @@ class SmartOptionsScanner:
         if expirations.empty:
             return options_data
 
-        now = pd.Timestamp.now(tz=timezone.utc)
+        now_ts = pd.Timestamp(now) if now is not None else pd.Timestamp.now(tz=timezone.utc)
         mask = expirations.notna()
-        mask &= (expirations - now).dt.total_seconds() >= -60
+        mask &= (expirations - now_ts).dt.total_seconds() >= -60
 
         # Drop contracts where the expiration could not be parsed or is in the distant past.
-        filtered = options_data.loc[mask].copy()
-        return filtered
+        return options_data.loc[mask]
 
     def get_current_options_data(
         self,
@@ -244,7 +375,7 @@ class SmartOptionsScanner:
 
         # When we explicitly bypass the cache and fail to fetch fresh data,
         # fall back to whatever cached snapshot we can recover.
-        if data is None and refresh_needed:
+        if data is None and refresh_needed and self.fetcher.cache_enabled:
             data = self.fetcher.get_fresh_options_data(
                 use_cache=True,
                 max_symbols=self.symbol_limit,
@@ -426,8 +557,13 @@ class SmartOptionsScanner:
         options_data: pd.DataFrame | None,
         *,
         allow_relaxed_fallback: bool = True,
+        scan_now: datetime | None = None,
     ) -> List[Dict[str, Any]]:
-        """Analyze options data for opportunities."""
+        """Analyze options data for opportunities.
+
+        ``scan_now`` (timezone-aware UTC) pins the clock used for expiry
+        filtering and days-to-expiration; it defaults to the current time.
+        """
 
         self.relaxed_scan_info = {
             "strictMode": not allow_relaxed_fallback,
@@ -471,7 +607,11 @@ class SmartOptionsScanner:
         if options_data is None or options_data.empty:
             return []
 
-        working_data = self._filter_current_contracts(options_data).copy()
+        # The column assignments below replace arrays rather than writing into them, so a
+        # shallow copy protects the caller's frame without duplicating its data.
+        if scan_now is None:
+            scan_now = datetime.now(timezone.utc)
+        working_data = self._filter_current_contracts(options_data, now=scan_now).copy(deep=False)
         if working_data.empty:
             print("⚠️  No non-expired options available after filtering", file=sys.stderr)
             return []
@@ -483,33 +623,46 @@ class SmartOptionsScanner:
             "ask",
             "impliedVolatility",
             "stockPrice",
+            "strike",
         ]
         for col in numeric_columns:
             if col in working_data.columns:
-                working_data[col] = pd.to_numeric(working_data[col], errors="coerce")
-
-        # RETAIL LIQUIDITY filters - tradeable options for retail traders
-        liquid_options = working_data[
-            (working_data["volume"] > 100)  # Retail minimum - need decent volume for fills
-            & (working_data["openInterest"] > 100)  # Retail minimum - need liquidity
-            & (working_data["lastPrice"] > 0.05)  # Avoid penny options with terrible spreads
-            & (working_data["bid"] > 0)
-            & (working_data["ask"] > 0)
-        ].copy()
+                working_data[col] = pd.to_numeric(working_data[col], errors="coerce").astype("float64")
+
+        # Resolve the pricing-model IV once for the frame instead of NaN-checking every contract.
+        # The raw column is kept so missing IV is still reported (and scored) as missing.
+        if "impliedVolatility" in working_data.columns:
+            working_data[MODEL_IV_COLUMN] = working_data["impliedVolatility"].fillna(DEFAULT_IMPLIED_VOLATILITY)
+        # Encode call/put once; the per-symbol chains handed to the signals inherit the codes.
+        working_data[OPTION_TYPE_CODE_COLUMN] = option_type_codes(working_data)
+
+        # RETAIL LIQUIDITY filters - tradeable options for retail traders.
+        # Evaluated once over the raw column arrays; the same mask also selects the rejects.
+        liquid_mask = vectorized.liquidity_mask(
+            working_data["volume"].to_numpy(),
+            working_data["openInterest"].to_numpy(),
+            working_data["lastPrice"].to_numpy(),
+            working_data["bid"].to_numpy(),
+            working_data["ask"].to_numpy(),
+            min_volume=100,  # Retail minimum - need decent volume for fills
+            min_open_interest=100,  # Retail minimum - need liquidity
+            min_last_price=0.05,  # Avoid penny options with terrible spreads
+        )
+        liquid_options = working_data[liquid_mask]
 
         # Limit to top 150 by volume to ensure scan completes within 4-minute timeout
         if len(liquid_options) > 150:
-            liquid_options = liquid_options.nlargest(150, 'volume').copy()
+            liquid_options = liquid_options.nlargest(150, 'volume')
+            liquid_mask = working_data.index.isin(liquid_options.index)
             print(f"⚡ Limited to top 150 highest-volume options for speed", file=sys.stderr)
 
         # Log rejected options for retrospective analysis (BATCHED for speed)
-        rejected_mask = ~working_data.index.isin(liquid_options.index)
-        rejected_options = working_data[rejected_mask]
+        rejected_options = working_data[~liquid_mask]
 
         if len(rejected_options) > 0 and self.rejection_tracker is not None:
             # Build batch of rejections (fast - no DB calls yet)
             rejections_batch = []
-            for idx, row in rejected_options.iterrows():
+            for row in rejected_options.to_dict(orient="records"):
                 row_symbol = row.get('symbol', 'UNKNOWN')
                 try:
                     # Determine specific rejection reason
@@ -529,7 +682,7 @@ class SmartOptionsScanner:
 
                     rejections_batch.append({
                         "symbol": row_symbol,
-                        "option_data": row.to_dict(),
+                        "option_data": row,
                         "rejection_reason": rejection_reason,
                         "filter_stage": "liquidity_strict"
                     })
@@ -653,89 +806,57 @@ class SmartOptionsScanner:
 
         print(f"📊 Analyzing {len(liquid_options)} liquid options...", file=sys.stderr)
 
-        # Pre-fetch price history for all unique symbols to avoid repeated yfinance calls
-        unique_symbols = liquid_options["symbol"].unique().tolist()
+        # Score every liquid contract in one vectorized pass; only the survivors of the
+        # quality, strike-sanity and moneyness gates are walked row by row below.
+        candidates = self._prescore_contracts(liquid_options, now=scan_now)
+        print(f"🧮 {len(candidates)} contracts passed the vectorized quality gates", file=sys.stderr)
+
+        # Validate data quality for the whole candidate set at once so rejected contracts never
+        # reach the price-history prefetch or the swing/signal-framework work below.
+        quality = self.validator.validate_frame(candidates)
+        # Skip rejected AND low quality options - only HIGH/MEDIUM pass
+        rejected = quality["quality"].isin(UNTRADEABLE_QUALITIES).to_numpy()
+        for option, report in zip(
+            candidates.loc[rejected].to_dict(orient="records"),
+            quality.loc[rejected].to_dict(orient="records"),
+        ):
+            print(f"⚠️  Rejected {option['symbol']} {option['type']} ${option['strike']} - Quality: {report['quality'].value}, Issues: {report['issues']}, Warnings: {report['warnings']}", file=sys.stderr)
+        kept = quality.loc[~rejected]
+        candidates = candidates.loc[~rejected].assign(
+            _quality=kept["quality"],
+            _quality_score=kept["score"],
+            _quality_issues=kept["issues"],
+            _quality_warnings=kept["warnings"],
+        )
+
+        # Pre-fetch price history for all candidate symbols to avoid repeated yfinance calls
+        unique_symbols = candidates["symbol"].unique().tolist()
         print(f"📥 Pre-fetching price history for {len(unique_symbols)} symbols...", file=sys.stderr)
-        price_history_cache: Dict[str, pd.DataFrame] = {}
-        for symbol in unique_symbols:
-            try:
-                # Add timeout to prevent hanging on slow connections
-                price_history = yf.download(
-                    symbol,
-                    period="30d",
-                    interval="1d",
-                    progress=False,
-                    auto_adjust=True,
-                    timeout=10  # 10 second timeout per symbol
-                )
-                if not price_history.empty:
-                    # Flatten MultiIndex columns if present
-                    if isinstance(price_history.columns, pd.MultiIndex):
-                        price_history.columns = price_history.columns.get_level_values(0)
-                    # Normalize column names to lowercase
-                    price_history.columns = [col.lower() for col in price_history.columns]
-                    price_history_cache[symbol] = price_history
-            except Exception as e:
-                print(f"⚠️  Could not fetch price history for {symbol}: {e}", file=sys.stderr)
+        price_history_cache = self._prefetch_symbol_context(unique_symbols)
         print(f"✅ Cached price history for {len(price_history_cache)} symbols", file=sys.stderr)
 
         opportunities: List[Dict[str, Any]] = []
         fallback_candidates: List[Dict[str, Any]] = []
-        for _, option in liquid_options.iterrows():
+        # Directional signal descriptions are only formatted for the opportunities that are returned.
+        deferred_signal_inputs: Dict[int, Tuple[OptionRow, Optional[Dict[str, Any]]]] = {}
+        # Plain record dicts avoid boxing every row into a Series (and, unlike
+        # itertuples, keep the underscore-prefixed metadata columns addressable).
+        for option in candidates.to_dict(orient="records"):
             returns_analysis, metrics = self.calculate_returns_analysis(option)
-            probability_score = self.calculate_probability_score(option, metrics)
-            score = self.calculate_opportunity_score(option, metrics, probability_score)
+            probability_score = float(option["_probability_score"])
+            score = float(option["_opportunity_score"])
 
             # Focus on probability of profit rather than extreme upside
             probability_percent = self.estimate_probability_percent(probability_score)
             expected_roi = metrics["expectedMoveRoiPercent"]  # 1 SD move (realistic)
 
-            # Quality thresholds - reasonable levels to filter junk
-            # Minimum score 45 (retail improvements give 9 pts for affordability, so this allows cheap good setups)
-            # Minimum 5% probability and 3% expected ROI to avoid lottery tickets
-            quality_setup = (
-                score >= 45  # Reasonable minimum with affordability bonuses
-                and probability_percent >= 5  # Some chance of profit
-                and expected_roi >= 3  # Some expected return
-            )
-
-            # No relaxed setup - either passes quality or doesn't show
-            relaxed_setup = False
-
-            if not quality_setup:
-                continue
-
-            # STRIKE SANITY CHECK: Reject invalid strikes from bad data (e.g., $4 call on $19 stock)
-            stock_price = float(option["stockPrice"])
-            strike = float(option["strike"])
-
-            # Reject strikes absurdly far from stock price (Yahoo Finance bad data)
-            if option["type"] == "call":
-                # Call strikes should be 20% to 300% of stock price
-                if strike < stock_price * 0.20 or strike > stock_price * 3.0:
-                    continue
-            else:  # put
-                # Put strikes should be 20% to 300% of stock price
-                if strike < stock_price * 0.20 or strike > stock_price * 3.0:
-                    continue
-
-            # MONEYNESS FILTER: Block deep ITM options (capital inefficient)
-            if option["type"] == "call":
-                moneyness = (stock_price - strike) / stock_price  # Positive if ITM
-                if moneyness > 0.15:  # More than 15% ITM = too deep
-                    continue
-            else:  # put
-                moneyness = (strike - stock_price) / stock_price  # Positive if ITM
-                if moneyness > 0.15:  # More than 15% ITM = too deep
-                    continue
-
             volume_ratio = float(option["volume"] / max(option["openInterest"], 1))
             spread_pct = (option["ask"] - option["bid"]) / max(option["lastPrice"], 0.01)
 
             swing_signal, swing_error = self._swing_signal_for(option["symbol"])
 
             # Calculate directional bias to help choose between calls and puts
-            directional_bias = self.calculate_directional_bias(option, swing_signal)
+            directional_bias = self.calculate_directional_bias(option, swing_signal, include_signals=False)
 
             # Calculate ENHANCED directional bias using new signal framework
             # Get full options chain for this symbol
@@ -757,9 +878,10 @@ class SmartOptionsScanner:
                 if signal_score > 20 or confidence > 40:
                     continue
 
+            dte = self._option_days_to_expiration(option)
+
             # Calculate historical move context for validation
             try:
-                dte = self.calculate_days_to_expiration(option["expiration"])
                 direction = "up" if option["type"] == "call" else "down"
                 target_move = abs(metrics["breakevenMovePercent"])
                 historical_context = self.historical_moves.get_move_context(
@@ -767,7 +889,7 @@ class SmartOptionsScanner:
                     target_move_pct=target_move,
                     timeframe_days=dte,
                     direction=direction,
-                    current_price=float(option["stockPrice"]) if pd.notna(option["stockPrice"]) else None,
+                    current_price=float(option["stockPrice"]) if _notna(option["stockPrice"]) else None,
                 )
             except Exception as e:
                 # If historical analysis fails, continue without it
@@ -812,14 +934,6 @@ class SmartOptionsScanner:
             if enhanced_bias and abs(enhanced_bias.get("score", 0)) > 30:
                 patterns.append("Strong Directional Signal")
 
-            # Validate data quality before creating opportunity
-            quality_report = self.validator.validate_option(option.to_dict())
-
-            # Skip rejected AND low quality options - only HIGH/MEDIUM pass
-            if quality_report.quality in [DataQuality.REJECTED, DataQuality.LOW]:
-                print(f"⚠️  Rejected {option['symbol']} {option['type']} ${option['strike']} - Quality: {quality_report.quality.value}, Issues: {quality_report.issues}, Warnings: {quality_report.warnings}", file=sys.stderr)
-                continue
-
             risk_reward_ratio = metrics["bestRoiPercent"] / 100 if metrics["bestRoiPercent"] > 0 else None
 
             # Classify into quality lane for retail-focused filtering
@@ -835,19 +949,24 @@ class SmartOptionsScanner:
                 contract_cost=contract_cost,
             )
 
+            # The payload is a dict display with constant keys, so CPython already builds it
+            # without rehashing; just avoid recomputing the values it repeats.
+            max_loss_amount = round(metrics["costBasis"], 2)
+            breakeven_price = round(metrics["breakevenPrice"], 2)
+
             opportunity = {
                 "symbol": option["symbol"],
                 "optionType": option["type"],
                 "strike": round(float(option["strike"]), 2),
                 "expiration": option["expiration"],
-                "premium": round(float(option["lastPrice"]) * 100, 2),  # Per contract (100 shares)
+                "premium": round(contract_cost, 2),  # Per contract (100 shares)
                 "tradeSummary": trade_summary,
                 "qualityLane": quality_lane,  # NEW: Two-lane classification system
                 "bid": round(float(option["bid"]) * 100, 2),  # Per contract
                 "ask": round(float(option["ask"]) * 100, 2),  # Per contract
                 "volume": int(option["volume"]),
                 "openInterest": int(option["openInterest"]),
-                "impliedVolatility": round(float(option["impliedVolatility"]), 4) if pd.notna(option["impliedVolatility"]) else 0.0,
+                "impliedVolatility": round(float(option["impliedVolatility"]), 4) if _notna(option["impliedVolatility"]) else 0.0,
                 "stockPrice": round(float(option["stockPrice"]), 2),
                 "score": round(score, 1),  # Round to 1 decimal place
                 "confidence": round(min(95, (score * 0.35) + (probability_percent * 0.65)), 1),
@@ -867,10 +986,10 @@ class SmartOptionsScanner:
                 "expectedMove1SD": round(metrics["expectedMove1SD"], 2),
                 "expectedMove2SD": round(metrics["expectedMove2SD"], 2),
                 "maxLossPercent": 100.0,
-                "maxLossAmount": round(metrics["costBasis"], 2),
-                "maxLoss": round(metrics["costBasis"], 2),
-                "breakeven": round(metrics["breakevenPrice"], 2),
-                "breakevenPrice": round(metrics["breakevenPrice"], 2),
+                "maxLossAmount": max_loss_amount,
+                "maxLoss": max_loss_amount,
+                "breakeven": breakeven_price,
+                "breakevenPrice": breakeven_price,
                 "breakevenMovePercent": round(metrics["breakevenMovePercent"], 1),
                 "ivRank": round(self.calculate_iv_rank(option), 1),
                 "volumeRatio": round(volume_ratio, 2),
@@ -886,22 +1005,23 @@ class SmartOptionsScanner:
                     metrics["tenMoveRoiPercent"] / 100 if metrics["tenMoveRoiPercent"] > 0 else None
                 ),
                 "greeks": self.calculate_greeks_approximation(option),
-                "daysToExpiration": self.calculate_days_to_expiration(option["expiration"]),
+                "daysToExpiration": dte,
                 "returnsAnalysis": returns_analysis,
                 "directionalBias": directional_bias,
                 "enhancedDirectionalBias": enhanced_bias,  # New proprietary signal framework
                 "historicalContext": historical_context,  # Empirical probability validation
                 # Add data quality metadata
                 "_dataQuality": {
-                    "quality": quality_report.quality.value,
-                    "score": quality_report.score,
-                    "issues": quality_report.issues,
-                    "warnings": quality_report.warnings,
+                    "quality": option["_quality"].value,
+                    "score": option["_quality_score"],
+                    "issues": option["_quality_issues"],
+                    "warnings": option["_quality_warnings"],
                     "priceSource": option.get("_price_source", "unknown"),
                     "priceTimestamp": option.get("_price_timestamp"),
                     "priceAgeSeconds": option.get("_price_age_seconds"),
                 },
             }
+            deferred_signal_inputs[id(opportunity)] = (option, swing_signal)
             if swing_signal is not None:
                 opportunity["swingSignal"] = swing_signal
             if swing_error is not None:
@@ -918,12 +1038,7 @@ class SmartOptionsScanner:
             )
             if position_sizing:
                 opportunity["positionSizing"] = position_sizing
-            if not quality_setup:
-                opportunity.setdefault("metadata", {})
-                opportunity["metadata"]["selectionMode"] = "relaxed"
-                fallback_candidates.append(opportunity)
-            else:
-                opportunities.append(opportunity)
+            opportunities.append(opportunity)
 
         # Sort by expected value: probability * expected return (most likely to profit)
         # This replaces sorting by raw score which favored high-ROI lottery tickets
@@ -935,7 +1050,9 @@ class SmartOptionsScanner:
             ev = (prob * expected_return) + (item.get("score", 0) * 0.1)
             return ev
 
-        opportunities.sort(key=expected_value_key, reverse=True)
+        # Only the top few of each edge bucket are returned, so rank with heapq.nlargest
+        # (equivalent to a stable descending sort plus slice) instead of sorting everything.
+        max_opportunities = 20
 
         if fallback_candidates:
             record_relaxed_stage(
@@ -966,9 +1083,8 @@ class SmartOptionsScanner:
                 f"ℹ️  No opportunities met the strict filter – returning {len(fallback_candidates)} relaxed candidates",
                 file=sys.stderr,
             )
-            fallback_candidates.sort(key=expected_value_key, reverse=True)
             max_relaxed = 10
-            opportunities = fallback_candidates[:max_relaxed]
+            opportunities = heapq.nlargest(max_relaxed, fallback_candidates, key=expected_value_key)
             if relaxed_info is not None:
                 relaxed_info["applied"] = True
                 relaxed_info["appliedStage"] = "quality"
@@ -990,29 +1106,184 @@ class SmartOptionsScanner:
         if positive_edge:
             print(f"✅ Found {len(positive_edge)} opportunities with positive expected edge", file=sys.stderr)
             # Include positive edge + top 5 negative edge for collapsible section
-            opportunities = positive_edge + negative_edge[:5]
+            negative_shown = min(5, len(negative_edge))
+            opportunities = heapq.nlargest(max_opportunities, positive_edge, key=expected_value_key) + heapq.nlargest(
+                negative_shown, negative_edge, key=expected_value_key
+            )
             if negative_edge:
-                print(f"📊 Including {min(5, len(negative_edge))} negative-edge opportunities in collapsible section", file=sys.stderr)
+                print(f"📊 Including {negative_shown} negative-edge opportunities in collapsible section", file=sys.stderr)
+            selected_count = len(positive_edge) + negative_shown
         elif negative_edge:
             # No positive edge found - show top 10 anyway with clear warning
             print(f"⚠️  No positive-edge opportunities found. Showing top 10 for educational purposes.", file=sys.stderr)
             print(f"💡 These trades have negative expected value based on probability analysis.", file=sys.stderr)
-            opportunities = negative_edge[:10]
+            opportunities = heapq.nlargest(10, negative_edge, key=expected_value_key)
+            selected_count = len(opportunities)
         else:
             print(f"❌ No opportunities passed filtering", file=sys.stderr)
             opportunities = []
+            selected_count = 0
 
         # Limit to top 20 opportunities to keep JSON manageable
-        max_opportunities = 20
-        if len(opportunities) > max_opportunities:
-            print(f"📊 Limiting output to top {max_opportunities} of {len(opportunities)} opportunities", file=sys.stderr)
+        if selected_count > max_opportunities:
+            print(f"📊 Limiting output to top {max_opportunities} of {selected_count} opportunities", file=sys.stderr)
             opportunities = opportunities[:max_opportunities]
 
+        for opportunity in opportunities:
+            deferred = deferred_signal_inputs.get(id(opportunity))
+            if deferred is not None:
+                self._attach_directional_signals(opportunity["directionalBias"], *deferred)
+
         if self.relaxed_scan_info is not None:
             self.relaxed_scan_info["selectedCount"] = len(opportunities)
 
         return opportunities
 
+    def _prescore_contracts(self, options: pd.DataFrame, *, now: datetime | None = None) -> pd.DataFrame:
+        """Score contracts column-wise and return the rows that pass the quality gates.
+
+        The returned frame carries ``_dte``, ``_probability_score`` and
+        ``_opportunity_score`` columns matching the scalar
+        ``calculate_days_to_expiration``/``calculate_probability_score``/
+        ``calculate_opportunity_score`` results for each row, the
+        ``calculate_returns_analysis`` tuple as ``_returns_analysis`` and the
+        survivors' Greeks as ``_delta``/``_gamma``/``_theta``/``_vega``.
+        """
+
+        if options.empty:
+            return options.assign(
+                **{
+                    column: []
+                    for column in ("_dte", "_probability_score", "_opportunity_score", "_returns_analysis", *_GREEK_COLUMNS)
+                }
+            )
+
+        expirations = options["expiration"]
+        dte_lookup = {
+            expiration: self.calculate_days_to_expiration(expiration, now=now)
+            for expiration in expirations.unique()
+        }
+        dte = expirations.map(dte_lookup).fillna(30).to_numpy(dtype=np.int64)
+
+        stock_price = options["stockPrice"].to_numpy(dtype=np.float64)
+        strike = options["strike"].to_numpy(dtype=np.float64)
+        last_price = options["lastPrice"].to_numpy(dtype=np.float64)
+        is_call = option_type_codes(options) == CALL_CODE
+        if "impliedVolatility" in options.columns:
+            raw_iv = options["impliedVolatility"].to_numpy(dtype=np.float64)
+        else:
+            raw_iv = np.full(len(options), np.nan)
+        if MODEL_IV_COLUMN in options.columns:
+            model_iv = options[MODEL_IV_COLUMN].to_numpy(dtype=np.float64)
+        else:
+            model_iv = np.where(np.isnan(raw_iv), DEFAULT_IMPLIED_VOLATILITY, raw_iv)
+
+        metrics = vectorized.returns_metrics(stock_price, strike, last_price, model_iv, dte, is_call)
+        probability_score = vectorized.probability_scores(metrics.breakeven_move_percent, model_iv, dte)
+        score = vectorized.opportunity_scores(
+            options["volume"].to_numpy(dtype=np.float64),
+            options["openInterest"].to_numpy(dtype=np.float64),
+            options["bid"].to_numpy(dtype=np.float64),
+            options["ask"].to_numpy(dtype=np.float64),
+            last_price,
+            raw_iv,
+            metrics,
+            probability_score,
+        )
+
+        # Quality thresholds - reasonable levels to filter junk
+        # Minimum score 45 (retail improvements give 9 pts for affordability, so this allows cheap good setups)
+        # Minimum 5% probability and 3% expected ROI to avoid lottery tickets
+        passes = (
+            (score >= 45)
+            & (probability_score >= 5)
+            & (metrics.expected_move_roi_percent >= 3)
+        )
+
+        # STRIKE SANITY CHECK: strikes should be 20% to 300% of the stock price
+        # (rejects bad Yahoo Finance data such as a $4 call on a $19 stock)
+        passes &= ~((strike < stock_price * 0.20) | (strike > stock_price * 3.0))
+
+        # MONEYNESS FILTER: Block options more than 15% ITM (capital inefficient)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            moneyness = np.where(is_call, stock_price - strike, strike - stock_price) / stock_price
+        passes &= ~(moneyness > 0.15)
+
+        # Scenario dicts are only materialised for the contracts that are walked row by row.
+        returns_analysis = [metrics.analysis(row) for row in np.flatnonzero(passes)]
+
+        greeks = vectorized.black_scholes_greeks(
+            stock_price[passes],
+            strike[passes],
+            model_iv[passes],
+            dte[passes],
+            is_call[passes],
+        )
+
+        return options.loc[passes].assign(
+            _dte=dte[passes],
+            _probability_score=probability_score[passes],
+            _opportunity_score=score[passes],
+            _returns_analysis=returns_analysis,
+            **{f"_{name}": greeks[name] for name in ("delta", "gamma", "theta", "vega")},
+        )
+
+    def _fetch_price_history(self, symbol: str) -> Optional[pd.DataFrame]:
+        try:
+            # Add timeout to prevent hanging on slow connections
+            price_history = yf.download(
+                symbol,
+                period="30d",
+                interval="1d",
+                progress=False,
+                auto_adjust=True,
+                timeout=10  # 10 second timeout per symbol
+            )
+        except Exception as e:
+            print(f"⚠️  Could not fetch price history for {symbol}: {e}", file=sys.stderr)
+            return None
+
+        if price_history.empty:
+            return None
+        # Flatten MultiIndex columns if present
+        if isinstance(price_history.columns, pd.MultiIndex):
+            price_history.columns = price_history.columns.get_level_values(0)
+        # Normalize column names to lowercase
+        price_history.columns = [col.lower() for col in price_history.columns]
+        return price_history
+
+    def _prefetch_symbol_context(self, symbols: Sequence[str]) -> Dict[str, pd.DataFrame]:
+        """Fetch per-symbol price history ahead of the contract loop.
+
+        The per-contract analysis is dominated by these network calls rather than
+        CPU work, so when ``scanner.analysis_workers`` is above one the price
+        history and swing signals for each symbol are loaded on a thread pool.
+        That relies on ``yf.download`` keeping its results per call, which it
+        does from yfinance 1.4; earlier releases collect every download in one
+        module-level dict, so concurrent calls can return each other's frames.
+        With a single worker swing signals stay lazy, as before.
+        """
+
+        workers = min(self.analysis_workers, len(symbols))
+        if workers <= 1:
+            histories = [self._fetch_price_history(symbol) for symbol in symbols]
+        else:
+            if self.swing_analyzer is None:
+                self.swing_analyzer = SwingSignalAnalyzer()
+
+            def load(symbol: str) -> Optional[pd.DataFrame]:
+                self._swing_signal_for(symbol)
+                return self._fetch_price_history(symbol)
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                histories = list(executor.map(load, symbols))
+
+        return {
+            symbol: history
+            for symbol, history in zip(symbols, histories)
+            if history is not None
+        }
+
     def _preferred_option_type(
         self,
         enhanced_bias: Optional[Dict[str, Any]],
@@ -1076,7 +1347,7 @@ class SmartOptionsScanner:
         # Below threshold: Don't classify (these will likely be filtered out anyway)
         return "speculative"
 
-    def calculate_opportunity_score(self, option: pd.Series, metrics: Mapping[str, float], probability_score: float) -> float:
+    def calculate_opportunity_score(self, option: OptionRow, metrics: Mapping[str, float], probability_score: float) -> float:
         """Calculate opportunity score prioritizing probability of profit over extreme upside.
 
         Philosophy: We want trades that are LIKELY to make money, not lottery tickets.
@@ -1150,7 +1421,7 @@ class SmartOptionsScanner:
 
         # IV quality check (max 5 points)
         iv = option["impliedVolatility"]
-        if pd.notna(iv):
+        if _notna(iv):
             if 0.2 <= iv <= 0.6:
                 score += 5
             elif iv > 0.8:
@@ -1193,7 +1464,7 @@ class SmartOptionsScanner:
 
         return float(max(0.0, min(100.0, score)))
 
-    def generate_trade_summary(self, option: pd.Series, metrics: Mapping[str, float], returns_analysis: List[Dict[str, Any]]) -> str:
+    def generate_trade_summary(self, option: OptionRow, metrics: Mapping[str, float], returns_analysis: List[Dict[str, Any]]) -> str:
         """Generate a clear, concise summary of what needs to happen for this trade to profit meaningfully.
 
         Instead of just showing breakeven, this shows the move needed for a decent profit (first profitable scenario).
@@ -1202,7 +1473,7 @@ class SmartOptionsScanner:
         stock_price = float(option["stockPrice"])
         premium = float(option["lastPrice"])
         cost_basis = premium * 100
-        dte = self.calculate_days_to_expiration(option["expiration"])
+        dte = self._option_days_to_expiration(option)
         option_type = option["type"].upper()
 
         # Time frame description
@@ -1282,7 +1553,7 @@ class SmartOptionsScanner:
 
     def generate_reasoning(
         self,
-        option: pd.Series,
+        option: OptionRow,
         score: float,
         metrics: Mapping[str, float],
         probability_score: float,
@@ -1318,7 +1589,7 @@ class SmartOptionsScanner:
         if probability_percent >= 65:
             reasoning.append(f"Probability model flags ~{probability_percent:.0f}% chance of profit")
 
-        dte = self.calculate_days_to_expiration(option["expiration"])
+        dte = self._option_days_to_expiration(option)
         if dte > 0:
             reasoning.append(f"{dte} days until expiration provides time for the thesis to play out")
 
@@ -1329,7 +1600,7 @@ class SmartOptionsScanner:
 
     def assess_risk_level(
         self,
-        option: pd.Series,
+        option: OptionRow,
         metrics: Mapping[str, float],
         probability_score: float,
     ) -> str:
@@ -1349,18 +1620,18 @@ class SmartOptionsScanner:
             return "high"
         return "medium"
 
-    def calculate_breakeven(self, option: pd.Series) -> float:
+    def calculate_breakeven(self, option: OptionRow) -> float:
         """Calculate breakeven price."""
 
         if option["type"] == "call":
             return float(option["strike"] + option["lastPrice"])
         return float(option["strike"] - option["lastPrice"])
 
-    def calculate_iv_rank(self, option: pd.Series) -> float:
+    def calculate_iv_rank(self, option: OptionRow) -> float:
         """Calculate IV rank using a 52-week percentile of historical observations."""
 
         raw_iv = option.get("impliedVolatility")
-        if pd.isna(raw_iv):
+        if not _notna(raw_iv):
             return 50.0
 
         try:
@@ -1379,23 +1650,20 @@ class SmartOptionsScanner:
         # Fallback to simple scaling when no history is available.
         return float(max(0.0, min(100.0, current_iv * 100.0)))
 
-    def calculate_probability_score(self, option: pd.Series, metrics: Mapping[str, float]) -> float:
+    def calculate_probability_score(self, option: OptionRow, metrics: Mapping[str, float]) -> float:
         """Calculate real probability of profit using statistical methods.
 
         Uses Black-Scholes assumptions with implied volatility to estimate
         the probability that the option finishes in-the-money at expiration.
         """
-        import math
-        from scipy import stats
-
         breakeven_move_pct = metrics["breakevenMovePercent"]  # Keep sign! Positive = up, negative = down
-        dte = self.calculate_days_to_expiration(option["expiration"])
+        dte = self._option_days_to_expiration(option)
 
         if dte <= 0:
             return 0.0
 
         # Use Implied Volatility (annualized) - this is what the market expects
-        iv = float(option["impliedVolatility"]) if pd.notna(option["impliedVolatility"]) else 0.30
+        iv = _model_iv(option)
 
         # Convert annualized IV to expected move over the time period
         # Expected daily volatility = IV / sqrt(252 trading days)
@@ -1415,7 +1683,7 @@ class SmartOptionsScanner:
         # Probability stock moves at least |breakeven_move_pct| in the required direction
         # Since we're using abs(breakeven), this works for both calls and puts
         # This is the probability the move is >= z_score standard deviations from mean
-        probability = 1 - stats.norm.cdf(z_score)
+        probability = ndtr(-z_score)
 
         # Convert to percentage and clamp to reasonable range
         return float(max(1.0, min(99.0, probability * 100)))
@@ -1426,7 +1694,7 @@ class SmartOptionsScanner:
 
     def build_probability_explanation(
         self,
-        option: pd.Series,
+        option: OptionRow,
         metrics: Mapping[str, float],
         probability_percent: float,
         volume_ratio: float,
@@ -1443,12 +1711,12 @@ class SmartOptionsScanner:
             )
         explanation_parts.append(move_text)
 
-        dte = self.calculate_days_to_expiration(option["expiration"])
+        dte = self._option_days_to_expiration(option)
         if dte:
             explanation_parts.append(f"{dte} days to expiration")
 
         iv = option["impliedVolatility"]
-        if pd.notna(iv):
+        if _notna(iv):
             explanation_parts.append(
                 f"IV at {iv:.0%} provides {'amplified' if iv > 0.4 else 'controlled'} pricing"
             )
@@ -1457,15 +1725,17 @@ class SmartOptionsScanner:
 
         return ". ".join(explanation_parts)
 
-    def calculate_greeks_approximation(self, option: pd.Series) -> Dict[str, float]:
+    def calculate_greeks_approximation(self, option: OptionRow) -> Dict[str, float]:
         """Calculate Greeks using Black-Scholes model."""
-        import math
-        from scipy import stats
+
+        if _GREEK_COLUMNS[0] in option:
+            # Already computed for the whole candidate set by _prescore_contracts.
+            return {column[1:]: float(option[column]) for column in _GREEK_COLUMNS}
 
         stock_price = float(option["stockPrice"])
         strike = float(option["strike"])
-        iv = float(option["impliedVolatility"]) if pd.notna(option["impliedVolatility"]) else 0.3
-        dte = max(self.calculate_days_to_expiration(option["expiration"]), 1)
+        iv = _model_iv(option)
+        dte = max(self._option_days_to_expiration(option), 1)
 
         # Time to expiration in years
         T = dte / 365.0
@@ -1478,23 +1748,23 @@ class SmartOptionsScanner:
 
         # Calculate Greeks
         if option["type"] == "call":
-            delta = stats.norm.cdf(d1)
+            delta = ndtr(d1)
         else:
-            delta = stats.norm.cdf(d1) - 1  # Put delta is negative
+            delta = ndtr(d1) - 1  # Put delta is negative
 
         # Gamma is same for calls and puts
-        gamma = stats.norm.pdf(d1) / (stock_price * iv * math.sqrt(T))
+        gamma = _norm_pdf(d1) / (stock_price * iv * math.sqrt(T))
 
         # Theta (per day, not per year)
         if option["type"] == "call":
-            theta = (-(stock_price * stats.norm.pdf(d1) * iv) / (2 * math.sqrt(T))
-                    - r * strike * math.exp(-r * T) * stats.norm.cdf(d2)) / 365
+            theta = (-(stock_price * _norm_pdf(d1) * iv) / (2 * math.sqrt(T))
+                    - r * strike * math.exp(-r * T) * ndtr(d2)) / 365
         else:
-            theta = (-(stock_price * stats.norm.pdf(d1) * iv) / (2 * math.sqrt(T))
-                    + r * strike * math.exp(-r * T) * stats.norm.cdf(-d2)) / 365
+            theta = (-(stock_price * _norm_pdf(d1) * iv) / (2 * math.sqrt(T))
+                    + r * strike * math.exp(-r * T) * ndtr(-d2)) / 365
 
         # Vega (per 1% change in IV)
-        vega = stock_price * stats.norm.pdf(d1) * math.sqrt(T) / 100
+        vega = stock_price * _norm_pdf(d1) * math.sqrt(T) / 100
 
         return {
             "delta": float(delta),
@@ -1504,7 +1774,7 @@ class SmartOptionsScanner:
         }
 
     def calculate_enhanced_directional_bias(
-        self, symbol: str, option: pd.Series, options_chain: pd.DataFrame, price_history_cache: Optional[Dict[str, pd.DataFrame]] = None
+        self, symbol: str, option: OptionRow, options_chain: pd.DataFrame, price_history_cache: Optional[Dict[str, pd.DataFrame]] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Calculate enhanced directional bias using the new signal framework.
@@ -1527,8 +1797,9 @@ class SmartOptionsScanner:
             atm_iv = float(option.get("impliedVolatility", 0))
 
             # Get historical volume data (simplified - using current as proxy)
-            call_options = options_chain[options_chain["type"] == "call"]
-            put_options = options_chain[options_chain["type"] == "put"]
+            type_codes = option_type_codes(options_chain)
+            call_options = options_chain[type_codes == CALL_CODE]
+            put_options = options_chain[type_codes == PUT_CODE]
 
             avg_call_volume = call_options["volume"].mean() if not call_options.empty else 1
             avg_put_volume = put_options["volume"].mean() if not put_options.empty else 1
@@ -1607,7 +1878,13 @@ class SmartOptionsScanner:
             print(f"Error calculating enhanced directional bias for {symbol}: {e}")
             return None
 
-    def calculate_directional_bias(self, option: pd.Series, swing_signal: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    def calculate_directional_bias(
+        self,
+        option: OptionRow,
+        swing_signal: Optional[Dict[str, Any]],
+        *,
+        include_signals: bool = True,
+    ) -> Dict[str, Any]:
         """Calculate directional bias to help users choose between calls and puts on the same symbol.
 
         Returns a dict with:
@@ -1615,187 +1892,288 @@ class SmartOptionsScanner:
         - confidence: 0-100 score for the directional conviction
         - signals: breakdown of contributing factors
         - recommendation: which option type aligns with the bias
+
+        Pass ``include_signals=False`` when only the direction is needed (e.g. while
+        filtering); ``signals`` and ``relevantMetrics`` are then left as ``None`` and
+        can be filled in later with :meth:`_attach_directional_signals`.
         """
 
-        signals = {}
-        relevant_metrics: List[Dict[str, object]] = []
+        factors = self._swing_factors(swing_signal)
+        bullish_score, bearish_score = self._directional_factor_scores(factors)
+        option_type = option["type"]
+
+        # Determine overall direction
+        net_score = bullish_score - bearish_score
+
+        if net_score > 20:
+            direction = "bullish"
+            confidence = min(100, 50 + net_score)
+        elif net_score < -20:
+            direction = "bearish"
+            confidence = min(100, 50 - net_score)
+        else:
+            direction = "neutral"
+            confidence = 50 - abs(net_score) / 2
+
+        # Recommendation based on direction and option type
+        if direction == "bullish":
+            if option_type == "call":
+                alignment = "aligned"
+                recommendation = "✓ Bullish bias supports this CALL"
+            else:
+                alignment = "opposed"
+                recommendation = "⚠ Bullish bias opposes this PUT"
+        elif direction == "bearish":
+            if option_type == "call":
+                alignment = "opposed"
+                recommendation = "⚠ Bearish bias opposes this CALL"
+            else:
+                alignment = "aligned"
+                recommendation = "✓ Bearish bias supports this PUT"
+        else:
+            alignment = "neutral"
+            recommendation = f"↔ Neutral bias - {option_type.upper()} not strongly favored or opposed"
+
+        bias: Dict[str, Any] = {
+            "direction": direction,
+            "confidence": round(confidence, 1),
+            "alignment": alignment,
+            "recommendation": recommendation,
+            "signals": None,
+            "relevantMetrics": None,
+            "scores": {
+                "bullish": round(bullish_score, 1),
+                "bearish": round(bearish_score, 1),
+                "net": round(net_score, 1),
+            }
+        }
+        if include_signals:
+            self._attach_directional_signals(bias, option, swing_signal)
+        return bias
+
+    @staticmethod
+    def _swing_factors(swing_signal: Optional[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        if not swing_signal:
+            return {}
+        return {f["name"]: f for f in swing_signal.get("factors", [])}
+
+    @staticmethod
+    def _directional_factor_scores(factors: Mapping[str, Dict[str, Any]]) -> Tuple[float, float]:
+        """Return the (bullish, bearish) scores contributed by swing factors."""
+
         bullish_score = 0.0
         bearish_score = 0.0
 
         # 1. Momentum from swing signal (strongest indicator)
-        if swing_signal:
-            factors = {f["name"]: f for f in swing_signal.get("factors", [])}
-
-            # Momentum breakout factor
-            if "Momentum Breakout" in factors:
-                momentum_factor = factors["Momentum Breakout"]
-                momentum_zscore = momentum_factor.get("details", {}).get("momentum_zscore", 0)
-
-                if momentum_zscore > 1.5:
-                    bullish_score += 30
-                    signals["momentum"] = f"Strong bullish momentum ({momentum_zscore:.2f} σ above mean)"
-                    relevant_metrics.append(
-                        {
-                            "factor": "Momentum Breakout",
-                            "reading": f"{momentum_zscore:.2f}σ",
-                            "supports": "calls",
-                            "implication": "Price is accelerating higher; call positions align with the prevailing trend.",
-                        }
-                    )
-                elif momentum_zscore > 0.5:
-                    bullish_score += 15
-                    signals["momentum"] = f"Moderate bullish momentum ({momentum_zscore:.2f} σ above mean)"
-                    relevant_metrics.append(
-                        {
-                            "factor": "Momentum Breakout",
-                            "reading": f"{momentum_zscore:.2f}σ",
-                            "supports": "calls",
-                            "implication": "Upward momentum is building, increasing odds the stock keeps rising.",
-                        }
-                    )
-                elif momentum_zscore < -1.5:
-                    bearish_score += 30
-                    signals["momentum"] = f"Strong bearish momentum ({momentum_zscore:.2f} σ below mean)"
-                    relevant_metrics.append(
-                        {
-                            "factor": "Momentum Breakout",
-                            "reading": f"{momentum_zscore:.2f}σ",
-                            "supports": "puts",
-                            "implication": "Momentum is sharply lower; put setups benefit if the downtrend continues.",
-                        }
-                    )
-                elif momentum_zscore < -0.5:
-                    bearish_score += 15
-                    signals["momentum"] = f"Moderate bearish momentum ({momentum_zscore:.2f} σ below mean)"
-                    relevant_metrics.append(
-                        {
-                            "factor": "Momentum Breakout",
-                            "reading": f"{momentum_zscore:.2f}σ",
-                            "supports": "puts",
-                            "implication": "Price is drifting lower; puts gain if weakness persists.",
-                        }
-                    )
-                else:
-                    signals["momentum"] = f"Neutral momentum ({momentum_zscore:.2f} σ)"
-
-            # News sentiment
-            if "News & Catalysts" in factors:
-                news_factor = factors["News & Catalysts"]
-                avg_sentiment = news_factor.get("details", {}).get("average_sentiment", 0)
-
-                if avg_sentiment > 0.3:
-                    bullish_score += 20
-                    signals["news"] = f"Positive news sentiment ({avg_sentiment:.2f})"
-                    relevant_metrics.append(
-                        {
-                            "factor": "News & Catalysts",
-                            "reading": f"score {avg_sentiment:.2f}",
-                            "supports": "calls",
-                            "implication": "Recent headlines skew bullish, often preceding upward reactions.",
-                        }
-                    )
-                elif avg_sentiment > 0.1:
-                    bullish_score += 10
-                    signals["news"] = f"Slightly positive news ({avg_sentiment:.2f})"
-                    relevant_metrics.append(
-                        {
-                            "factor": "News & Catalysts",
-                            "reading": f"score {avg_sentiment:.2f}",
-                            "supports": "calls",
-                            "implication": "Mildly constructive news bias provides incremental support to bullish trades.",
-                        }
-                    )
-                elif avg_sentiment < -0.3:
-                    bearish_score += 20
-                    signals["news"] = f"Negative news sentiment ({avg_sentiment:.2f})"
-                    relevant_metrics.append(
-                        {
-                            "factor": "News & Catalysts",
-                            "reading": f"score {avg_sentiment:.2f}",
-                            "supports": "puts",
-                            "implication": "News flow is negative, which can pressure the stock lower in the near term.",
-                        }
-                    )
-                elif avg_sentiment < -0.1:
-                    bearish_score += 10
-                    signals["news"] = f"Slightly negative news ({avg_sentiment:.2f})"
-                    relevant_metrics.append(
-                        {
-                            "factor": "News & Catalysts",
-                            "reading": f"score {avg_sentiment:.2f}",
-                            "supports": "puts",
-                            "implication": "Headlines tilt bearish, adding weight to downside thesis.",
-                        }
-                    )
-                else:
-                    signals["news"] = "Neutral news sentiment"
-
-            # Volatility expansion (benefits both directions but more for options aligned with momentum)
-            if "Volatility Expansion" in factors:
-                vol_factor = factors["Volatility Expansion"]
-                atr_ratio = vol_factor.get("details", {}).get("atr_ratio", 1.0)
-
-                if atr_ratio > 1.3:
-                    signals["volatility"] = f"High volatility ({atr_ratio:.1f}x baseline) - favors strong moves"
-                    relevant_metrics.append(
-                        {
-                            "factor": "Volatility Expansion",
-                            "reading": f"{atr_ratio:.2f}x",
-                            "supports": "both",
-                            "implication": "Larger swings amplify both gains and losses—manage risk sizing carefully.",
-                        }
-                    )
-                elif atr_ratio > 1.1:
-                    signals["volatility"] = f"Elevated volatility ({atr_ratio:.1f}x baseline)"
-                    relevant_metrics.append(
-                        {
-                            "factor": "Volatility Expansion",
-                            "reading": f"{atr_ratio:.2f}x",
-                            "supports": "both",
-                            "implication": "Somewhat larger moves expected; directional trades can reach targets faster.",
-                        }
-                    )
-                else:
-                    signals["volatility"] = f"Normal volatility ({atr_ratio:.1f}x baseline)"
-                    relevant_metrics.append(
-                        {
-                            "factor": "Volatility Expansion",
-                            "reading": f"{atr_ratio:.2f}x",
-                            "supports": "either",
-                            "implication": "Volatility in line with norms; rely on directional signals for edge.",
-                        }
-                    )
+        if "Momentum Breakout" in factors:
+            momentum_zscore = factors["Momentum Breakout"].get("details", {}).get("momentum_zscore", 0)
+            if momentum_zscore > 1.5:
+                bullish_score += 30
+            elif momentum_zscore > 0.5:
+                bullish_score += 15
+            elif momentum_zscore < -1.5:
+                bearish_score += 30
+            elif momentum_zscore < -0.5:
+                bearish_score += 15
+
+        # News sentiment
+        if "News & Catalysts" in factors:
+            avg_sentiment = factors["News & Catalysts"].get("details", {}).get("average_sentiment", 0)
+            if avg_sentiment > 0.3:
+                bullish_score += 20
+            elif avg_sentiment > 0.1:
+                bullish_score += 10
+            elif avg_sentiment < -0.3:
+                bearish_score += 20
+            elif avg_sentiment < -0.1:
+                bearish_score += 10
+
+        return bullish_score, bearish_score
+
+    def _attach_directional_signals(
+        self,
+        bias: Dict[str, Any],
+        option: OptionRow,
+        swing_signal: Optional[Dict[str, Any]],
+    ) -> None:
+        """Populate the human-readable ``signals``/``relevantMetrics`` of a bias in place."""
 
-            if "Market Regime" in factors:
-                market_factor = factors["Market Regime"]
-                context = market_factor.get("details", {})
-                vix_ratio = context.get("vix_ratio")
-                spy_return = context.get("spy_return_5d")
-                parts = []
-                if vix_ratio is not None:
-                    parts.append(f"VIX {vix_ratio:.1f}x avg")
-                if spy_return is not None:
-                    parts.append(f"SPY {spy_return:+.2%} (5d)")
-
-                if spy_return is not None and spy_return > 0.01:
-                    market_supports = "calls"
-                    market_message = "Market tailwind for bullish trades"
-                elif spy_return is not None and spy_return < -0.01:
-                    market_supports = "puts"
-                    market_message = "Market selling pressure favors protective puts"
-                else:
-                    market_supports = "both"
-                    market_message = "Market backdrop neutral"
+        signals, relevant_metrics = self._build_directional_signals(option, self._swing_factors(swing_signal))
+        bias["signals"] = signals
+        bias["relevantMetrics"] = relevant_metrics
+
+    def _build_directional_signals(
+        self,
+        option: OptionRow,
+        factors: Mapping[str, Dict[str, Any]],
+    ) -> Tuple[Dict[str, str], List[Dict[str, object]]]:
+        """Format the signal descriptions backing a directional bias."""
+
+        signals: Dict[str, str] = {}
+        relevant_metrics: List[Dict[str, object]] = []
+
+        # 1. Momentum from swing signal (strongest indicator)
+        if "Momentum Breakout" in factors:
+            momentum_factor = factors["Momentum Breakout"]
+            momentum_zscore = momentum_factor.get("details", {}).get("momentum_zscore", 0)
+
+            if momentum_zscore > 1.5:
+                signals["momentum"] = f"Strong bullish momentum ({momentum_zscore:.2f} σ above mean)"
+                relevant_metrics.append(
+                    {
+                        "factor": "Momentum Breakout",
+                        "reading": f"{momentum_zscore:.2f}σ",
+                        "supports": "calls",
+                        "implication": "Price is accelerating higher; call positions align with the prevailing trend.",
+                    }
+                )
+            elif momentum_zscore > 0.5:
+                signals["momentum"] = f"Moderate bullish momentum ({momentum_zscore:.2f} σ above mean)"
+                relevant_metrics.append(
+                    {
+                        "factor": "Momentum Breakout",
+                        "reading": f"{momentum_zscore:.2f}σ",
+                        "supports": "calls",
+                        "implication": "Upward momentum is building, increasing odds the stock keeps rising.",
+                    }
+                )
+            elif momentum_zscore < -1.5:
+                signals["momentum"] = f"Strong bearish momentum ({momentum_zscore:.2f} σ below mean)"
+                relevant_metrics.append(
+                    {
+                        "factor": "Momentum Breakout",
+                        "reading": f"{momentum_zscore:.2f}σ",
+                        "supports": "puts",
+                        "implication": "Momentum is sharply lower; put setups benefit if the downtrend continues.",
+                    }
+                )
+            elif momentum_zscore < -0.5:
+                signals["momentum"] = f"Moderate bearish momentum ({momentum_zscore:.2f} σ below mean)"
+                relevant_metrics.append(
+                    {
+                        "factor": "Momentum Breakout",
+                        "reading": f"{momentum_zscore:.2f}σ",
+                        "supports": "puts",
+                        "implication": "Price is drifting lower; puts gain if weakness persists.",
+                    }
+                )
+            else:
+                signals["momentum"] = f"Neutral momentum ({momentum_zscore:.2f} σ)"
+
+        # News sentiment
+        if "News & Catalysts" in factors:
+            news_factor = factors["News & Catalysts"]
+            avg_sentiment = news_factor.get("details", {}).get("average_sentiment", 0)
 
-                signals["market"] = f"{' / '.join(parts) if parts else 'Market data limited'} - {market_message}"
+            if avg_sentiment > 0.3:
+                signals["news"] = f"Positive news sentiment ({avg_sentiment:.2f})"
                 relevant_metrics.append(
                     {
-                        "factor": "Market Regime",
-                        "reading": context,
-                        "supports": market_supports,
-                        "implication": market_message,
+                        "factor": "News & Catalysts",
+                        "reading": f"score {avg_sentiment:.2f}",
+                        "supports": "calls",
+                        "implication": "Recent headlines skew bullish, often preceding upward reactions.",
                     }
                 )
+            elif avg_sentiment > 0.1:
+                signals["news"] = f"Slightly positive news ({avg_sentiment:.2f})"
+                relevant_metrics.append(
+                    {
+                        "factor": "News & Catalysts",
+                        "reading": f"score {avg_sentiment:.2f}",
+                        "supports": "calls",
+                        "implication": "Mildly constructive news bias provides incremental support to bullish trades.",
+                    }
+                )
+            elif avg_sentiment < -0.3:
+                signals["news"] = f"Negative news sentiment ({avg_sentiment:.2f})"
+                relevant_metrics.append(
+                    {
+                        "factor": "News & Catalysts",
+                        "reading": f"score {avg_sentiment:.2f}",
+                        "supports": "puts",
+                        "implication": "News flow is negative, which can pressure the stock lower in the near term.",
+                    }
+                )
+            elif avg_sentiment < -0.1:
+                signals["news"] = f"Slightly negative news ({avg_sentiment:.2f})"
+                relevant_metrics.append(
+                    {
+                        "factor": "News & Catalysts",
+                        "reading": f"score {avg_sentiment:.2f}",
+                        "supports": "puts",
+                        "implication": "Headlines tilt bearish, adding weight to downside thesis.",
+                    }
+                )
+            else:
+                signals["news"] = "Neutral news sentiment"
+
+        # Volatility expansion (benefits both directions but more for options aligned with momentum)
+        if "Volatility Expansion" in factors:
+            vol_factor = factors["Volatility Expansion"]
+            atr_ratio = vol_factor.get("details", {}).get("atr_ratio", 1.0)
+
+            if atr_ratio > 1.3:
+                signals["volatility"] = f"High volatility ({atr_ratio:.1f}x baseline) - favors strong moves"
+                relevant_metrics.append(
+                    {
+                        "factor": "Volatility Expansion",
+                        "reading": f"{atr_ratio:.2f}x",
+                        "supports": "both",
+                        "implication": "Larger swings amplify both gains and losses—manage risk sizing carefully.",
+                    }
+                )
+            elif atr_ratio > 1.1:
+                signals["volatility"] = f"Elevated volatility ({atr_ratio:.1f}x baseline)"
+                relevant_metrics.append(
+                    {
+                        "factor": "Volatility Expansion",
+                        "reading": f"{atr_ratio:.2f}x",
+                        "supports": "both",
+                        "implication": "Somewhat larger moves expected; directional trades can reach targets faster.",
+                    }
+                )
+            else:
+                signals["volatility"] = f"Normal volatility ({atr_ratio:.1f}x baseline)"
+                relevant_metrics.append(
+                    {
+                        "factor": "Volatility Expansion",
+                        "reading": f"{atr_ratio:.2f}x",
+                        "supports": "either",
+                        "implication": "Volatility in line with norms; rely on directional signals for edge.",
+                    }
+                )
+
+        if "Market Regime" in factors:
+            market_factor = factors["Market Regime"]
+            context = market_factor.get("details", {})
+            vix_ratio = context.get("vix_ratio")
+            spy_return = context.get("spy_return_5d")
+            parts = []
+            if vix_ratio is not None:
+                parts.append(f"VIX {vix_ratio:.1f}x avg")
+            if spy_return is not None:
+                parts.append(f"SPY {spy_return:+.2%} (5d)")
+
+            if spy_return is not None and spy_return > 0.01:
+                market_supports = "calls"
+                market_message = "Market tailwind for bullish trades"
+            elif spy_return is not None and spy_return < -0.01:
+                market_supports = "puts"
+                market_message = "Market selling pressure favors protective puts"
+            else:
+                market_supports = "both"
+                market_message = "Market backdrop neutral"
+
+            signals["market"] = f"{' / '.join(parts) if parts else 'Market data limited'} - {market_message}"
+            relevant_metrics.append(
+                {
+                    "factor": "Market Regime",
+                    "reading": context,
+                    "supports": market_supports,
+                    "implication": market_message,
+                }
+            )
 
         # 2. Price relative to strike (moneyness)
         stock_price = float(option["stockPrice"])
@@ -1868,63 +2246,29 @@ class SmartOptionsScanner:
                 }
             )
 
-        # Determine overall direction
-        net_score = bullish_score - bearish_score
-
-        if net_score > 20:
-            direction = "bullish"
-            confidence = min(100, 50 + net_score)
-        elif net_score < -20:
-            direction = "bearish"
-            confidence = min(100, 50 - net_score)
-        else:
-            direction = "neutral"
-            confidence = 50 - abs(net_score) / 2
-
-        # Recommendation based on direction and option type
-        if direction == "bullish":
-            if option_type == "call":
-                alignment = "aligned"
-                recommendation = "✓ Bullish bias supports this CALL"
-            else:
-                alignment = "opposed"
-                recommendation = "⚠ Bullish bias opposes this PUT"
-        elif direction == "bearish":
-            if option_type == "call":
-                alignment = "opposed"
-                recommendation = "⚠ Bearish bias opposes this CALL"
-            else:
-                alignment = "aligned"
-                recommendation = "✓ Bearish bias supports this PUT"
-        else:
-            alignment = "neutral"
-            recommendation = f"↔ Neutral bias - {option_type.upper()} not strongly favored or opposed"
-
-        return {
-            "direction": direction,
-            "confidence": round(confidence, 1),
-            "alignment": alignment,
-            "recommendation": recommendation,
-            "signals": signals,
-            "relevantMetrics": relevant_metrics,
-            "scores": {
-                "bullish": round(bullish_score, 1),
-                "bearish": round(bearish_score, 1),
-                "net": round(net_score, 1),
-            }
-        }
+        return signals, relevant_metrics
 
-    def calculate_days_to_expiration(self, expiration_date: Any) -> int:
-        """Calculate days to expiration."""
+    def calculate_days_to_expiration(self, expiration_date: Any, *, now: datetime | None = None) -> int:
+        """Calculate days to expiration, measured from ``now`` when given."""
 
         try:
-            exp_date = pd.to_datetime(expiration_date)
-            days = (exp_date - datetime.now()).days
+            exp_date = _parse_expiration(expiration_date)
+            # Expirations are naive local dates; compare against local wall-clock time.
+            reference = now.astimezone().replace(tzinfo=None) if now is not None else datetime.now()
+            days = (exp_date - reference).days
             return max(int(days), 0)
         except Exception:
             return 30
 
-    def calculate_returns_analysis(self, option: pd.Series) -> tuple[List[Dict[str, Any]], Dict[str, float]]:
+    def _option_days_to_expiration(self, option: OptionRow) -> int:
+        """Days to expiration for a contract, reusing the pre-scored ``_dte`` column when present."""
+
+        dte = option.get("_dte")
+        if dte is not None:
+            return int(dte)
+        return self.calculate_days_to_expiration(option["expiration"])
+
+    def calculate_returns_analysis(self, option: OptionRow) -> tuple[List[Dict[str, Any]], Dict[str, float]]:
         """Return ROI scenarios (in percent) and supporting metrics.
 
         Uses realistic price move expectations based on:
@@ -1932,7 +2276,9 @@ class SmartOptionsScanner:
         - Implied volatility (IV)
         - Historical typical moves
         """
-        import math
+        if "_returns_analysis" in option:
+            # Already evaluated for the whole candidate set by _prescore_contracts.
+            return option["_returns_analysis"]
 
         stock_price = float(option["stockPrice"])
         strike = float(option["strike"])
@@ -1946,8 +2292,8 @@ class SmartOptionsScanner:
             breakeven_move_pct = ((stock_price - breakeven_price) / max(stock_price, 0.01)) * 100
 
         # Calculate realistic expected move based on DTE and IV
-        dte = self.calculate_days_to_expiration(option["expiration"])
-        iv = float(option["impliedVolatility"]) if pd.notna(option["impliedVolatility"]) else 0.30
+        dte = self._option_days_to_expiration(option)
+        iv = _model_iv(option)
 
         # Expected move formula: IV * sqrt(DTE/365)
         # This gives us the 1 standard deviation expected move
@@ -2039,22 +2385,19 @@ class SmartOptionsScanner:
             "move": moves[0],
         }
 
+        # The fixed small-move steps can straddle the SD-based moves, so sort the
+        # scenarios once and binary-search for the move nearest each target.
+        ordered_metrics = sorted(scenario_metrics, key=lambda item: item["move"])
+        ordered_moves = [item["move"] for item in ordered_metrics]
+
         # Use 1 standard deviation move as the "realistic target" instead of arbitrary 10%
         # This is statistically what we'd expect ~68% of the time
         one_sd_target = expected_move_1sd if option["type"] == "call" else -expected_move_1sd
-        one_sd_move = min(
-            scenario_metrics,
-            key=lambda item: abs(item["move"] - one_sd_target),
-            default={"roi_percent": 0.0, "net_profit": 0.0}
-        ) if scenario_metrics else {"roi_percent": 0.0, "net_profit": 0.0}
+        one_sd_move = _nearest_scenario(ordered_moves, ordered_metrics, one_sd_target)
 
         # Use 2 standard deviation move as the "optimistic scenario" (~95% probability range)
         two_sd_target = expected_move_1sd * 2 if option["type"] == "call" else -expected_move_1sd * 2
-        two_sd_move = min(
-            scenario_metrics,
-            key=lambda item: abs(item["move"] - two_sd_target),
-            default={"roi_percent": 0.0, "net_profit": 0.0}
-        ) if scenario_metrics else {"roi_percent": 0.0, "net_profit": 0.0}
+        two_sd_move = _nearest_scenario(ordered_moves, ordered_metrics, two_sd_target)
 
         metrics = {
             "costBasis": cost_basis,
@@ -2083,7 +2426,7 @@ class SmartOptionsScanner:
 
     def _calculate_position_sizing(
         self,
-        option: pd.Series,
+        option: OptionRow,
         metrics: Dict[str, Any],
         probability_percent: float,
         expected_roi_percent: float,
@@ -2332,6 +2675,7 @@ class SmartOptionsScanner:
         """Execute the scan and package results for consumers."""
 
         print("🔍 Starting smart options scan...", file=sys.stderr)
+        scan_now = datetime.now(timezone.utc)
         symbols = self._next_symbol_batch()
         print(f"📍 About to fetch options data for {len(symbols)} symbols: {symbols[:5]}...", file=sys.stderr)
         options_data = self.get_current_options_data(symbols, force_refresh=force_refresh)
@@ -2347,7 +2691,7 @@ class SmartOptionsScanner:
         if options_data is None or options_data.empty:
             self.relaxed_scan_info = None
             metadata = {
-                "fetchedAt": datetime.now(timezone.utc).isoformat(),
+                "fetchedAt": scan_now.isoformat(),
                 "symbolCount": 0,
                 "totalOptions": 0,
                 "totalEvaluated": 0,
@@ -2355,7 +2699,7 @@ class SmartOptionsScanner:
                 "requestedSymbols": list(symbols),
                 "source": "adapter",
                 "symbolLimit": self.symbol_limit,
-                "rotationState": dict(self.rotation_state or {}),
+                "rotationState": dict(self._rotation_state_raw),
             }
             self._apply_freshness_metadata(metadata)
             metadata["filterMode"] = filter_mode
@@ -2364,6 +2708,7 @@ class SmartOptionsScanner:
         opportunities = self.analyze_opportunities(
             options_data,
             allow_relaxed_fallback=allow_relaxed,
+            scan_now=scan_now,
         )
 
         # TEMPORARILY DISABLED budget filtering to diagnose 0 results
@@ -2378,23 +2723,21 @@ class SmartOptionsScanner:
 
         print(f"✅ Found {len(opportunities)} high-scoring opportunities", file=sys.stderr)
 
-        chains_by_symbol = {
-            symbol: group.to_dict(orient="records")
-            for symbol, group in options_data.groupby("symbol")
-        }
+        # Sorted, NaN-free symbol list (the order the former per-symbol groupby produced).
+        scanned_symbols = sorted(options_data["symbol"].dropna().unique().tolist())
 
         metadata = {
-            "fetchedAt": datetime.now(timezone.utc).isoformat(),
-            "symbolCount": len(chains_by_symbol),
+            "fetchedAt": scan_now.isoformat(),
+            "symbolCount": len(scanned_symbols),
             "totalOptions": int(len(options_data)),
             "totalEvaluated": int(len(options_data)),
-            "symbols": list(chains_by_symbol.keys()),
+            "symbols": scanned_symbols,
             "requestedSymbols": list(symbols),
             # Removed chainsBySymbol - causes 10MB+ JSON responses that overflow stdout buffer
             "source": "adapter",
             "symbolLimit": self.symbol_limit,
             "opportunityCount": len(opportunities),
-            "rotationState": dict(self.rotation_state or {}),
+            "rotationState": dict(self._rotation_state_raw),
         }
         self._apply_freshness_metadata(metadata)
         metadata["filterMode"] = filter_mode
@@ -2422,8 +2765,20 @@ def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser.add_argument(
         "--json-indent",
         type=int,
-        default=None,
-        help="Pretty print JSON with the provided indentation",
+        default=0,
+        help="Pretty print JSON with the provided indentation (0 for compact; orjson always uses 2)",
+    )
+    parser.add_argument(
+        "--compact",
+        dest="json_indent",
+        action="store_const",
+        const=0,
+        help="Emit compact JSON (same as --json-indent 0)",
+    )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Emit one JSON object per line per opportunity followed by a __meta__ line",
     )
     parser.add_argument(
         "--strict-only",
@@ -2448,14 +2803,28 @@ def run_scan(
     force_refresh: bool = False,
     batch_builder: UniverseBuilder | None = None,
     allow_relaxed_fallback: bool | None = None,
+    shared_cache: bool = True,
+    fetch_workers: int | None = None,
 ) -> ScanResult:
-    scanner = SmartOptionsScanner(max_symbols=max_symbols, batch_builder=batch_builder)
+    scanner = SmartOptionsScanner(
+        max_symbols=max_symbols,
+        batch_builder=batch_builder,
+        shared_cache=shared_cache,
+        fetch_workers=fetch_workers,
+    )
     return scanner.scan_for_opportunities(
         force_refresh=force_refresh,
         allow_relaxed_fallback=allow_relaxed_fallback,
     )
 
 
+# Upper bound on concurrently running deep-scan batches.
+DEEP_SCAN_MAX_WORKERS = 8
+# Upper bound on symbol fetches in flight across all deep-scan batches; a single
+# scan's fetcher uses the same number of workers on its own.
+DEEP_SCAN_MAX_FETCH_WORKERS = 20
+
+
 def run_deep_scan(
     batch_count: int,
     max_symbols: Optional[int] = None,
@@ -2475,13 +2844,42 @@ def run_deep_scan(
     aggregated_opportunities: List[Dict[str, Any]] = []
     batch_metadata: List[Mapping[str, Any]] = []
 
-    for index in range(batch_count):
-        result = run_scan(
-            max_symbols,
-            force_refresh=True,
-            batch_builder=batch_builder,
-            allow_relaxed_fallback=allow_relaxed_fallback,
-        )
+    # Batches are dominated by network I/O, so run them concurrently. Symbol selection
+    # stays serialized: each call advances the persisted rotation the next one reads.
+    # Price history is fetched with yf.download from every batch at once, which needs
+    # the per-call download state of yfinance >= 1.4 (see requirements.txt).
+    builder = batch_builder or build_scan_universe
+    builder_lock = threading.Lock()
+
+    def serialized_builder(
+        builder_settings: AppSettings,
+        batch_size: int,
+        state: Optional[Mapping[str, Any]],
+    ) -> Tuple[List[str], Dict[str, Any]]:
+        with builder_lock:
+            return builder(builder_settings, batch_size, state)
+
+    # Concurrent batches split the fetch budget between them, and skip the shared cache
+    # file: they would overwrite each other's snapshot and fall back to another batch's chains.
+    batch_workers = min(batch_count, DEEP_SCAN_MAX_WORKERS)
+    fetch_workers = max(1, DEEP_SCAN_MAX_FETCH_WORKERS // batch_workers)
+
+    with ThreadPoolExecutor(max_workers=batch_workers) as executor:
+        futures = [
+            executor.submit(
+                run_scan,
+                max_symbols,
+                force_refresh=True,
+                batch_builder=serialized_builder,
+                allow_relaxed_fallback=allow_relaxed_fallback,
+                shared_cache=False,
+                fetch_workers=fetch_workers,
+            )
+            for _ in range(batch_count)
+        ]
+        results = [future.result() for future in futures]
+
+    for index, result in enumerate(results):
         aggregated_opportunities.extend(result.opportunities)
         batch_metadata.append(
             {
@@ -2500,26 +2898,13 @@ def run_deep_scan(
 
     aggregated_opportunities.sort(key=_sort_key, reverse=True)
 
-    unique_requested = []
-    seen_requested: set[str] = set()
-    for meta in batch_metadata:
-        for symbol in meta.get("requestedSymbols", []):
-            upper = str(symbol).upper()
-            if upper in seen_requested:
-                continue
-            seen_requested.add(upper)
-            unique_requested.append(upper)
-
-    # Collect unique symbols from all batches
-    unique_symbols = []
-    seen_symbols: set[str] = set()
-    for meta in batch_metadata:
-        for symbol in meta.get("symbols", []):
-            upper = str(symbol).upper()
-            if upper in seen_symbols:
-                continue
-            seen_symbols.add(upper)
-            unique_symbols.append(upper)
+    # Collect unique symbols from all batches, keeping first-seen order
+    unique_requested = list(
+        dict.fromkeys(str(symbol).upper() for meta in batch_metadata for symbol in meta.get("requestedSymbols", []))
+    )
+    unique_symbols = list(
+        dict.fromkeys(str(symbol).upper() for meta in batch_metadata for symbol in meta.get("symbols", []))
+    )
 
     metadata: Dict[str, Any] = {
         "fetchedAt": datetime.now(timezone.utc).isoformat(),
@@ -2548,7 +2933,12 @@ def cli(argv: Optional[Sequence[str]] = None) -> None:
     symbol_limit = _normalize_symbol_limit(args.max_symbols)
     allow_relaxed = None if args.strict_only is None else not args.strict_only
     result = run_scan(symbol_limit, allow_relaxed_fallback=allow_relaxed)
-    print(result.to_json(indent=args.json_indent))
+    sys.stdout.flush()
+    if args.ndjson:
+        result.dump_lines(sys.stdout.buffer)
+    else:
+        result.dump(sys.stdout.buffer, indent=args.json_indent)
+    sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":
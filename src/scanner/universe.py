@@ -2,19 +2,31 @@
 
 from __future__ import annotations
 
+import gzip
 import json
+import os
 import random
+import tempfile
 from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Tuple
 
-from scripts.bulk_options_fetcher import BulkOptionsFetcher
+from scripts.bulk_options_fetcher import build_priority_symbols
 from src.config.loader import AppSettings
+from src.models.serialization import dumps_json_bytes, loads_json
 
-DEFAULT_STATE_FILE = Path("data/scan_universe_state.json")
+DEFAULT_STATE_FILE = Path("data/scan_universe_state.json.gz")
+# Favour speed over ratio: the state is rewritten on every scan.
+STATE_COMPRESSION_LEVEL = 1
 
+# Last state read or written per file, keyed by path and tagged with the file's
+# (mtime_ns, size) so edits made by other processes are still picked up.
+_STATE_CACHE: Dict[Path, Tuple[Tuple[int, int], Mapping[str, Any]]] = {}
 
-@dataclass
+
+@dataclass(slots=True)
 class UniverseRotationState:
     """Serializable container describing the scan universe rotation state."""
 
@@ -59,21 +71,76 @@ def _state_file_from_settings(settings: AppSettings) -> Path:
     return DEFAULT_STATE_FILE
 
 
+def _file_signature(path: Path) -> Tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
 def _load_persisted_state(path: Path) -> Mapping[str, Any]:
+    signature = _file_signature(path)
+    cached = _STATE_CACHE.get(path)
+    if cached is not None and signature is not None and cached[0] == signature:
+        return cached[1]
+    state = _read_state_file(path)
+    if signature is None or not state:
+        return state
+    frozen = _freeze_state(state)
+    _STATE_CACHE[path] = (signature, frozen)
+    return frozen
+
+
+def _freeze_state(state: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Read-only copy of ``state`` safe to share through the cache."""
+
+    return MappingProxyType(
+        {key: tuple(value) if isinstance(value, list) else value for key, value in state.items()}
+    )
+
+
+def _read_state_file(path: Path) -> Mapping[str, Any]:
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        raw = path.read_bytes()
     except FileNotFoundError:
-        return {}
-    except json.JSONDecodeError:
+        if path.suffix != ".gz":
+            return {}
+        # Fall back to the uncompressed ``.json`` file written by older releases.
+        try:
+            raw = path.with_suffix("").read_bytes()
+        except FileNotFoundError:
+            return {}
+    try:
+        if raw[:2] == b"\x1f\x8b":
+            raw = gzip.decompress(raw)
+        return loads_json(raw)
+    except (OSError, EOFError, json.JSONDecodeError):
         return {}
 
 
 def _persist_state(path: Path, state: Mapping[str, Any]) -> None:
     if path.name != ":memory:":
         path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(dict(state), handle, indent=2)
+    payload = dumps_json_bytes(state if isinstance(state, dict) else dict(state))
+    if path.suffix == ".gz":
+        payload = gzip.compress(payload, compresslevel=STATE_COMPRESSION_LEVEL)
+    # Write to a sibling temp file and swap it in so readers never see a partial file.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    signature = _file_signature(path)
+    if signature is not None:
+        _STATE_CACHE[path] = (signature, _freeze_state(state))
 
 
 def _normalise_universe(symbols: Iterable[str]) -> List[str]:
@@ -94,8 +161,10 @@ def _prepare_round_robin(state: UniverseRotationState, universe: List[str]) -> U
         state.position = 0
         return state
 
-    filtered = [symbol for symbol in state.order if symbol in universe]
-    additions = [symbol for symbol in universe if symbol not in filtered]
+    universe_set = frozenset(universe)
+    filtered = [symbol for symbol in state.order if symbol in universe_set]
+    kept = frozenset(filtered)
+    additions = [symbol for symbol in universe if symbol not in kept]
     state.order = filtered + additions
     if state.position >= len(state.order):
         state.position = 0
@@ -103,14 +172,12 @@ def _prepare_round_robin(state: UniverseRotationState, universe: List[str]) -> U
 
 
 def _prepare_random(state: UniverseRotationState, universe: List[str]) -> UniverseRotationState:
-    rng = random.Random(state.seed)
-    if not state.order or set(state.order) != set(universe):
-        state.order = list(universe)
-        rng.shuffle(state.order)
+    if not state.order or frozenset(state.order) != frozenset(universe):
+        # Seed first so a single generator produces an order reproducible from state.seed.
         if state.seed is None:
             state.seed = random.randint(1, 1_000_000)
-            rng = random.Random(state.seed)
-            rng.shuffle(state.order)
+        state.order = list(universe)
+        random.Random(state.seed).shuffle(state.order)
         state.position = 0
         return state
 
@@ -137,7 +204,8 @@ def _next_batch(order: List[str], position: int, batch_size: int) -> Tuple[List[
         new_position = end % total
     else:
         wrap = end % total
-        batch = order[start:] + order[:wrap]
+        batch = order[start:]
+        batch.extend(islice(order, wrap))
         new_position = wrap
     return batch, new_position
 
@@ -159,14 +227,14 @@ def build_scan_universe(
     if state.mode not in {"round_robin", "random"}:
         state.mode = "round_robin"
 
-    fetcher = BulkOptionsFetcher(settings)
-    universe = _normalise_universe(fetcher.priority_symbols)
+    universe = _normalise_universe(build_priority_symbols(settings))
 
     if not universe:
         state.order = []
         state.position = 0
-        _persist_state(state_path, state.to_dict())
-        return [], state.to_dict()
+        payload = state.to_dict()
+        _persist_state(state_path, payload)
+        return [], payload
 
     if state.mode == "random":
         state = _prepare_random(state, universe)
@@ -0,0 +1,416 @@
+"""Array implementations of the smart scanner's per-contract pricing math.
+
+The scalar methods on :class:`~src.scanner.service.SmartOptionsScanner`
+(``calculate_returns_analysis``, ``calculate_probability_score`` and
+``calculate_opportunity_score``) remain the reference implementation. The
+functions here evaluate the same formulas over whole columns so the scanner
+can score every liquid contract at once and only build payloads for the
+handful that pass its quality gates.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+from scipy.special import ndtr
+
+from src.math.jit import NUMBA_AVAILABLE, njit
+
+try:  # pragma: no cover - exercised when numexpr is installed
+    import numexpr
+except ModuleNotFoundError:  # pragma: no cover - executed in minimal environments
+    numexpr = None
+
+# Number of price-move scenarios evaluated for every contract.
+SCENARIO_COUNT = 9
+
+# Risk-free rate assumed by the scanner's Black-Scholes Greeks.
+RISK_FREE_RATE = 0.045
+
+_SQRT_2 = math.sqrt(2.0)
+_SQRT_2PI = math.sqrt(2.0 * math.pi)
+
+
+_LIQUIDITY_EXPRESSION = (
+    "(volume > min_volume) & (open_interest > min_open_interest) & (last_price > min_last_price)"
+    " & (bid > 0) & (ask > 0)"
+)
+
+
+def liquidity_mask(
+    volume: np.ndarray,
+    open_interest: np.ndarray,
+    last_price: np.ndarray,
+    bid: np.ndarray,
+    ask: np.ndarray,
+    *,
+    min_volume: float,
+    min_open_interest: float,
+    min_last_price: float,
+) -> np.ndarray:
+    """Boolean mask of two-sided contracts above the volume, open-interest and price floors.
+
+    Evaluated as a single fused numexpr kernel when numexpr is installed.
+    """
+
+    if numexpr is not None:
+        return numexpr.evaluate(
+            _LIQUIDITY_EXPRESSION,
+            local_dict={
+                "volume": volume,
+                "open_interest": open_interest,
+                "last_price": last_price,
+                "bid": bid,
+                "ask": ask,
+                "min_volume": min_volume,
+                "min_open_interest": min_open_interest,
+                "min_last_price": min_last_price,
+            },
+        )
+    return (
+        (volume > min_volume)
+        & (open_interest > min_open_interest)
+        & (last_price > min_last_price)
+        & (bid > 0)
+        & (ask > 0)
+    )
+
+
+@dataclass
+class ReturnsMetrics:
+    """Column-wise counterpart of the metrics dict from ``calculate_returns_analysis``."""
+
+    cost_basis: np.ndarray
+    breakeven_price: np.ndarray
+    breakeven_move_percent: np.ndarray
+    expected_move_1sd: np.ndarray
+    dte: np.ndarray
+    moves: np.ndarray
+    roi_percent: np.ndarray
+    net_profit: np.ndarray
+    best_index: np.ndarray
+    one_sd_index: np.ndarray
+    two_sd_index: np.ndarray
+
+    def _pick(self, values: np.ndarray, index: np.ndarray) -> np.ndarray:
+        return np.take_along_axis(values, index[:, None], axis=1)[:, 0]
+
+    @property
+    def best_roi_percent(self) -> np.ndarray:
+        return self._pick(self.roi_percent, self.best_index)
+
+    @property
+    def expected_move_roi_percent(self) -> np.ndarray:
+        return self._pick(self.roi_percent, self.one_sd_index)
+
+    @property
+    def expected_move_net_profit(self) -> np.ndarray:
+        return self._pick(self.net_profit, self.one_sd_index)
+
+    def analysis(self, row: int) -> Tuple[List[Dict[str, Any]], Dict[str, float]]:
+        """Return ``calculate_returns_analysis``'s ``(scenarios, metrics)`` for one contract."""
+
+        moves = self.moves[row].tolist()
+        roi_percent = self.roi_percent[row].tolist()
+        net_profit = self.net_profit[row].tolist()
+
+        scenarios: List[Dict[str, Any]] = []
+        for move, roi in zip(moves, roi_percent):
+            move_pct = move * 100
+            move_str = f"{move_pct:+.1f}%" if move != 0 else "0%"
+            scenarios.append({"move": move_str, "movePct": move_pct, "return": roi})
+
+        best = int(self.best_index[row])
+        one_sd = int(self.one_sd_index[row])
+        two_sd = int(self.two_sd_index[row])
+        expected_move_1sd = float(self.expected_move_1sd[row])
+
+        metrics = {
+            "costBasis": float(self.cost_basis[row]),
+            "breakevenMovePercent": float(self.breakeven_move_percent[row]),
+            "breakevenPrice": float(self.breakeven_price[row]),
+            "bestRoiPercent": roi_percent[best],
+            "bestNetProfit": net_profit[best],
+            "bestMovePercent": moves[best] * 100,
+            "expectedMoveRoiPercent": roi_percent[one_sd],
+            "expectedMoveNetProfit": net_profit[one_sd],
+            "optimisticMoveRoiPercent": roi_percent[two_sd],
+            "optimisticMoveNetProfit": net_profit[two_sd],
+            "tenMoveRoiPercent": roi_percent[one_sd],
+            "tenMoveNetProfit": net_profit[one_sd],
+            "fifteenMoveRoiPercent": roi_percent[two_sd],
+            "fifteenMoveNetProfit": net_profit[two_sd],
+            "expectedMove1SD": expected_move_1sd * 100,
+            "expectedMove2SD": expected_move_1sd * 2 * 100,
+            "dteUsedForCalculation": int(self.dte[row]),
+        }
+        return scenarios, metrics
+
+
+def scenario_moves(expected_move_1sd: np.ndarray, dte: np.ndarray) -> np.ndarray:
+    """Return the ``(n, SCENARIO_COUNT)`` matrix of fractional price moves per contract."""
+
+    expected = np.asarray(expected_move_1sd, dtype=np.float64)[:, None]
+    dte = np.asarray(dte)
+
+    max_reasonable_move = np.select(
+        [dte <= 3, dte <= 7, dte <= 30],
+        [0.05, 0.10, 0.15],
+        default=0.20,
+    )[:, None]
+    short_dated = (dte <= 3)[:, None]
+    multipliers = np.where(short_dated, [1.5, 1.0, 0.5], [2.0, 1.5, 1.0])
+    small_step = np.select([dte <= 3, dte <= 7], [0.01, 0.02], default=0.03)[:, None]
+
+    downside = np.maximum(-max_reasonable_move, -expected * multipliers)
+    upside = np.minimum(max_reasonable_move, expected * multipliers[:, ::-1])
+    flat = np.zeros_like(small_step)
+    return np.hstack([downside, -small_step, flat, small_step, upside])
+
+
+def _nearest_move_index(moves: np.ndarray, target: np.ndarray) -> np.ndarray:
+    # Ties go to the lower move, matching the scalar bisect in ``_nearest_scenario``.
+    distance = np.abs(moves - target[:, None])
+    nearest = distance == distance.min(axis=1, keepdims=True)
+    return np.argmin(np.where(nearest, moves, np.inf), axis=1)
+
+
+def returns_metrics(
+    stock_price: np.ndarray,
+    strike: np.ndarray,
+    premium: np.ndarray,
+    iv: np.ndarray,
+    dte: np.ndarray,
+    is_call: np.ndarray,
+) -> ReturnsMetrics:
+    """Evaluate every ROI scenario for every contract in one broadcast pass."""
+
+    stock_price = np.asarray(stock_price, dtype=np.float64)
+    strike = np.asarray(strike, dtype=np.float64)
+    premium = np.asarray(premium, dtype=np.float64)
+    iv = np.asarray(iv, dtype=np.float64)
+    dte = np.asarray(dte)
+    is_call = np.asarray(is_call, dtype=bool)
+
+    cost_basis = premium * 100
+    breakeven_price = np.where(is_call, strike + premium, strike - premium)
+    price_floor = np.maximum(stock_price, 0.01)
+    breakeven_move_percent = np.where(
+        is_call,
+        ((breakeven_price - stock_price) / price_floor) * 100,
+        ((stock_price - breakeven_price) / price_floor) * 100,
+    )
+
+    expected_move_1sd = iv * np.sqrt(np.maximum(dte, 1) / 365.0)
+    moves = scenario_moves(expected_move_1sd, dte)
+
+    target_price = stock_price[:, None] * (1 + moves)
+    intrinsic = np.where(
+        is_call[:, None],
+        np.maximum(0.0, target_price - strike[:, None]),
+        np.maximum(0.0, strike[:, None] - target_price),
+    )
+    net_profit = intrinsic * 100 - cost_basis[:, None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        roi_percent = np.where(
+            cost_basis[:, None] != 0,
+            (net_profit / cost_basis[:, None]) * 100,
+            0.0,
+        )
+
+    direction = np.where(is_call, 1.0, -1.0)
+    one_sd_target = expected_move_1sd * direction
+    two_sd_target = expected_move_1sd * 2 * direction
+
+    return ReturnsMetrics(
+        cost_basis=cost_basis,
+        breakeven_price=breakeven_price,
+        breakeven_move_percent=breakeven_move_percent,
+        expected_move_1sd=expected_move_1sd,
+        dte=dte,
+        moves=moves,
+        roi_percent=roi_percent,
+        net_profit=net_profit,
+        best_index=np.argmax(roi_percent, axis=1),
+        one_sd_index=_nearest_move_index(moves, one_sd_target),
+        two_sd_index=_nearest_move_index(moves, two_sd_target),
+    )
+
+
+@njit(cache=True)
+def _pop_kernel(breakeven_move_percent, iv, dte, out):  # pragma: no cover - compiled
+    for i in range(out.shape[0]):
+        if dte[i] <= 0:
+            out[i] = 0.0
+            continue
+
+        expected_move_pct = iv[i] / math.sqrt(252) * math.sqrt(dte[i]) * 100
+        z_score = 0.0 if expected_move_pct == 0 else abs(breakeven_move_percent[i]) / expected_move_pct
+        probability = 50.0 * math.erfc(z_score / _SQRT_2)
+        if probability < 1.0:
+            probability = 1.0
+        elif probability > 99.0:
+            probability = 99.0
+        out[i] = probability
+
+
+def probability_scores(breakeven_move_percent: np.ndarray, iv: np.ndarray, dte: np.ndarray) -> np.ndarray:
+    """Probability (1-99%) that the underlying clears breakeven, per contract."""
+
+    breakeven_move_percent = np.ascontiguousarray(breakeven_move_percent, dtype=np.float64)
+    iv = np.ascontiguousarray(iv, dtype=np.float64)
+    dte = np.ascontiguousarray(dte, dtype=np.float64)
+
+    if NUMBA_AVAILABLE:
+        scores = np.empty_like(breakeven_move_percent)
+        _pop_kernel(breakeven_move_percent, iv, dte, scores)
+        return scores
+
+    daily_vol = iv / np.sqrt(252)
+    expected_move_pct = daily_vol * np.sqrt(np.maximum(dte, 0)) * 100
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z_score = np.where(
+            expected_move_pct == 0,
+            0.0,
+            np.abs(breakeven_move_percent) / expected_move_pct,
+        )
+    scores = np.clip(ndtr(-z_score) * 100, 1.0, 99.0)
+    return np.where(dte <= 0, 0.0, scores)
+
+
+def opportunity_scores(
+    volume: np.ndarray,
+    open_interest: np.ndarray,
+    bid: np.ndarray,
+    ask: np.ndarray,
+    last_price: np.ndarray,
+    implied_volatility: np.ndarray,
+    metrics: ReturnsMetrics,
+    probability_score: np.ndarray,
+) -> np.ndarray:
+    """Column-wise ``calculate_opportunity_score``; ``implied_volatility`` is the raw (possibly NaN) column."""
+
+    volume_ratio = volume / np.maximum(open_interest, 1)
+    spread_pct = (ask - bid) / np.maximum(last_price, 0.01)
+
+    score = np.zeros(len(volume), dtype=np.float64)
+    score += np.select(
+        [volume_ratio > 4, volume_ratio > 3, volume_ratio > 2, volume_ratio > 1.5],
+        [18, 15, 12, 8],
+        default=0,
+    )
+    score += np.select([spread_pct < 0.05, spread_pct < 0.1, spread_pct < 0.2], [18, 12, 6], default=0)
+
+    expected_roi = np.maximum(0.0, metrics.expected_move_roi_percent)
+    score += np.minimum(25, expected_roi / 4)
+    score += probability_score * 0.35
+
+    breakeven_move = np.abs(metrics.breakeven_move_percent)
+    cost_basis = metrics.cost_basis
+    with np.errstate(divide="ignore", invalid="ignore"):
+        payoff_ratio = np.where(cost_basis > 0, metrics.expected_move_net_profit / cost_basis, 0.0)
+
+    breakeven_factor = np.select([breakeven_move < 2, breakeven_move < 4, breakeven_move < 6], [1.0, 0.7, 0.4], default=0.0)
+    payoff_multiplier = np.select([payoff_ratio >= 0.5, payoff_ratio >= 0.3, payoff_ratio >= 0.2], [1.0, 0.7, 0.5], default=0.3)
+    score += 10 * breakeven_factor * payoff_multiplier
+
+    iv = np.asarray(implied_volatility, dtype=np.float64)
+    score += np.select([(iv >= 0.2) & (iv <= 0.6), iv > 0.8], [5, -3], default=0)
+
+    contract_cost = last_price * 100
+    score += np.select(
+        [contract_cost < 200, contract_cost < 500, contract_cost < 1000, contract_cost < 2000, contract_cost < 5000],
+        [9, 7, 5, 3, 1],
+        default=0,
+    )
+
+    penalty = np.select([payoff_ratio < 0.1, payoff_ratio < 0.2, payoff_ratio < 0.3], [8, 5, 3], default=0)
+    score -= np.where(cost_basis > 0, penalty, 0)
+
+    return np.clip(score, 0.0, 100.0)
+
+
+@njit(cache=True)
+def _greeks_kernel(stock_price, strike, iv, years, rate, is_call, out_delta, out_gamma, out_theta, out_vega):  # pragma: no cover - compiled
+    for i in range(stock_price.shape[0]):
+        spot = stock_price[i]
+        strike_price = strike[i]
+        sigma = iv[i]
+        if not (spot > 0.0 and strike_price > 0.0 and sigma > 0.0):
+            out_delta[i] = 0.0
+            out_gamma[i] = 0.0
+            out_theta[i] = 0.0
+            out_vega[i] = 0.0
+            continue
+
+        sqrt_t = math.sqrt(years[i])
+        d1 = (math.log(spot / strike_price) + (rate + 0.5 * sigma ** 2) * years[i]) / (sigma * sqrt_t)
+        d2 = d1 - sigma * sqrt_t
+        pdf_d1 = math.exp(-d1 * d1 / 2.0) / _SQRT_2PI
+        cdf_d1 = 0.5 * math.erfc(-d1 / _SQRT_2)
+        decay = -(spot * pdf_d1 * sigma) / (2 * sqrt_t)
+        carry = rate * strike_price * math.exp(-rate * years[i])
+
+        if is_call[i]:
+            out_delta[i] = cdf_d1
+            out_theta[i] = (decay - carry * 0.5 * math.erfc(-d2 / _SQRT_2)) / 365
+        else:
+            out_delta[i] = cdf_d1 - 1
+            out_theta[i] = (decay + carry * 0.5 * math.erfc(d2 / _SQRT_2)) / 365
+        out_gamma[i] = pdf_d1 / (spot * sigma * sqrt_t)
+        out_vega[i] = spot * pdf_d1 * sqrt_t / 100
+
+
+def _greeks_numpy(stock_price, strike, iv, years, rate, is_call) -> Dict[str, np.ndarray]:
+    valid = (stock_price > 0) & (strike > 0) & (iv > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sqrt_t = np.sqrt(years)
+        d1 = (np.log(stock_price / strike) + (rate + 0.5 * iv ** 2) * years) / (iv * sqrt_t)
+        d2 = d1 - iv * sqrt_t
+        pdf_d1 = np.exp(-d1 ** 2 / 2.0) / _SQRT_2PI
+        cdf_d1 = ndtr(d1)
+        decay = -(stock_price * pdf_d1 * iv) / (2 * sqrt_t)
+        carry = rate * strike * np.exp(-rate * years)
+
+        greeks = {
+            "delta": np.where(is_call, cdf_d1, cdf_d1 - 1),
+            "gamma": pdf_d1 / (stock_price * iv * sqrt_t),
+            "theta": np.where(is_call, decay - carry * ndtr(d2), decay + carry * ndtr(-d2)) / 365,
+            "vega": stock_price * pdf_d1 * sqrt_t / 100,
+        }
+    return {name: np.where(valid, values, 0.0) for name, values in greeks.items()}
+
+
+def black_scholes_greeks(
+    stock_price: np.ndarray,
+    strike: np.ndarray,
+    iv: np.ndarray,
+    dte: np.ndarray,
+    is_call: np.ndarray,
+    *,
+    rate: float = RISK_FREE_RATE,
+) -> Dict[str, np.ndarray]:
+    """Column-wise ``calculate_greeks_approximation`` (theta per day, vega per 1% IV).
+
+    Uses a compiled kernel when Numba is installed and NumPy otherwise.
+    Contracts with a non-positive price, strike or IV get zero Greeks.
+    """
+
+    stock_price = np.ascontiguousarray(stock_price, dtype=np.float64)
+    strike = np.ascontiguousarray(strike, dtype=np.float64)
+    iv = np.ascontiguousarray(iv, dtype=np.float64)
+    years = np.maximum(np.asarray(dte, dtype=np.float64), 1.0) / 365.0
+    is_call = np.ascontiguousarray(is_call, dtype=np.bool_)
+
+    if not NUMBA_AVAILABLE:
+        return _greeks_numpy(stock_price, strike, iv, years, rate, is_call)
+
+    greeks = {name: np.empty_like(stock_price) for name in ("delta", "gamma", "theta", "vega")}
+    _greeks_kernel(
+        stock_price, strike, iv, years, rate, is_call,
+        greeks["delta"], greeks["gamma"], greeks["theta"], greeks["vega"],
+    )
+    return greeks
@@ -1,19 +1,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Protocol, Tuple
+from typing import Dict, Iterable, List, Mapping, Protocol, Tuple
+
+import numpy as np
+import pandas as pd
 
 from src.models.option import OptionContract, OptionGreeks
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScoreContext:
-    """Information passed to each scorer."""
+    """Information passed to each scorer.
+
+    ``market_data`` is the engine's per-contract copy; scorers may add derived
+    values to it (``RiskRewardScorer`` caches ``projected_returns``).
+    """
 
     contract: OptionContract
     greeks: OptionGreeks
     market_data: Dict[str, float]
-    config: Dict[str, object]
+    config: Mapping[str, object]
 
     def get_weight(self, scorer_key: str, default: float) -> float:
         return float(self.config.get("weights", {}).get(scorer_key, default))
@@ -28,3 +35,61 @@ class OptionScorer(Protocol):
     def score(self, context: ScoreContext) -> Tuple[float, List[str], List[str]]:
         """Return raw score, reasoning strings, and tags."""
 
+    def score_vector(self, frame: pd.DataFrame) -> np.ndarray:
+        """Return raw scores for every row of a batch frame (see :func:`build_batch_frame`)."""
+
+
+def build_batch_frame(
+    contracts: Iterable[OptionContract],
+    greeks: Iterable[OptionGreeks],
+    market_data: Iterable[Mapping[str, object] | None],
+) -> pd.DataFrame:
+    """Flatten contracts, Greeks and market data into one row per contract.
+
+    Contract fields use their aliases (``openInterest``, ``stockPrice`` ...),
+    Greeks keep their names and nested market data is flattened with
+    :func:`pandas.json_normalize`, e.g. ``iv_anomaly.zscore``.
+    """
+
+    rows = [
+        {**contract.model_dump(by_alias=True, exclude={"greeks", "raw"}), **greek.model_dump()}
+        for contract, greek in zip(contracts, greeks)
+    ]
+    base = pd.DataFrame(rows)
+    extras = pd.json_normalize([dict(item or {}) for item in market_data])
+    if len(extras) != len(base):
+        raise ValueError("contracts, greeks and market_data must have the same length")
+    return pd.concat([base, extras.drop(columns=base.columns.intersection(extras.columns))], axis=1)
+
+
+def frame_column(frame: pd.DataFrame, name: str, default: float = np.nan) -> np.ndarray:
+    """Return ``frame[name]`` as floats with missing values replaced by ``default``."""
+
+    if name not in frame.columns:
+        return np.full(len(frame), default, dtype=float)
+    values = pd.to_numeric(frame[name], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    if not np.isnan(default):
+        values = np.where(np.isnan(values), default, values)
+    return values
+
+
+def frame_has_group(frame: pd.DataFrame, prefix: str) -> np.ndarray:
+    """Rows whose nested ``prefix`` mapping contributed at least one value."""
+
+    columns = [column for column in frame.columns if column.startswith(f"{prefix}.")]
+    if not columns:
+        return np.zeros(len(frame), dtype=bool)
+    return frame[columns].notna().any(axis=1).to_numpy()
+
+
+def frame_truthy(frame: pd.DataFrame, name: str) -> np.ndarray:
+    """Rows where ``frame[name]`` is truthy, treating missing values as false."""
+
+    if name not in frame.columns:
+        return np.zeros(len(frame), dtype=bool)
+    return np.fromiter(
+        (value is not None and value == value and bool(value) for value in frame[name]),
+        dtype=bool,
+        count=len(frame),
+    )
+
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping
 
 DEFAULT_SCORER_CONFIG: Dict[str, object] = {
     "enabled": [
@@ -26,27 +27,30 @@ DEFAULT_SCORER_CONFIG: Dict[str, object] = {
 }
 
 
-def merge_config(overrides: Dict[str, object] | None) -> Dict[str, object]:
+# Read-only view of the defaults. Engines built without overrides share it, so
+# nothing can mutate DEFAULT_SCORER_CONFIG through an engine's config.
+_FROZEN_DEFAULT: Mapping[str, object] = MappingProxyType(
+    {
+        "enabled": tuple(DEFAULT_SCORER_CONFIG["enabled"]),
+        "weights": MappingProxyType(dict(DEFAULT_SCORER_CONFIG["weights"])),
+        "score_bounds": MappingProxyType(dict(DEFAULT_SCORER_CONFIG["score_bounds"])),
+    }
+)
+
+
+def merge_config(overrides: Mapping[str, object] | None) -> Mapping[str, object]:
     if not overrides:
-        return dict(DEFAULT_SCORER_CONFIG)
-    merged = dict(DEFAULT_SCORER_CONFIG)
-    if "enabled" in merged:
-        merged["enabled"] = list(DEFAULT_SCORER_CONFIG.get("enabled", ()))
-    merged_weights = dict(DEFAULT_SCORER_CONFIG.get("weights", {}))
-    if "score_bounds" in merged:
-        merged["score_bounds"] = dict(DEFAULT_SCORER_CONFIG.get("score_bounds", {}))
+        return _FROZEN_DEFAULT
+    # Untouched sections stay as the shared read-only defaults; only overridden
+    # sections get fresh dicts.
+    merged: Dict[str, object] = dict(_FROZEN_DEFAULT)
     if "weights" in overrides:
-        merged_weights.update(overrides["weights"])
-    merged["weights"] = merged_weights
+        merged["weights"] = {**_FROZEN_DEFAULT["weights"], **overrides["weights"]}
     if "enabled" in overrides:
         merged["enabled"] = overrides["enabled"]
     if "score_bounds" in overrides:
-        merged["score_bounds"] = {
-            **DEFAULT_SCORER_CONFIG.get("score_bounds", {}),
-            **overrides["score_bounds"],
-        }
+        merged["score_bounds"] = {**_FROZEN_DEFAULT["score_bounds"], **overrides["score_bounds"]}
     for key, value in overrides.items():
         if key not in {"weights", "enabled", "score_bounds"}:
             merged[key] = value
     return merged
-
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from typing import Dict, List, Type
+from typing import Callable, Dict, List, Mapping, Set, Tuple, Type
+
+import numpy as np
+import pandas as pd
 
 from src.models.option import OptionContract, OptionGreeks, OptionScore, ScoringResult, ScoreBreakdown
 
-from .base import ScoreContext
+from .base import OptionScorer, ScoreContext
 from .config import merge_config
 from .event_catalyst import EventCatalystScorer
 from .gamma_squeeze import GammaSqueezeScorer
@@ -28,10 +31,26 @@ SCORER_REGISTRY = {
 class CompositeScoringEngine:
     """Aggregates scores from enabled scorers using configured weights."""
 
-    def __init__(self, config: Dict[str, object] | None = None):
+    def __init__(self, config: Mapping[str, object] | None = None):
         self.config = merge_config(config)
         enabled = self.config.get("enabled", list(SCORER_REGISTRY))
         self._scorers = [self._instantiate(key) for key in enabled if key in SCORER_REGISTRY]
+        # Weights and bounds are fixed for the engine's lifetime, so resolve them once
+        # instead of on every contract.
+        weights = self.config.get("weights", {})
+        self._scorer_weights: List[Tuple[OptionScorer, float]] = [
+            (scorer, float(weights.get(scorer.key, getattr(scorer, "default_weight", 1.0))))
+            for scorer in self._scorers
+        ]
+        # Bound score methods paired with their key and weight, so the per-contract
+        # loop does no attribute lookups.
+        self._score_steps: List[Tuple[str, Callable[[ScoreContext], Tuple[float, List[str], List[str]]], float]] = [
+            (scorer.key, scorer.score, weight) for scorer, weight in self._scorer_weights
+        ]
+        self._weight_vector = np.array([weight for _, weight in self._scorer_weights], dtype=float)
+        bounds = self.config.get("score_bounds", {})
+        self._min_score = float(bounds.get("min", 0.0))
+        self._max_score = float(bounds.get("max", 100.0))
 
     def _instantiate(self, key: str):
         scorer_cls: Type = SCORER_REGISTRY[key]
@@ -49,40 +68,52 @@ class CompositeScoringEngine:
         breakdowns: List[ScoreBreakdown] = []
         total = 0.0
         all_reasons: List[str] = []
-        all_tags: List[str] = []
+        all_tags: Set[str] = set()
 
-        for scorer in self._scorers:
-            raw_score, reasons, tags = scorer.score(context)
-            weight = context.get_weight(scorer.key, getattr(scorer, "default_weight", 1.0))
+        for key, score_fn, weight in self._score_steps:
+            raw_score, reasons, tags = score_fn(context)
             weighted_score = raw_score * weight
             total += weighted_score
+            # Fields are already typed by the scorers; skip pydantic re-validation.
             breakdowns.append(
-                ScoreBreakdown(
-                    scorer=scorer.key,
+                ScoreBreakdown.model_construct(
+                    scorer=key,
                     weight=weight,
                     raw_score=raw_score,
                     weighted_score=weighted_score,
-                    reasons=reasons,
-                    tags=tags,
+                    reasons=tuple(reasons),
+                    tags=tuple(tags),
                 )
             )
             all_reasons.extend(reasons)
-            all_tags.extend(tags)
+            all_tags.update(tags)
 
-        bounds = self.config.get("score_bounds", {})
-        min_score = float(bounds.get("min", 0.0))
-        max_score = float(bounds.get("max", 100.0))
-        total = max(min_score, min(max_score, total))
+        total = max(self._min_score, min(self._max_score, total))
 
         score = OptionScore(
             total_score=round(total, 2),
             breakdowns=breakdowns,
             reasons=all_reasons,
-            tags=sorted(set(all_tags)),
+            tags=sorted(all_tags),
             metadata={"market_data": market_snapshot},
         )
         return ScoringResult(contract=contract, greeks=greeks, score=score)
 
+    def score_batch(self, contracts_df: pd.DataFrame) -> np.ndarray:
+        """Return the bounded total score for every row of a batch frame.
+
+        ``contracts_df`` follows :func:`~src.scoring.base.build_batch_frame`.
+        Totals match :meth:`score` before its two-decimal rounding; reasons
+        and tags are not produced.
+        """
+
+        if not self._scorer_weights:
+            totals = np.zeros(len(contracts_df))
+        else:
+            raw_scores = np.column_stack([scorer.score_vector(contracts_df) for scorer, _ in self._scorer_weights])
+            totals = raw_scores @ self._weight_vector
+        return np.clip(totals, self._min_score, self._max_score)
+
     @property
     def enabled_scorers(self) -> List[str]:
         return [scorer.key for scorer in self._scorers]
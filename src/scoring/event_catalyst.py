@@ -1,8 +1,20 @@
 from __future__ import annotations
 
-from typing import List, Sequence, Tuple
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
 
-from .base import ScoreContext
+import numpy as np
+import pandas as pd
+
+from .base import ScoreContext, frame_column, frame_truthy
+
+
+@dataclass(frozen=True)
+class NumericIntel:
+    """Numeric event-intel fields converted once per ``event_intel`` mapping."""
+
+    earnings_in_days: float | None
+    news_sentiment_score: float | None
 
 
 class EventCatalystScorer:
@@ -13,6 +25,12 @@ class EventCatalystScorer:
 
     _BULLISH_SENTIMENT_THRESHOLD = 0.3
     _BEARISH_SENTIMENT_THRESHOLD = -0.3
+    _INTEL_CACHE_SIZE = 512
+
+    def __init__(self) -> None:
+        # Contracts on one underlying share the same ``event_intel`` mapping. Entries keep
+        # a reference to that mapping so its id cannot be recycled while cached.
+        self._cache: Dict[int, Tuple[Mapping[str, Any], NumericIntel]] = {}
 
     def score(self, context: ScoreContext) -> Tuple[float, List[str], List[str]]:
         data = context.market_data.get("event_intel", {})
@@ -20,7 +38,8 @@ class EventCatalystScorer:
         tags: List[str] = ["catalyst"]
         score = 0.0
 
-        earnings_in_days = self._get_number(data, "earnings_in_days")
+        intel = self._numeric_intel(data)
+        earnings_in_days = intel.earnings_in_days
         if earnings_in_days is not None:
             if 0 <= earnings_in_days <= 7:
                 score += 18
@@ -39,7 +58,7 @@ class EventCatalystScorer:
                     score += 6
                     reasons.append("Recent earnings move still in play")
 
-        sentiment_score = self._get_number(data, "news_sentiment_score")
+        sentiment_score = intel.news_sentiment_score
         sentiment_label = data.get("news_sentiment_label")
         if sentiment_score is not None:
             if sentiment_score >= self._BULLISH_SENTIMENT_THRESHOLD:
@@ -89,6 +108,60 @@ class EventCatalystScorer:
 
         return score, reasons, sorted(set(tags))
 
+    def score_vector(self, frame: pd.DataFrame) -> np.ndarray:
+        earnings = frame_column(frame, "event_intel.earnings_in_days")
+        days_since = np.abs(np.trunc(earnings))
+        earnings_conditions = [
+            (earnings >= 0) & (earnings <= 7),
+            (earnings > 7) & (earnings <= 14),
+            (earnings < 0) & (days_since <= 3),
+            (earnings < 0) & (days_since <= 7),
+        ]
+        score = np.select(earnings_conditions, [18.0, 10.0, 12.0, 6.0], 0.0)
+        has_reason = np.logical_or.reduce(earnings_conditions)
+
+        sentiment = frame_column(frame, "event_intel.news_sentiment_score")
+        has_sentiment = ~np.isnan(sentiment)
+        score += np.select(
+            [
+                sentiment >= self._BULLISH_SENTIMENT_THRESHOLD,
+                sentiment <= self._BEARISH_SENTIMENT_THRESHOLD,
+                has_sentiment,
+            ],
+            [12.0, -15.0, 4.0],
+            0.0,
+        )
+        has_reason |= has_sentiment
+
+        for column, points in (
+            ("event_intel.political_hits", 8.0),
+            ("event_intel.ai_infra_hits", 9.0),
+            ("event_intel.unique_drivers", 5.0),
+        ):
+            present = frame_truthy(frame, column)
+            score += np.where(present, points, 0.0)
+            has_reason |= present
+
+        if "event_intel.volatility_label" in frame.columns:
+            volatile = frame["event_intel.volatility_label"].isin(("extreme", "elevated")).to_numpy()
+            score += np.where(volatile, 6.0, 0.0)
+            has_reason |= volatile
+
+        return np.where(has_reason, score, score - 5.0)
+
+    def _numeric_intel(self, data: Mapping[str, Any]) -> NumericIntel:
+        cached = self._cache.get(id(data))
+        if cached is not None and cached[0] is data:
+            return cached[1]
+        intel = NumericIntel(
+            earnings_in_days=self._get_number(data, "earnings_in_days"),
+            news_sentiment_score=self._get_number(data, "news_sentiment_score"),
+        )
+        if len(self._cache) >= self._INTEL_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[id(data)] = (data, intel)
+        return intel
+
     @staticmethod
     def _get_number(data: dict, key: str) -> float | None:
         value = data.get(key)
@@ -4,7 +4,10 @@ from __future__ import annotations
 
 from typing import List, Tuple
 
-from .base import ScoreContext
+import numpy as np
+import pandas as pd
+
+from .base import ScoreContext, frame_column, frame_has_group
 
 
 class GammaSqueezeScorer:
@@ -13,13 +16,9 @@ class GammaSqueezeScorer:
     key = "gamma_squeeze"
     default_weight = 1.1
 
-    _LEVEL_SCORES = {
-        "MINIMAL": 10.0,
-        "LOW": 20.0,
-        "MODERATE": 38.0,
-        "HIGH": 55.0,
-        "EXTREME": 70.0,
-    }
+    # Unknown levels fall back to index 0 (MINIMAL).
+    _LEVEL_INDEX = {"MINIMAL": 0, "LOW": 1, "MODERATE": 2, "HIGH": 3, "EXTREME": 4}
+    _LEVEL_BASE = (10.0, 20.0, 38.0, 55.0, 70.0)
 
     def score(self, context: ScoreContext) -> Tuple[float, List[str], List[str]]:
         signal = context.market_data.get("gamma_squeeze")
@@ -31,12 +30,14 @@ class GammaSqueezeScorer:
             return 5.0, reasons, []
 
         risk_level = str(signal.get("risk_level", "MINIMAL")).upper()
-        base_score = self._LEVEL_SCORES.get(risk_level, 10.0)
+        base_score = self._LEVEL_BASE[self._LEVEL_INDEX.get(risk_level, 0)]
 
         score = base_score
         dealer_short = float(signal.get("max_short_gamma", 0.0))
         squeeze_strike = signal.get("squeeze_strike")
         volume_ratio = signal.get("call_volume_ratio")
+        if volume_ratio is not None:
+            volume_ratio = float(volume_ratio)
 
         if dealer_short:
             reasons.append(
@@ -47,9 +48,9 @@ class GammaSqueezeScorer:
             tags.append("dealer-short")
 
         if volume_ratio is not None:
-            score += min(10.0, max(0.0, (float(volume_ratio) - 1.0) * 8.0))
-            reasons.append(f"Call volume/OI ratio {float(volume_ratio):.1f} at squeeze strike")
-            if float(volume_ratio) >= 2.0:
+            score += min(10.0, max(0.0, (volume_ratio - 1.0) * 8.0))
+            reasons.append(f"Call volume/OI ratio {volume_ratio:.1f} at squeeze strike")
+            if volume_ratio >= 2.0:
                 tags.append("volume-surge")
 
         gamma_flip = signal.get("gamma_flip")
@@ -63,7 +64,23 @@ class GammaSqueezeScorer:
                 if item not in reasons:
                     reasons.append(str(item))
 
-        return score, reasons, list(sorted(set(tags)))
+        return score, reasons, sorted(set(tags))
+
+    def score_vector(self, frame: pd.DataFrame) -> np.ndarray:
+        if "gamma_squeeze.risk_level" in frame.columns:
+            levels = frame["gamma_squeeze.risk_level"].fillna("MINIMAL").astype(str).str.upper()
+            level_index = levels.map(self._LEVEL_INDEX).fillna(0).to_numpy(dtype=np.intp)
+            base_score = np.asarray(self._LEVEL_BASE)[level_index]
+        else:
+            base_score = np.full(len(frame), 10.0)
+
+        volume_ratio = frame_column(frame, "gamma_squeeze.call_volume_ratio")
+        volume_bonus = np.where(
+            np.isnan(volume_ratio),
+            0.0,
+            np.clip((volume_ratio - 1.0) * 8.0, 0.0, 10.0),
+        )
+        return np.where(frame_has_group(frame, "gamma_squeeze"), base_score + volume_bonus, 5.0)
 
 
 __all__ = ["GammaSqueezeScorer"]
@@ -2,9 +2,25 @@
 
 from __future__ import annotations
 
+import math
+from bisect import bisect_right
 from typing import Dict, List, Tuple
 
-from .base import ScoreContext
+import numpy as np
+import pandas as pd
+
+from .base import ScoreContext, frame_column
+
+# |z| bands: below 1σ, 1-2σ, 2-3σ and 3σ or more.
+_Z_THRESHOLDS = (1.0, 2.0, 3.0)
+_Z_BONUSES = (0, 18, 30, 45)
+_Z_TAGS = (None, None, "iv-outlier", "iv-extreme")
+
+# Percentile bands (in percent): at or below 5, between, and at or above 95.
+# The lower edge is nudged up so 5 itself lands in the low band.
+_PERCENTILE_THRESHOLDS = (math.nextafter(5.0, math.inf), 95.0)
+_PERCENTILE_BONUSES = (8, 0, 8)
+_PERCENTILE_TAGS = ("iv-low", None, "iv-high")
 
 
 class IVAnomalyScorer:
@@ -32,14 +48,11 @@ class IVAnomalyScorer:
 
         # Reward extreme deviations from the historical mean.
         abs_z = abs(zscore)
-        if abs_z >= 3:
-            score += 45
-            tags.append("iv-extreme")
-        elif abs_z >= 2:
-            score += 30
-            tags.append("iv-outlier")
-        elif abs_z >= 1:
-            score += 18
+        # NaN compares false everywhere, which would make bisect return the top band.
+        z_band = bisect_right(_Z_THRESHOLDS, abs_z) if abs_z == abs_z else 0
+        score += _Z_BONUSES[z_band]
+        if _Z_TAGS[z_band]:
+            tags.append(_Z_TAGS[z_band])
 
         direction = "above" if zscore > 0 else "below"
         if abs_z >= 1:
@@ -49,13 +62,12 @@ class IVAnomalyScorer:
 
         if percentile is not None:
             percentile_pct = percentile * 100
-            if percentile_pct >= 95:
-                score += 8
-                tags.append("iv-high")
-                reasons.append(f"Current IV at {percentile_pct:.0f}th percentile of lookback")
-            elif percentile_pct <= 5:
-                score += 8
-                tags.append("iv-low")
+            percentile_band = 1
+            if percentile_pct == percentile_pct:
+                percentile_band = bisect_right(_PERCENTILE_THRESHOLDS, percentile_pct)
+            if _PERCENTILE_TAGS[percentile_band]:
+                score += _PERCENTILE_BONUSES[percentile_band]
+                tags.append(_PERCENTILE_TAGS[percentile_band])
                 reasons.append(f"Current IV at {percentile_pct:.0f}th percentile of lookback")
 
         if spread is not None and realized is not None:
@@ -77,6 +89,19 @@ class IVAnomalyScorer:
 
         return score, reasons, tags
 
+    def score_vector(self, frame: pd.DataFrame) -> np.ndarray:
+        abs_z = np.abs(frame_column(frame, "iv_anomaly.zscore"))
+        percentile_pct = frame_column(frame, "iv_anomaly.percentile") * 100
+        realized = frame_column(frame, "iv_anomaly.realized_vol")
+        spread = frame_column(frame, "iv_anomaly.iv_rv_spread")
+
+        score = 5.0 + np.asarray(_Z_BONUSES, dtype=float)[np.digitize(abs_z, _Z_THRESHOLDS)]
+        percentile_band = np.digitize(np.nan_to_num(percentile_pct, nan=50.0), _PERCENTILE_THRESHOLDS)
+        score += np.asarray(_PERCENTILE_BONUSES, dtype=float)[percentile_band]
+        has_spread = ~np.isnan(spread) & ~np.isnan(realized)
+        score += np.where(has_spread, np.minimum(12.0, np.abs(np.where(has_spread, spread, 0.0))), 0.0)
+        return np.where(np.isnan(abs_z), 5.0, score)
+
 
 __all__ = ["IVAnomalyScorer"]
 
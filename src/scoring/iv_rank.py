@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from typing import List, Tuple
 
-from .base import ScoreContext
+import numpy as np
+import pandas as pd
+
+from .base import ScoreContext, frame_column
 
 
 class IVRankScorer:
@@ -48,6 +51,19 @@ class IVRankScorer:
 
         return score, reasons, tags
 
+    def score_vector(self, frame: pd.DataFrame) -> np.ndarray:
+        iv_rank = frame_column(frame, "iv_rank", 50.0)
+        gamma = frame_column(frame, "gamma", 0.0)
+        vega = frame_column(frame, "vega", 0.0)
+        score = np.select(
+            [(iv_rank > 80) & (gamma > 0.01), iv_rank > 70, (iv_rank < 20) & (vega > 0.1)],
+            [30.0, 20.0, 25.0],
+            10.0,
+        )
+        # ``gamma_squeeze`` is either a bare score or a mapping carrying one.
+        squeeze = frame_column(frame, "gamma_squeeze", 0.0) + frame_column(frame, "gamma_squeeze.score", 0.0)
+        return score + squeeze
+
 
 __all__ = ["IVRankScorer"]
 
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from typing import List, Tuple
 
-from .base import ScoreContext
+import numpy as np
+import pandas as pd
+
+from .base import ScoreContext, frame_column
 
 
 class LiquidityScorer:
@@ -44,6 +47,25 @@ class LiquidityScorer:
 
         return score, reasons, tags
 
+    def score_vector(self, frame: pd.DataFrame) -> np.ndarray:
+        spread_pct = frame_column(frame, "spread_pct", 1.0)
+        open_interest = frame_column(frame, "openInterest", 0.0)
+        spread_score = np.select(
+            [
+                (spread_pct < 0.03) & (open_interest > 2000),
+                (spread_pct < 0.05) & (open_interest > 1000),
+                spread_pct < 0.1,
+            ],
+            [20.0, 15.0, 10.0],
+            3.0,
+        )
+        interest_score = np.select(
+            [open_interest > 5000, open_interest > 2000, open_interest < 500],
+            [12.0, 8.0, -5.0],
+            0.0,
+        )
+        return spread_score + interest_score
+
 
 __all__ = ["LiquidityScorer"]
 
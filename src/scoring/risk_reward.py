@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+from datetime import date
 from typing import List, Tuple
 
-from .base import ScoreContext
+import numpy as np
+import pandas as pd
+
+from .base import ScoreContext, frame_column, frame_has_group
 
 
 class RiskRewardScorer:
@@ -62,6 +66,67 @@ class RiskRewardScorer:
         context.market_data.setdefault("projected_returns", projected_returns)
         return score, reasons, tags
 
+    def score_vector(self, frame: pd.DataFrame) -> np.ndarray:
+        stock_price = frame_column(frame, "stockPrice", 0.0)
+        strike = frame_column(frame, "strike", 0.0)
+
+        ten_percent_rr = np.where(
+            frame_has_group(frame, "projected_returns"),
+            frame_column(frame, "projected_returns.10%", 0.0),
+            self._ten_percent_returns(frame, stock_price, strike),
+        )
+        score = np.select(
+            [ten_percent_rr > 5, ten_percent_rr > 3, ten_percent_rr > 2],
+            [30.0, 20.0, 12.0],
+            6.0,
+        )
+
+        theta_ratio = frame_column(frame, "theta_ratio")
+        days = self._days_to_expiration(frame)
+        theta_score = np.select(
+            [(theta_ratio < 0.02) & (days > 30), (theta_ratio > 0.05) & (days < 14)],
+            [15.0, -10.0],
+            5.0,
+        )
+        score += np.where(np.isnan(theta_ratio), 0.0, theta_score)
+
+        moneyness = frame_column(frame, "moneyness")
+        moneyness = np.where(
+            np.isnan(moneyness),
+            np.abs(stock_price - strike) / np.maximum(stock_price, 0.01),
+            moneyness,
+        )
+        score += np.select(
+            [
+                (moneyness > 0.01) & (moneyness < 0.05),
+                moneyness < 0.01,
+                (moneyness > 0.05) & (moneyness < 0.10),
+            ],
+            [18.0, 12.0, 8.0],
+            3.0,
+        )
+        return score
+
+    @staticmethod
+    def _ten_percent_returns(frame: pd.DataFrame, stock_price: np.ndarray, strike: np.ndarray) -> np.ndarray:
+        last_price = frame_column(frame, "lastPrice", 0.0)
+        is_call = (frame["type"] == "call").to_numpy() if "type" in frame.columns else np.ones(len(frame), dtype=bool)
+        intrinsic = np.where(
+            is_call,
+            np.maximum(0.0, stock_price * 1.10 - strike),
+            np.maximum(0.0, strike - stock_price * 0.90),
+        )
+        potential_return = np.maximum(0.0, intrinsic - last_price)
+        return np.round(potential_return / np.maximum(last_price, 0.01), 2)
+
+    @staticmethod
+    def _days_to_expiration(frame: pd.DataFrame) -> np.ndarray:
+        if "expiration" not in frame.columns:
+            return np.full(len(frame), np.nan)
+        expiration = pd.to_datetime(frame["expiration"], errors="coerce")
+        days = (expiration - pd.Timestamp(date.today())).dt.days
+        return days.to_numpy(dtype=float, na_value=np.nan)
+
     @staticmethod
     def _compute_returns(contract) -> dict:
         results = {}
@@ -1,8 +1,30 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 from typing import List, Tuple
 
-from .base import ScoreContext
+import numpy as np
+import pandas as pd
+
+from .base import ScoreContext, frame_column
+
+# Volume/OI ratio bands; a ratio must exceed a threshold to reach the next band.
+_RATIO_THRESHOLDS = (1.0, 2.0, 3.0, 5.0)
+_RATIO_SCORES = (3.0, 8.0, 15.0, 25.0, 35.0)
+_RATIO_REASONS = (
+    None,
+    None,
+    "Unusual volume ({ratio:.1f}x open interest)",
+    "Very high unusual volume ({ratio:.1f}x open interest)",
+    "Extreme unusual volume ({ratio:.1f}x open interest)",
+)
+_RATIO_TAGS: Tuple[Tuple[str, ...], ...] = (
+    (),
+    (),
+    (),
+    ("unusual-volume",),
+    ("unusual-volume", "smart-money"),
+)
 
 
 class VolumeScorer:
@@ -11,28 +33,26 @@ class VolumeScorer:
 
     def score(self, context: ScoreContext) -> Tuple[float, List[str], List[str]]:
         ratio = context.market_data.get("volume_ratio", 0.0)
-        score = 0.0
-        reasons: List[str] = []
-        tags: List[str] = []
-
-        if ratio > 5:
-            score += 35
-            reasons.append(f"Extreme unusual volume ({ratio:.1f}x open interest)")
-            tags.extend(["unusual-volume", "smart-money"])
-        elif ratio > 3:
-            score += 25
-            reasons.append(f"Very high unusual volume ({ratio:.1f}x open interest)")
-            tags.append("unusual-volume")
-        elif ratio > 2:
-            score += 15
-            reasons.append(f"Unusual volume ({ratio:.1f}x open interest)")
-        elif ratio > 1:
-            score += 8
-        else:
-            score += 3
-
-        return score, reasons, tags
+        # NaN fails every comparison, so it belongs in the lowest band.
+        band = bisect_left(_RATIO_THRESHOLDS, ratio) if ratio == ratio else 0
+        reason = _RATIO_REASONS[band]
+        reasons: List[str] = [reason.format(ratio=ratio)] if reason else []
+        return _RATIO_SCORES[band], reasons, list(_RATIO_TAGS[band])
 
+    @staticmethod
+    def score_batch(ratios: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Return raw scores and band indexes for an array of volume/OI ratios.
 
-__all__ = ["VolumeScorer"]
+        Band indexes key into the module's reason and tag tables, so callers
+        only format text for the rows they report on.
+        """
+
+        ratios = np.asarray(ratios, dtype=float)
+        bands = np.where(np.isnan(ratios), 0, np.searchsorted(_RATIO_THRESHOLDS, ratios, side="left"))
+        return np.asarray(_RATIO_SCORES)[bands], bands
+
+    def score_vector(self, frame: pd.DataFrame) -> np.ndarray:
+        return self.score_batch(frame_column(frame, "volume_ratio", 0.0))[0]
 
+
+__all__ = ["VolumeScorer"]
@@ -2,22 +2,92 @@
 
 from __future__ import annotations
 
+import hashlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
+import pandas as pd
 
-class Direction(Enum):
-    """Directional bias enum."""
+
+class Direction(str, Enum):
+    """Directional bias enum.
+
+    Members are ``str`` instances, so ``Direction.BULLISH == "bullish"`` and
+    ``json.dumps`` emits the plain value.
+    """
 
     BULLISH = "bullish"
     BEARISH = "bearish"
     NEUTRAL = "neutral"
 
 
-@dataclass
+# Indexed by ``(score > threshold) - (score < -threshold) + 1``
+_DIRECTIONS = (Direction.BEARISH, Direction.NEUTRAL, Direction.BULLISH)
+
+
+def direction_from_score(score: float, threshold: float = 15.0) -> Direction:
+    """Map a -100..+100 score to a direction; NaN maps to neutral.
+
+    The comparisons go through ``int`` because NumPy booleans refuse ``-``.
+    """
+    return _DIRECTIONS[int(score > threshold) - int(score < -threshold) + 1]
+
+
+def clip_scalar(value: float, lower: float, upper: float) -> float:
+    """Scalar ``np.clip`` without the array round-trip; NaN passes through."""
+
+    return lower if value < lower else upper if value > upper else value
+
+
+# Option types as int8 codes. Scanners resolve them once per chain into
+# OPTION_TYPE_CODE_COLUMN so signals compare small integers instead of strings.
+CALL_CODE = 0
+PUT_CODE = 1
+OPTION_TYPE_CODE_COLUMN = "_type_code"
+
+
+def option_type_codes(chain: pd.DataFrame) -> np.ndarray:
+    """int8 option-type codes for ``chain``: 0 call, 1 put, -1 anything else.
+
+    Uses the precomputed :data:`OPTION_TYPE_CODE_COLUMN` when present and
+    encodes the ``type`` column otherwise.
+    """
+    if OPTION_TYPE_CODE_COLUMN in chain.columns:
+        return chain[OPTION_TYPE_CODE_COLUMN].to_numpy()
+    types = chain["type"].to_numpy()
+    codes = np.full(types.shape[0], -1, dtype=np.int8)
+    codes[types == "call"] = CALL_CODE
+    codes[types == "put"] = PUT_CODE
+    return codes
+
+
+def data_fingerprint(*parts: Any) -> bytes:
+    """Content digest of arrays and scalars, used to key cached signal metrics.
+
+    Numeric arrays are hashed by dtype, shape and raw bytes, object arrays
+    element-wise through pandas, and anything else by ``repr``.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        if isinstance(part, (pd.Series, pd.Index)):
+            part = part.to_numpy()
+        if isinstance(part, np.ndarray):
+            digest.update(f"{part.dtype.str}{part.shape}".encode())
+            if part.dtype == object:
+                part = pd.util.hash_array(part)
+            digest.update(np.ascontiguousarray(part).tobytes())
+        else:
+            digest.update(repr(part).encode())
+        digest.update(b"|")
+    return digest.digest()
+
+
+@dataclass(slots=True)
 class SignalResult:
     """Result from a single directional signal."""
 
@@ -42,7 +112,7 @@ class SignalResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DirectionalScore:
     """Aggregated directional prediction from multiple signals."""
 
@@ -70,6 +140,8 @@ class DirectionalScore:
 class Signal(ABC):
     """Abstract base class for directional signals."""
 
+    _METRICS_CACHE_SIZE = 256
+
     def __init__(self, name: str, weight: float = 1.0):
         """
         Initialize signal.
@@ -81,21 +153,53 @@ class Signal(ABC):
         self.name = name
         self.weight = weight
         self._historical_accuracy: Optional[float] = None
+        self._metrics_cache: Dict[bytes, Dict[str, Any]] = {}
 
     @abstractmethod
-    def calculate(self, data: Dict[str, Any]) -> SignalResult:
+    def calculate(self, data: Dict[str, Any], now: Optional[datetime] = None) -> SignalResult:
         """
         Calculate the directional signal.
 
         Args:
             data: Dictionary containing all available data for analysis
                   (price history, options data, volume, etc.)
+            now: Timestamp for the result. The aggregator captures one per
+                 pass so every result in a snapshot shares it; standalone
+                 callers may omit it to read the clock.
 
         Returns:
             SignalResult with direction, score, confidence, and rationale
         """
         pass
 
+    def calculate_many(
+        self, rows: Sequence[Dict[str, Any]], now: Optional[datetime] = None
+    ) -> List[SignalResult]:
+        """
+        Calculate the signal for several symbols at once.
+
+        The default runs :meth:`calculate` per row. Signals whose math
+        vectorizes across symbols can override this with a batch version.
+
+        Args:
+            rows: One data dictionary per symbol
+            now: Timestamp shared by every result
+
+        Returns:
+            One SignalResult per row, in input order
+        """
+        return [self.calculate(data, now=now) for data in rows]
+
+    def _cached_metrics(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """Return a copy of metrics stored under a :func:`data_fingerprint` key."""
+        cached = self._metrics_cache.get(key)
+        return dict(cached) if cached is not None else None
+
+    def _remember_metrics(self, key: bytes, metrics: Dict[str, Any]) -> None:
+        if len(self._metrics_cache) >= self._METRICS_CACHE_SIZE:
+            self._metrics_cache.clear()
+        self._metrics_cache[key] = dict(metrics)
+
     def set_historical_accuracy(self, accuracy: float) -> None:
         """Set the historical accuracy of this signal from backtesting."""
         self._historical_accuracy = accuracy
@@ -134,8 +238,12 @@ class Signal(ABC):
         Returns:
             True if data is valid, False otherwise
         """
-        required = self.get_required_data()
-        for field in required:
-            if field not in data or data[field] is None:
+        for field in self._required_fields:
+            if data.get(field) is None:
                 return False
         return True
+
+    @cached_property
+    def _required_fields(self) -> Tuple[str, ...]:
+        """``get_required_data()`` captured once per instance for ``validate_data``."""
+        return tuple(self.get_required_data())
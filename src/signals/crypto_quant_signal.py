@@ -2,12 +2,37 @@
 
 from __future__ import annotations
 
+import os
 from datetime import datetime
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
-import numpy as np
+from .base import Direction, Signal, SignalResult, clip_scalar, direction_from_score
 
-from .base import Direction, Signal, SignalResult
+# The raw insights (headlines included) are large and only useful when debugging,
+# so results carry them only when SIGNALS_DEBUG_DETAILS=1.
+_DEBUG_DETAILS = os.getenv("SIGNALS_DEBUG_DETAILS", "0") == "1"
+
+
+# (field, weight) pairs for each component, summed in this order.
+_SENTIMENT_WEIGHTS = (("sentiment_score", 0.7), ("momentum_score", 0.2), ("buzz_score", 0.1))
+_DERIVATIVES_WEIGHTS = (("basis_score", 0.6), ("funding_score", 0.25), ("open_interest_score", 0.15))
+_STRUCTURE_WEIGHTS = (
+    ("momentum_score", 0.5),
+    ("volume_score", 0.25),
+    ("volatility_bias", 0.15),
+    ("macro_bias", 0.10),
+)
+
+
+def _blend(source: Dict[str, Any], weights: Tuple[Tuple[str, float], ...]) -> float:
+    """Weighted sum of ``source`` fields (missing ones count as 0), clipped to [-1, 1]."""
+
+    if not source:
+        return 0.0
+    total = 0.0
+    for field, weight in weights:
+        total += float(source.get(field, 0.0)) * weight
+    return clip_scalar(total, -1.0, 1.0)
 
 
 class CryptoQuantSignal(Signal):
@@ -19,7 +44,7 @@ class CryptoQuantSignal(Signal):
     def get_required_data(self) -> list[str]:
         return ["quant_insights"]
 
-    def calculate(self, data: Dict[str, Any]) -> SignalResult:
+    def calculate(self, data: Dict[str, Any], now: Optional[datetime] = None) -> SignalResult:
         insights: Dict[str, Any] = data.get("quant_insights", {}) or {}
         news = insights.get("news", {}) or {}
         derivatives = insights.get("derivatives", {}) or {}
@@ -34,7 +59,7 @@ class CryptoQuantSignal(Signal):
             + derivatives_component * 0.35
             + structure_component * 0.20
         )
-        score = float(np.clip(composite * 100.0, -100.0, 100.0))
+        score = clip_scalar(composite * 100.0, -100.0, 100.0)
 
         direction = self._determine_direction(score)
         confidence = self._calculate_confidence(news, derivatives, onchain, score)
@@ -55,8 +80,9 @@ class CryptoQuantSignal(Signal):
             "derivatives_component": derivatives_component,
             "structure_component": structure_component,
             "composite": composite,
-            "inputs": insights,
         }
+        if _DEBUG_DETAILS:
+            details["inputs"] = insights
 
         return SignalResult(
             signal_name=self.name,
@@ -65,55 +91,21 @@ class CryptoQuantSignal(Signal):
             confidence=confidence,
             rationale=rationale,
             details=details,
-            timestamp=datetime.utcnow(),
+            timestamp=now or datetime.utcnow(),
         )
 
     def _score_sentiment(self, news: Dict[str, Any]) -> float:
-        if not news:
-            return 0.0
-
-        base = float(news.get("sentiment_score", 0.0))
-        momentum = float(news.get("momentum_score", 0.0))
-        buzz = float(news.get("buzz_score", 0.0))
-
         # Stronger weight on raw sentiment, but factor in recency momentum and buzz
-        combined = (base * 0.7) + (momentum * 0.2) + (buzz * 0.1)
-        return float(np.clip(combined, -1.0, 1.0))
+        return _blend(news, _SENTIMENT_WEIGHTS)
 
     def _score_derivatives(self, derivatives: Dict[str, Any]) -> float:
-        if not derivatives:
-            return 0.0
-
-        basis_score = float(derivatives.get("basis_score", 0.0))
-        funding_score = float(derivatives.get("funding_score", 0.0))
-        open_interest_score = float(derivatives.get("open_interest_score", 0.0))
-
-        composite = (basis_score * 0.6) + (funding_score * 0.25) + (open_interest_score * 0.15)
-        return float(np.clip(composite, -1.0, 1.0))
+        return _blend(derivatives, _DERIVATIVES_WEIGHTS)
 
     def _score_market_structure(self, onchain: Dict[str, Any]) -> float:
-        if not onchain:
-            return 0.0
-
-        momentum_score = float(onchain.get("momentum_score", 0.0))
-        volume_score = float(onchain.get("volume_score", 0.0))
-        volatility_bias = float(onchain.get("volatility_bias", 0.0))
-        macro_bias = float(onchain.get("macro_bias", 0.0))
-
-        composite = (
-            (momentum_score * 0.5)
-            + (volume_score * 0.25)
-            + (volatility_bias * 0.15)
-            + (macro_bias * 0.10)
-        )
-        return float(np.clip(composite, -1.0, 1.0))
+        return _blend(onchain, _STRUCTURE_WEIGHTS)
 
     def _determine_direction(self, score: float) -> Direction:
-        if score > 15:
-            return Direction.BULLISH
-        if score < -15:
-            return Direction.BEARISH
-        return Direction.NEUTRAL
+        return direction_from_score(score)
 
     def _calculate_confidence(
         self,
@@ -141,7 +133,7 @@ class CryptoQuantSignal(Signal):
 
         # Scale additional conviction if the absolute score is extreme
         conviction_bonus = min(15.0, abs(score) / 100.0 * 20.0)
-        return float(np.clip(total + conviction_bonus, 0.0, 95.0))
+        return clip_scalar(total + conviction_bonus, 0.0, 95.0)
 
     def _build_rationale(
         self,
@@ -200,14 +192,7 @@ class CryptoQuantSignal(Signal):
         return f"{headline} {' '.join(details)}{tail_note}"
 
     def _format_components(self, *components: float) -> Tuple[str, ...]:
-        labels = []
-        for value in components:
-            pct = np.clip((value + 1.0) / 2.0, 0.0, 1.0) * 100.0
-            if value > 0.15:
-                tone = "bullish"
-            elif value < -0.15:
-                tone = "bearish"
-            else:
-                tone = "neutral"
-            labels.append(f"{pct:.0f}% {tone}")
-        return tuple(labels)
+        return tuple(
+            f"{clip_scalar((value + 1.0) / 2.0, 0.0, 1.0) * 100.0:.0f}% {direction_from_score(value, 0.15).value}"
+            for value in components
+        )
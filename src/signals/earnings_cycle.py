@@ -23,13 +23,228 @@ Trading Logic:
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import logging
+import time
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-import yfinance as yf
+import numpy as np
+import pandas as pd
 
 from .base import Direction, Signal, SignalResult
 
+logger = logging.getLogger(__name__)
+
+# Phase labels indexed by the codes returned from ``_phase_code``.
+_PHASE_LABELS = ("pre_runup", "imminent", "post_reaction", "post_drift", "dead_zone", "mid_cycle")
+
+
+# Rationale prose per phase. ``{days}`` is the signed day count, ``{days_since}``
+# its magnitude and ``{timing}`` the phrase from ``_describe_earnings_timing``.
+_RATIONALE_TEMPLATES = {
+    "pre_runup": (
+        "Pre-earnings run-up phase: {days} days until earnings. "
+        "Historical patterns show stocks often drift higher as institutions "
+        "position ahead of announcements. IV typically rises, benefiting long "
+        "option positions. Consider directional plays before IV peaks."
+    ),
+    "imminent": (
+        "Earnings imminent ({days} days away) - HIGH RISK period. "
+        "IV is likely at peak levels (premium expensive). Directional bias "
+        "unclear as market waits for results. Avoid new directional positions "
+        "unless strong conviction - IV crush after earnings will hurt option value."
+    ),
+    "post_reaction": (
+        "Post-earnings reaction phase ({days_since} days since announcement). "
+        "Stock digesting earnings results. IV crushing (options losing premium fast). "
+        "Wait 3-5 days for post-earnings drift pattern to emerge before taking "
+        "directional stance. Let volatility stabilize."
+    ),
+    "post_drift": (
+        "Post-earnings drift phase ({days_since} days since earnings). "
+        "Historical patterns show strong tendency for continuation after "
+        "earnings reactions. If stock rallied post-earnings, drift typically "
+        "extends bullish move. If sold off, weakness often continues. "
+        "IV has normalized - better risk/reward for options."
+    ),
+    "dead_zone": (
+        "Earnings dead zone ({timing} earnings). "
+        "Historical analysis shows this period has lowest directional edge. "
+        "Too far from catalyst for pre-earnings positioning, past the "
+        "post-earnings drift window. Reduce position size or wait for "
+        "better timing. Focus on other signals."
+    ),
+    "mid_cycle": (
+        "Normal trading period ({timing}). "
+        "Earnings cycle not a significant factor in directional bias. "
+        "No historical edge from earnings timing patterns. "
+        "Rely on other signals for directional conviction."
+    ),
+}
+
+
+def _phase_code(days_to_earnings: int) -> int:
+    if 5 <= days_to_earnings <= 15:
+        return 0
+    if 0 <= days_to_earnings < 5:
+        return 1
+    if -3 <= days_to_earnings < 0:
+        return 2
+    if -10 <= days_to_earnings < -3:
+        return 3
+    if 20 <= abs(days_to_earnings) <= 60:
+        return 4
+    return 5
+
+
+# Earnings dates move about once a quarter, so repeat scans reuse a lookup for six
+# hours. Only the dates are cached; phases are recomputed against today's date.
+# Symbols without earnings data are remembered for a shorter window so a miss
+# does not cost a network round-trip on every evaluation.
+EARNINGS_CACHE_TTL_SECONDS = 6 * 60 * 60
+EARNINGS_MISS_TTL_SECONDS = 15 * 60
+_EARNINGS_CACHE: Dict[str, Tuple[float, Optional[Tuple[str, Sequence[date] | np.ndarray]]]] = {}
+
+
+def _fetch_earnings_cached(
+    symbol: str, ttl: float = EARNINGS_CACHE_TTL_SECONDS
+) -> Optional[Tuple[str, Sequence[date] | np.ndarray]]:
+    """Return ``(data_quality, earnings_dates)`` for ``symbol``, hitting yfinance at most once per ``ttl``.
+
+    ``full`` records hold a ``datetime64[D]`` array; ``calendar_only`` records a
+    one-element tuple with the calendar's next earnings date. Misses are cached
+    as ``None`` for at most :data:`EARNINGS_MISS_TTL_SECONDS`.
+    """
+
+    now = time.monotonic()
+    cached = _EARNINGS_CACHE.get(symbol)
+    if cached is not None:
+        fetched_at, record = cached
+        if now - fetched_at < (ttl if record is not None else min(ttl, EARNINGS_MISS_TTL_SECONDS)):
+            return record
+    record = _fetch_earnings_dates(symbol)
+    _EARNINGS_CACHE[symbol] = (now, record)
+    return record
+
+
+def _fetch_earnings_dates(symbol: str) -> Optional[Tuple[str, Sequence[date] | np.ndarray]]:
+    # Deferred so importing the signal package does not pay for yfinance
+    import yfinance as yf
+
+    ticker = yf.Ticker(symbol)
+
+    # Get earnings dates
+    earnings_dates = None
+    try:
+        earnings_dates = ticker.earnings_dates
+    except Exception:
+        # yfinance raises a wide range of errors here; fall back to the calendar
+        pass
+
+    if earnings_dates is None or earnings_dates.empty:
+        # Try alternative method - get calendar
+        try:
+            calendar = ticker.calendar
+            if calendar is not None and not calendar.empty:
+                # Extract earnings date from calendar
+                next_earnings = calendar.get("Earnings Date")
+                if next_earnings is not None:
+                    if isinstance(next_earnings, list) and len(next_earnings) > 0:
+                        next_earnings_date = next_earnings[0]
+                    else:
+                        next_earnings_date = next_earnings
+
+                    if hasattr(next_earnings_date, 'date'):
+                        next_earnings_date = next_earnings_date.date()
+
+                    return "calendar_only", (next_earnings_date,)
+        except Exception as e:
+            logger.debug("Could not fetch earnings calendar for %s: %s", symbol, e)
+        return None
+
+    index = pd.DatetimeIndex(earnings_dates.index)
+    if index.tz is not None:
+        # Keep the exchange-local calendar day, as Timestamp.date() would.
+        index = index.tz_localize(None)
+    dates64 = index.values.astype("datetime64[D]")
+    return "full", dates64[~np.isnat(dates64)]
+
+
+# The interpretation depends only on the phase, the day count and whether full
+# earnings history was available, so it is cached across symbols and scans.
+@lru_cache(maxsize=512)
+def _interpret_phase(
+    phase: str, days_to_earnings: int, full_data: bool
+) -> Tuple[Direction, float, float, str]:
+    """Return ``(direction, score, confidence, rationale)`` for an earnings phase."""
+
+    # Base confidence on data quality
+    base_confidence = 70 if full_data else 60
+
+    # Interpret based on phase
+    if phase == "pre_runup":
+        # Pre-earnings run-up (5-15 days before)
+        # Historically, stocks tend to drift in anticipation
+        # Default to slight bullish bias (institutions position ahead)
+        direction = Direction.BULLISH
+        score = 25 + min(15, (15 - days_to_earnings) * 2)  # Stronger as we get closer
+        confidence = base_confidence
+
+    elif phase == "imminent":
+        # 0-5 days before earnings - high risk, high IV
+        direction = Direction.NEUTRAL
+        score = 0
+        confidence = 50
+
+    elif phase == "post_reaction":
+        # 0-3 days after earnings - immediate reaction, wait for dust to settle
+        direction = Direction.NEUTRAL
+        score = 0
+        confidence = 55
+
+    elif phase == "post_drift":
+        # 3-10 days after earnings - continuation pattern
+        # If stock moved significantly post-earnings, drift often continues
+        # Default to slight bullish bias (post-earnings drift tends bullish after beats)
+        direction = Direction.BULLISH
+        score = 30
+        confidence = base_confidence - 5
+
+    elif phase == "dead_zone":
+        # 20-60 days from earnings - low conviction period
+        direction = Direction.NEUTRAL
+        score = 0
+        confidence = 45
+
+    else:  # mid_cycle
+        # Normal mid-cycle period - earnings not a factor
+        phase = "mid_cycle"
+        direction = Direction.NEUTRAL
+        score = 0
+        confidence = 50
+
+    rationale = _RATIONALE_TEMPLATES[phase].format(
+        days=days_to_earnings,
+        days_since=abs(days_to_earnings),
+        timing=_describe_earnings_timing(phase, days_to_earnings),
+    )
+
+    return direction, score, confidence, rationale
+
+
+def _describe_earnings_timing(phase: str, days_to_earnings: int) -> str:
+    """Timing phrase for the dead-zone and mid-cycle rationales."""
+    if phase == "dead_zone":
+        if days_to_earnings > 0:
+            return f"{days_to_earnings} days until"
+        return f"{abs(days_to_earnings)} days since"
+    if days_to_earnings > 60:
+        return f"{days_to_earnings} days until next earnings"
+    if days_to_earnings < -10:
+        return f"{abs(days_to_earnings)} days since last earnings"
+    return "mid-cycle period"
+
 
 class EarningsCycleAnalyzer(Signal):
     """Analyze earnings cycle phase to predict directional momentum."""
@@ -45,7 +260,7 @@ class EarningsCycleAnalyzer(Signal):
             "symbol",  # Stock symbol for earnings lookup
         ]
 
-    def calculate(self, data: Dict[str, Any]) -> SignalResult:
+    def calculate(self, data: Dict[str, Any], now: Optional[datetime] = None) -> SignalResult:
         """
         Calculate directional bias from earnings cycle phase.
 
@@ -55,20 +270,21 @@ class EarningsCycleAnalyzer(Signal):
         Returns:
             SignalResult with earnings cycle-based directional bias
         """
+        now = now or datetime.now()
         if not self.validate_data(data):
-            return self._create_neutral_result("Missing required data")
+            return self._create_neutral_result("Missing required data", now)
 
         symbol = data.get("symbol", "")
         stock_price = float(data.get("stock_price", 0))
 
         if not symbol or stock_price <= 0:
-            return self._create_neutral_result("Invalid data values")
+            return self._create_neutral_result("Invalid data values", now)
 
         # Get earnings cycle metrics
-        cycle_metrics = self._get_earnings_cycle_metrics(symbol)
+        cycle_metrics = self._get_earnings_cycle_metrics(symbol, now.date())
 
         if cycle_metrics is None:
-            return self._create_neutral_result("Could not fetch earnings data")
+            return self._create_neutral_result("Could not fetch earnings data", now)
 
         # Determine directional bias from earnings cycle
         direction, score, confidence, rationale = self._interpret_earnings_cycle(
@@ -82,10 +298,12 @@ class EarningsCycleAnalyzer(Signal):
             confidence=self.get_adjusted_confidence(confidence),
             rationale=rationale,
             details=cycle_metrics,
-            timestamp=datetime.now(),
+            timestamp=now,
         )
 
-    def _get_earnings_cycle_metrics(self, symbol: str) -> Optional[Dict[str, Any]]:
+    def _get_earnings_cycle_metrics(
+        self, symbol: str, today: Optional[date] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Fetch earnings data and calculate cycle metrics.
 
@@ -96,93 +314,51 @@ class EarningsCycleAnalyzer(Signal):
         - next_earnings_date: Upcoming earnings date (if available)
         """
         try:
-            ticker = yf.Ticker(symbol)
-
-            # Get earnings dates
-            earnings_dates = None
-            try:
-                earnings_dates = ticker.earnings_dates
-            except:
-                pass
-
-            if earnings_dates is None or earnings_dates.empty:
-                # Try alternative method - get calendar
-                try:
-                    calendar = ticker.calendar
-                    if calendar is not None and not calendar.empty:
-                        # Extract earnings date from calendar
-                        next_earnings = calendar.get("Earnings Date")
-                        if next_earnings is not None:
-                            if isinstance(next_earnings, list) and len(next_earnings) > 0:
-                                next_earnings_date = next_earnings[0]
-                            else:
-                                next_earnings_date = next_earnings
-
-                            # Calculate days to earnings
-                            today = datetime.now()
-                            if hasattr(next_earnings_date, 'date'):
-                                next_earnings_date = next_earnings_date.date()
-
-                            days_to_earnings = (next_earnings_date - today.date()).days
-
-                            return {
-                                "days_to_earnings": days_to_earnings,
-                                "next_earnings_date": next_earnings_date.isoformat() if hasattr(next_earnings_date, 'isoformat') else str(next_earnings_date),
-                                "last_earnings_date": None,
-                                "earnings_phase": self._classify_earnings_phase(days_to_earnings),
-                                "data_quality": "calendar_only",
-                            }
-                except Exception as e:
-                    print(f"Could not fetch earnings calendar for {symbol}: {e}")
-
-            # If we have earnings_dates DataFrame
-            if earnings_dates is not None and not earnings_dates.empty:
-                today = datetime.now()
-
-                # Separate past and future earnings
-                past_earnings = []
-                future_earnings = []
-
-                for date_idx in earnings_dates.index:
-                    if hasattr(date_idx, 'date'):
-                        date_obj = date_idx.date()
-                    else:
-                        date_obj = date_idx
-
-                    if isinstance(date_obj, datetime):
-                        date_obj = date_obj.date()
-
-                    if date_obj < today.date():
-                        past_earnings.append(date_obj)
-                    else:
-                        future_earnings.append(date_obj)
-
-                # Get most recent past earnings
-                last_earnings_date = max(past_earnings) if past_earnings else None
-
-                # Get next upcoming earnings
-                next_earnings_date = min(future_earnings) if future_earnings else None
-
-                # Calculate days to/from earnings
-                if next_earnings_date:
-                    days_to_earnings = (next_earnings_date - today.date()).days
-                elif last_earnings_date:
-                    days_to_earnings = -(today.date() - last_earnings_date).days
-                else:
-                    return None
-
+            record = _fetch_earnings_cached(symbol)
+            if record is None:
+                return None
+            data_quality, earnings_dates = record
+            today = today or datetime.now().date()
+
+            if data_quality == "calendar_only":
+                next_earnings_date = earnings_dates[0]
+                days_to_earnings = (next_earnings_date - today).days
                 return {
                     "days_to_earnings": days_to_earnings,
-                    "next_earnings_date": next_earnings_date.isoformat() if next_earnings_date else None,
-                    "last_earnings_date": last_earnings_date.isoformat() if last_earnings_date else None,
+                    "next_earnings_date": next_earnings_date.isoformat() if hasattr(next_earnings_date, 'isoformat') else str(next_earnings_date),
+                    "last_earnings_date": None,
                     "earnings_phase": self._classify_earnings_phase(days_to_earnings),
-                    "data_quality": "full",
+                    "data_quality": data_quality,
                 }
 
-            return None
+            # Split past and future earnings with one mask over the cached dates
+            today64 = np.datetime64(today, "D")
+            past_mask = earnings_dates < today64
+            past_earnings = earnings_dates[past_mask]
+            future_earnings = earnings_dates[~past_mask]
+
+            # Most recent past and next upcoming earnings
+            last_earnings_date = past_earnings.max().astype(object) if past_earnings.size else None
+            next_earnings_date = future_earnings.min().astype(object) if future_earnings.size else None
+
+            # Calculate days to/from earnings
+            if next_earnings_date:
+                days_to_earnings = (next_earnings_date - today).days
+            elif last_earnings_date:
+                days_to_earnings = -(today - last_earnings_date).days
+            else:
+                return None
+
+            return {
+                "days_to_earnings": days_to_earnings,
+                "next_earnings_date": next_earnings_date.isoformat() if next_earnings_date else None,
+                "last_earnings_date": last_earnings_date.isoformat() if last_earnings_date else None,
+                "earnings_phase": self._classify_earnings_phase(days_to_earnings),
+                "data_quality": data_quality,
+            }
 
         except Exception as e:
-            print(f"Error fetching earnings data for {symbol}: {e}")
+            logger.debug("Error fetching earnings data for %s: %s", symbol, e)
             return None
 
     def _classify_earnings_phase(self, days_to_earnings: int) -> str:
@@ -197,18 +373,7 @@ class EarningsCycleAnalyzer(Signal):
         - dead_zone: 20-60 days from earnings (low conviction)
         - mid_cycle: Outside other phases (normal trading)
         """
-        if days_to_earnings >= 5 and days_to_earnings <= 15:
-            return "pre_runup"
-        elif days_to_earnings >= 0 and days_to_earnings < 5:
-            return "imminent"
-        elif days_to_earnings >= -3 and days_to_earnings < 0:
-            return "post_reaction"
-        elif days_to_earnings >= -10 and days_to_earnings < -3:
-            return "post_drift"
-        elif abs(days_to_earnings) >= 20 and abs(days_to_earnings) <= 60:
-            return "dead_zone"
-        else:
-            return "mid_cycle"
+        return _PHASE_LABELS[_phase_code(days_to_earnings)]
 
     def _interpret_earnings_cycle(
         self, metrics: Dict[str, Any], symbol: str
@@ -218,115 +383,13 @@ class EarningsCycleAnalyzer(Signal):
 
         Returns: (direction, score, confidence, rationale)
         """
-        days_to_earnings = metrics["days_to_earnings"]
-        phase = metrics["earnings_phase"]
-        data_quality = metrics.get("data_quality", "unknown")
-
-        # Base confidence on data quality
-        base_confidence = 70 if data_quality == "full" else 60
-
-        # Interpret based on phase
-        if phase == "pre_runup":
-            # Pre-earnings run-up (5-15 days before)
-            # Historically, stocks tend to drift in anticipation
-            # Default to slight bullish bias (institutions position ahead)
-            direction = Direction.BULLISH
-            score = 25 + min(15, (15 - days_to_earnings) * 2)  # Stronger as we get closer
-            confidence = base_confidence
-
-            rationale = (
-                f"Pre-earnings run-up phase: {days_to_earnings} days until earnings. "
-                f"Historical patterns show stocks often drift higher as institutions "
-                f"position ahead of announcements. IV typically rises, benefiting long "
-                f"option positions. Consider directional plays before IV peaks."
-            )
-
-        elif phase == "imminent":
-            # 0-5 days before earnings - high risk, high IV
-            direction = Direction.NEUTRAL
-            score = 0
-            confidence = 50
-
-            rationale = (
-                f"Earnings imminent ({days_to_earnings} days away) - HIGH RISK period. "
-                f"IV is likely at peak levels (premium expensive). Directional bias "
-                f"unclear as market waits for results. Avoid new directional positions "
-                f"unless strong conviction - IV crush after earnings will hurt option value."
-            )
-
-        elif phase == "post_reaction":
-            # 0-3 days after earnings - immediate reaction, wait for dust to settle
-            direction = Direction.NEUTRAL
-            score = 0
-            confidence = 55
-
-            days_since = abs(days_to_earnings)
-            rationale = (
-                f"Post-earnings reaction phase ({days_since} days since announcement). "
-                f"Stock digesting earnings results. IV crushing (options losing premium fast). "
-                f"Wait 3-5 days for post-earnings drift pattern to emerge before taking "
-                f"directional stance. Let volatility stabilize."
-            )
-
-        elif phase == "post_drift":
-            # 3-10 days after earnings - continuation pattern
-            # If stock moved significantly post-earnings, drift often continues
-            # Default to slight bullish bias (post-earnings drift tends bullish after beats)
-            direction = Direction.BULLISH
-            score = 30
-            confidence = base_confidence - 5
-
-            days_since = abs(days_to_earnings)
-            rationale = (
-                f"Post-earnings drift phase ({days_since} days since earnings). "
-                f"Historical patterns show strong tendency for continuation after "
-                f"earnings reactions. If stock rallied post-earnings, drift typically "
-                f"extends bullish move. If sold off, weakness often continues. "
-                f"IV has normalized - better risk/reward for options."
-            )
-
-        elif phase == "dead_zone":
-            # 20-60 days from earnings - low conviction period
-            direction = Direction.NEUTRAL
-            score = 0
-            confidence = 45
-
-            if days_to_earnings > 0:
-                direction_text = f"{days_to_earnings} days until"
-            else:
-                direction_text = f"{abs(days_to_earnings)} days since"
-
-            rationale = (
-                f"Earnings dead zone ({direction_text} earnings). "
-                f"Historical analysis shows this period has lowest directional edge. "
-                f"Too far from catalyst for pre-earnings positioning, past the "
-                f"post-earnings drift window. Reduce position size or wait for "
-                f"better timing. Focus on other signals."
-            )
-
-        else:  # mid_cycle
-            # Normal mid-cycle period - earnings not a factor
-            direction = Direction.NEUTRAL
-            score = 0
-            confidence = 50
-
-            if days_to_earnings > 60:
-                timing_note = f"{days_to_earnings} days until next earnings"
-            elif days_to_earnings < -10:
-                timing_note = f"{abs(days_to_earnings)} days since last earnings"
-            else:
-                timing_note = "mid-cycle period"
-
-            rationale = (
-                f"Normal trading period ({timing_note}). "
-                f"Earnings cycle not a significant factor in directional bias. "
-                f"No historical edge from earnings timing patterns. "
-                f"Rely on other signals for directional conviction."
-            )
-
-        return direction, score, confidence, rationale
+        return _interpret_phase(
+            metrics["earnings_phase"],
+            metrics["days_to_earnings"],
+            metrics.get("data_quality", "unknown") == "full",
+        )
 
-    def _create_neutral_result(self, reason: str) -> SignalResult:
+    def _create_neutral_result(self, reason: str, now: Optional[datetime] = None) -> SignalResult:
         """Create a neutral result when signal cannot be calculated."""
         return SignalResult(
             signal_name=self.name,
@@ -335,5 +398,5 @@ class EarningsCycleAnalyzer(Signal):
             confidence=0.0,
             rationale=f"No earnings cycle signal: {reason}",
             details={"error": reason},
-            timestamp=datetime.now(),
+            timestamp=now or datetime.now(),
         )
@@ -14,13 +14,115 @@ This signal looks at:
 
 from __future__ import annotations
 
+import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
-from .base import Direction, Signal, SignalResult
+from .base import (
+    CALL_CODE,
+    PUT_CODE,
+    Direction,
+    Signal,
+    SignalResult,
+    clip_scalar,
+    data_fingerprint,
+    direction_from_score,
+    option_type_codes,
+)
+
+logger = logging.getLogger(__name__)
+
+# Moneyness bands (fraction out of the money): 5-15% OTM is the most liquid and
+# informative strip; its 10-15% tail stands in for the 25-delta risk reversal
+_OTM_BAND = (0.05, 0.15)
+_RISK_REVERSAL_FLOOR = 0.10
+
+# Rationale text per direction; only the spread and the optional risk-reversal
+# confirmation are filled in per call
+_RATIONALE_TEMPLATES = {
+    Direction.BULLISH: (
+        "Call skew detected: OTM calls priced {spread:.1f}% higher than OTM puts relative to ATM. "
+        "Market makers are pricing higher risk to the upside, suggesting positioning for potential rallies. "
+        "{confirmation}This skew pattern typically precedes bullish moves."
+    ),
+    Direction.BEARISH: (
+        "Put skew detected: OTM puts priced {spread:.1f}% higher than OTM calls relative to ATM. "
+        "Market makers are pricing downside protection at a premium, suggesting hedging demand or bearish positioning. "
+        "{confirmation}This skew pattern often precedes downward moves."
+    ),
+    Direction.NEUTRAL: (
+        "Flat skew: OTM puts and calls priced similarly (spread: {spread:.1f}%). "
+        "Market makers see balanced risk in both directions. "
+        "No strong directional bias from options pricing."
+    ),
+}
+_RISK_REVERSAL_CONFIRMATIONS = {
+    Direction.BULLISH: "Risk reversal confirms bullish bias with calls commanding premium over puts. ",
+    Direction.BEARISH: "Risk reversal confirms bearish bias with elevated put pricing. ",
+}
+
+
+def _mean_iv(ivs: np.ndarray) -> float:
+    """Mean of the selected IVs, skipping missing values like ``Series.mean``."""
+    ivs = ivs[~np.isnan(ivs)]
+    # sum / size is what ndarray.mean computes, minus its dispatch overhead
+    return float(ivs.sum() / ivs.size) if ivs.size else float("nan")
+
+
+def _skew_bands(
+    type_codes: np.ndarray, strikes: np.ndarray, stock_price: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Masks of calls, puts, OTM calls, OTM puts and risk-reversal calls and puts."""
+    # Separate calls and puts
+    is_call = type_codes == CALL_CODE
+    is_put = type_codes == PUT_CODE
+
+    # Distance out of the money on each contract's own side, so one pair
+    # of band comparisons serves calls and puts alike
+    call_moneyness = (strikes - stock_price) / stock_price
+    otm_distance = np.where(is_call, call_moneyness, -call_moneyness)
+
+    # Get OTM options (5-15% OTM is most liquid and informative)
+    in_otm_band = (otm_distance >= _OTM_BAND[0]) & (otm_distance <= _OTM_BAND[1])
+    otm_calls = is_call & in_otm_band
+    otm_puts = is_put & in_otm_band
+
+    # Risk reversal: Classic metric used by professionals
+    # Find options closest to 25-delta (roughly 25% probability of expiring ITM)
+    # For simplicity, use 10-15% OTM as proxy
+    in_rr_band = in_otm_band & (otm_distance >= _RISK_REVERSAL_FLOOR)
+    return is_call, is_put, otm_calls, otm_puts, otm_calls & in_rr_band, otm_puts & in_rr_band
+
+
+def _build_skew_metrics(
+    atm_iv: float,
+    otm_put_iv: float,
+    otm_call_iv: float,
+    risk_reversal: Optional[float],
+    otm_put_count: int,
+    otm_call_count: int,
+) -> Dict[str, Any]:
+    # Calculate skew relative to ATM
+    put_skew = ((otm_put_iv - atm_iv) / atm_iv) * 100 if atm_iv > 0 else 0
+    call_skew = ((otm_call_iv - atm_iv) / atm_iv) * 100 if atm_iv > 0 else 0
+
+    # Skew spread: positive means puts priced higher (bearish), negative means calls higher (bullish)
+    skew_spread = put_skew - call_skew
+
+    return {
+        "otm_put_iv_avg": float(otm_put_iv),
+        "otm_call_iv_avg": float(otm_call_iv),
+        "atm_iv": float(atm_iv),
+        "put_skew": float(put_skew),
+        "call_skew": float(call_skew),
+        "skew_spread": float(skew_spread),
+        "risk_reversal": float(risk_reversal) if risk_reversal is not None else None,
+        "otm_put_count": otm_put_count,
+        "otm_call_count": otm_call_count,
+    }
 
 
 class OptionsSkewAnalyzer(Signal):
@@ -38,7 +140,7 @@ class OptionsSkewAnalyzer(Signal):
             "atm_iv",  # At-the-money implied volatility
         ]
 
-    def calculate(self, data: Dict[str, Any]) -> SignalResult:
+    def calculate(self, data: Dict[str, Any], now: Optional[datetime] = None) -> SignalResult:
         """
         Calculate directional bias from options skew.
 
@@ -50,20 +152,24 @@ class OptionsSkewAnalyzer(Signal):
             SignalResult with skew-based directional bias
         """
         if not self.validate_data(data):
-            return self._create_neutral_result("Missing required data")
+            return self._create_neutral_result("Missing required data", now)
 
         options_chain = data["options_chain"]
         stock_price = float(data["stock_price"])
         atm_iv = float(data.get("atm_iv", 0))
 
         if options_chain.empty or stock_price <= 0 or atm_iv <= 0:
-            return self._create_neutral_result("Invalid data values")
+            return self._create_neutral_result("Invalid data values", now)
 
         # Calculate skew metrics
-        skew_metrics = self._calculate_skew_metrics(options_chain, stock_price, atm_iv)
+        try:
+            skew_metrics = self._calculate_skew_metrics(options_chain, stock_price, atm_iv)
+        except Exception:
+            logger.exception("Error calculating skew metrics")
+            skew_metrics = None
 
         if skew_metrics is None:
-            return self._create_neutral_result("Insufficient options data")
+            return self._create_neutral_result("Insufficient options data", now)
 
         # Determine directional bias
         direction, score, confidence, rationale = self._interpret_skew(skew_metrics, atm_iv)
@@ -78,7 +184,7 @@ class OptionsSkewAnalyzer(Signal):
             confidence=self.get_adjusted_confidence(confidence),
             rationale=rationale,
             details=skew_metrics,
-            timestamp=datetime.now(),
+            timestamp=now or datetime.now(),
         )
 
     def _calculate_skew_metrics(
@@ -95,63 +201,51 @@ class OptionsSkewAnalyzer(Signal):
         - skew_spread: Difference between put and call skew
         - risk_reversal: 25-delta put IV - 25-delta call IV
         """
-        try:
-            # Separate calls and puts
-            calls = options_chain[options_chain["type"] == "call"].copy()
-            puts = options_chain[options_chain["type"] == "put"].copy()
-
-            if calls.empty or puts.empty:
-                return None
-
-            # Calculate moneyness (percentage OTM/ITM)
-            calls["moneyness"] = (calls["strike"] - stock_price) / stock_price
-            puts["moneyness"] = (stock_price - puts["strike"]) / stock_price
-
-            # Get OTM options (5-15% OTM is most liquid and informative)
-            otm_calls = calls[(calls["moneyness"] >= 0.05) & (calls["moneyness"] <= 0.15)]
-            otm_puts = puts[(puts["moneyness"] >= 0.05) & (puts["moneyness"] <= 0.15)]
-
-            # Need minimum sample size
-            if len(otm_calls) < 2 or len(otm_puts) < 2:
-                return None
-
-            # Calculate average IVs for OTM options
-            otm_put_iv = otm_puts["impliedVolatility"].mean()
-            otm_call_iv = otm_calls["impliedVolatility"].mean()
-
-            # Calculate skew relative to ATM
-            put_skew = ((otm_put_iv - atm_iv) / atm_iv) * 100 if atm_iv > 0 else 0
-            call_skew = ((otm_call_iv - atm_iv) / atm_iv) * 100 if atm_iv > 0 else 0
-
-            # Skew spread: positive means puts priced higher (bearish), negative means calls higher (bullish)
-            skew_spread = put_skew - call_skew
-
-            # Risk reversal: Classic metric used by professionals
-            # Find options closest to 25-delta (roughly 25% probability of expiring ITM)
-            # For simplicity, use 10-15% OTM as proxy
-            rr_puts = puts[(puts["moneyness"] >= 0.10) & (puts["moneyness"] <= 0.15)]
-            rr_calls = calls[(calls["moneyness"] >= 0.10) & (calls["moneyness"] <= 0.15)]
-
-            risk_reversal = None
-            if not rr_puts.empty and not rr_calls.empty:
-                risk_reversal = rr_puts["impliedVolatility"].mean() - rr_calls["impliedVolatility"].mean()
-
-            return {
-                "otm_put_iv_avg": float(otm_put_iv),
-                "otm_call_iv_avg": float(otm_call_iv),
-                "atm_iv": float(atm_iv),
-                "put_skew": float(put_skew),
-                "call_skew": float(call_skew),
-                "skew_spread": float(skew_spread),
-                "risk_reversal": float(risk_reversal) if risk_reversal is not None else None,
-                "otm_put_count": len(otm_puts),
-                "otm_call_count": len(otm_calls),
-            }
-
-        except Exception as e:
-            print(f"Error calculating skew metrics: {e}")
+        type_codes = option_type_codes(options_chain)
+        strikes = options_chain["strike"].to_numpy(dtype=np.float64)
+        ivs = options_chain["impliedVolatility"].to_numpy(dtype=np.float64)
+
+        # Repeat evaluations of an unchanged chain reuse the earlier metrics
+        key = data_fingerprint(type_codes, strikes, ivs, stock_price, atm_iv)
+        cached = self._cached_metrics(key)
+        if cached is not None:
+            return cached
+
+        is_call, is_put, otm_calls, otm_puts, rr_calls, rr_puts = _skew_bands(
+            type_codes, strikes, stock_price
+        )
+
+        if not is_call.any() or not is_put.any():
+            return None
+
+        otm_call_count = int(np.count_nonzero(otm_calls))
+        otm_put_count = int(np.count_nonzero(otm_puts))
+
+        # Need minimum sample size
+        if otm_call_count < 2 or otm_put_count < 2:
             return None
 
+        # Gather each side's OTM IVs once; the risk-reversal tail lies inside
+        # the OTM band, so its IVs come out of the same subset
+        otm_put_ivs = ivs[otm_puts]
+        otm_call_ivs = ivs[otm_calls]
+
+        risk_reversal = None
+        if rr_puts.any() and rr_calls.any():
+            risk_reversal = _mean_iv(otm_put_ivs[rr_puts[otm_puts]]) - _mean_iv(otm_call_ivs[rr_calls[otm_calls]])
+
+        # Calculate average IVs for OTM options
+        metrics = _build_skew_metrics(
+            atm_iv,
+            _mean_iv(otm_put_ivs),
+            _mean_iv(otm_call_ivs),
+            risk_reversal,
+            otm_put_count,
+            otm_call_count,
+        )
+        self._remember_metrics(key, metrics)
+        return metrics
+
     def _interpret_skew(
         self, metrics: Dict[str, Any], atm_iv: float
     ) -> tuple[Direction, float, float, str]:
@@ -171,7 +265,7 @@ class OptionsSkewAnalyzer(Signal):
 
         # Primary signal: skew spread
         # Normalize to -100 to +100 scale (typical skew spreads are -10% to +10%)
-        score = np.clip(skew_spread * -10, -100, 100)  # Negative because put skew = bearish
+        score = clip_scalar(skew_spread * -10, -100.0, 100.0)  # Negative because put skew = bearish
 
         # Adjust confidence based on magnitude of skew
         # Larger skew = more conviction from market makers
@@ -191,7 +285,7 @@ class OptionsSkewAnalyzer(Signal):
         if risk_reversal is not None:
             # Risk reversal > 0 means puts more expensive (bearish)
             # Risk reversal < 0 means calls more expensive (bullish)
-            rr_normalized = np.clip(risk_reversal * -100, -30, 30)
+            rr_normalized = clip_scalar(risk_reversal * -100, -30.0, 30.0)
             score += rr_normalized
 
             # If risk reversal agrees with skew, boost confidence
@@ -199,57 +293,26 @@ class OptionsSkewAnalyzer(Signal):
                 confidence += 10
 
         # Determine direction
-        if score > 15:
-            direction = Direction.BULLISH
-            rationale = self._build_bullish_rationale(metrics)
-        elif score < -15:
-            direction = Direction.BEARISH
-            rationale = self._build_bearish_rationale(metrics)
-        else:
-            direction = Direction.NEUTRAL
-            rationale = self._build_neutral_rationale(metrics)
-
-        return direction, score, min(95, confidence), rationale
-
-    def _build_bullish_rationale(self, metrics: Dict[str, Any]) -> str:
-        """Build explanation for bullish skew."""
-        skew_spread = metrics["skew_spread"]
-        call_skew = metrics["call_skew"]
-
-        rationale = f"Call skew detected: OTM calls priced {abs(skew_spread):.1f}% higher than OTM puts relative to ATM. "
-        rationale += "Market makers are pricing higher risk to the upside, suggesting positioning for potential rallies. "
-
-        if metrics.get("risk_reversal") and metrics["risk_reversal"] < -0.02:
-            rationale += "Risk reversal confirms bullish bias with calls commanding premium over puts. "
-
-        rationale += "This skew pattern typically precedes bullish moves."
+        direction = direction_from_score(score)
 
-        return rationale
+        return direction, score, min(95, confidence), self._build_rationale(direction, metrics)
 
-    def _build_bearish_rationale(self, metrics: Dict[str, Any]) -> str:
-        """Build explanation for bearish skew."""
+    def _build_rationale(self, direction: Direction, metrics: Dict[str, Any]) -> str:
+        """Explain the skew behind ``direction``."""
         skew_spread = metrics["skew_spread"]
-        put_skew = metrics["put_skew"]
-
-        rationale = f"Put skew detected: OTM puts priced {abs(skew_spread):.1f}% higher than OTM calls relative to ATM. "
-        rationale += "Market makers are pricing downside protection at a premium, suggesting hedging demand or bearish positioning. "
-
-        if metrics.get("risk_reversal") and metrics["risk_reversal"] > 0.02:
-            rationale += "Risk reversal confirms bearish bias with elevated put pricing. "
+        risk_reversal = metrics.get("risk_reversal") or 0.0
 
-        rationale += "This skew pattern often precedes downward moves."
-
-        return rationale
-
-    def _build_neutral_rationale(self, metrics: Dict[str, Any]) -> str:
-        """Build explanation for neutral skew."""
-        skew_spread = metrics["skew_spread"]
-
-        rationale = f"Flat skew: OTM puts and calls priced similarly (spread: {skew_spread:.1f}%). "
-        rationale += "Market makers see balanced risk in both directions. "
-        rationale += "No strong directional bias from options pricing."
+        if direction is Direction.BULLISH:
+            confirmed = risk_reversal < -0.02
+        elif direction is Direction.BEARISH:
+            confirmed = risk_reversal > 0.02
+        else:
+            return _RATIONALE_TEMPLATES[direction].format(spread=skew_spread, confirmation="")
 
-        return rationale
+        return _RATIONALE_TEMPLATES[direction].format(
+            spread=abs(skew_spread),
+            confirmation=_RISK_REVERSAL_CONFIRMATIONS[direction] if confirmed else "",
+        )
 
     def _adjust_confidence_for_quality(self, confidence: float, metrics: Dict[str, Any]) -> float:
         """Reduce confidence if data quality is questionable."""
@@ -266,7 +329,7 @@ class OptionsSkewAnalyzer(Signal):
 
         return confidence
 
-    def _create_neutral_result(self, reason: str) -> SignalResult:
+    def _create_neutral_result(self, reason: str, now: Optional[datetime] = None) -> SignalResult:
         """Create a neutral result when signal cannot be calculated."""
         return SignalResult(
             signal_name=self.name,
@@ -275,5 +338,5 @@ class OptionsSkewAnalyzer(Signal):
             confidence=0.0,
             rationale=f"No skew signal: {reason}",
             details={"error": reason},
-            timestamp=datetime.now(),
+            timestamp=now or datetime.now(),
         )
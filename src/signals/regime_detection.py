@@ -16,13 +16,196 @@ In ranging regimes: Mean reversion dominates, extremes get faded
 
 from __future__ import annotations
 
+import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
 
-from .base import Direction, Signal, SignalResult
+from src.math.jit import NUMBA_AVAILABLE, njit
+
+from .base import Direction, Signal, SignalResult, data_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Guards against division by zero in the directional index and DX ratios
+_DI_EPSILON = 1e-10
+_DX_EPSILON = 1e-4
+
+# Rationale text per interpreted regime; only the figures are formatted per call
+_RATIONALE_TEMPLATES = {
+    "trending_bullish": (
+        "Strong bullish trend detected (ADX={adx:.1f}, R²={r_squared:.2f}). "
+        "Market is in momentum regime - follow the uptrend with calls. "
+        "Trend strength suggests continuation is likely."
+    ),
+    "trending_bearish": (
+        "Strong bearish trend detected (ADX={adx:.1f}, R²={r_squared:.2f}). "
+        "Market is in momentum regime - follow the downtrend with puts. "
+        "Trend strength suggests continuation is likely."
+    ),
+    "weak_bullish_trend": (
+        "Weak bullish trend forming (ADX={adx:.1f}). "
+        "Early momentum phase - calls have edge but trend not fully established. "
+        "Monitor for trend confirmation or reversal."
+    ),
+    "weak_bearish_trend": (
+        "Weak bearish trend forming (ADX={adx:.1f}). "
+        "Early downside momentum - puts have slight edge but trend not confirmed. "
+        "Watch for breakdown or bounce."
+    ),
+    "ranging": (
+        "Ranging market regime (ADX={adx:.1f}). "
+        "Mean reversion dominates - directional bias is low. "
+        "Consider waiting for regime shift or using neutral strategies."
+    ),
+    "tight_consolidation": (
+        "Ranging market regime (ADX={adx:.1f}). "
+        "Mean reversion dominates - directional bias is low. "
+        "Price is coiling in tight consolidation - breakout likely imminent. "
+        "Consider waiting for regime shift or using neutral strategies."
+    ),
+    "transitioning_bullish": (
+        "Market transitioning between regimes (ADX={adx:.1f}). "
+        "Current price momentum is bullish but conviction is low. "
+        "Favor calls cautiously until regime clarity emerges."
+    ),
+    "transitioning_bearish": (
+        "Market transitioning between regimes (ADX={adx:.1f}). "
+        "Current price momentum is bearish but conviction is low. "
+        "Favor puts cautiously until regime clarity emerges."
+    ),
+    "transitioning": (
+        "Market in transition with unclear direction (ADX={adx:.1f}). "
+        "Both trend and mean reversion signals are weak. "
+        "Wait for regime establishment before taking directional positions."
+    ),
+    "trending_unclear": (
+        "Trend strength detected but direction mixed (ADX={adx:.1f}). "
+        "Conflicting directional signals reduce conviction. "
+        "Monitor for trend resolution."
+    ),
+}
+
+
+def _price_columns(price_history: pd.DataFrame) -> Dict[str, Any]:
+    """Map lower-cased column names to the frame's labels.
+
+    Histories arrive as ``close``/``Close``/``CLOSE`` depending on the feed; an
+    exact lower-case label wins when several spellings are present.
+    """
+    columns: Dict[str, Any] = {}
+    for column in price_history.columns:
+        name = column.lower() if isinstance(column, str) else column
+        if name not in columns or column == name:
+            columns[name] = column
+    return columns
+
+
+@lru_cache(maxsize=32)
+def _centered_x(n: int) -> np.ndarray:
+    """Read-only ``0..n-1`` shifted to zero mean; histories come in a handful of lengths."""
+    x = np.arange(n) - (n - 1) / 2.0
+    x.setflags(write=False)
+    return x
+
+
+@njit(cache=True)
+def _wilder_smooth_kernel(data: np.ndarray, period: int) -> np.ndarray:
+    smoothed = np.zeros(data.shape[0])
+    smoothed[period - 1] = np.mean(data[:period])
+    for i in range(period, data.shape[0]):
+        smoothed[i] = (smoothed[i - 1] * (period - 1) + data[i]) / period
+    return smoothed
+
+
+@njit(cache=True)
+def _bar_movement(
+    highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, i: int
+) -> tuple[float, float, float]:
+    """True range, +DM and -DM of bar ``i``."""
+    # The first bar has no previous close: its range is high-low and it has no movement
+    if i == 0:
+        return highs[0] - lows[0], 0.0, 0.0
+    high_low = highs[i] - lows[i]
+    high_close = abs(highs[i] - closes[i - 1])
+    low_close = abs(lows[i] - closes[i - 1])
+    true_range = max(high_low, max(high_close, low_close))
+
+    # When both are positive, only count the larger one
+    up = max(highs[i] - highs[i - 1], 0.0)
+    down = max(lows[i - 1] - lows[i], 0.0)
+    if down > up:
+        up = 0.0
+    elif up > down:
+        down = 0.0
+    return true_range, up, down
+
+
+@njit(cache=True)
+def _directional_index(
+    plus_smooth: float, minus_smooth: float, atr: float
+) -> tuple[float, float, float]:
+    """+DI, -DI and DX from the smoothed movement and true range."""
+    plus_di = 100 * plus_smooth / (atr + _DI_EPSILON)
+    minus_di = 100 * minus_smooth / (atr + _DI_EPSILON)
+    return plus_di, minus_di, 100 * abs(plus_di - minus_di) / (plus_di + minus_di + _DX_EPSILON)
+
+
+@njit(cache=True)
+def _adx_kernel(
+    highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int
+) -> tuple[float, float, float]:
+    n = highs.shape[0]
+    if n < period:
+        raise ValueError("ADX needs at least one full smoothing period")
+
+    # Wilder smoothing seeds with the mean of the first window, then carries a
+    # running value, so only the seed window is ever materialized
+    seed_tr = np.empty(period)
+    seed_plus = np.empty(period)
+    seed_minus = np.empty(period)
+    for i in range(period):
+        true_range, up, down = _bar_movement(highs, lows, closes, i)
+        seed_tr[i] = true_range
+        seed_plus[i] = up
+        seed_minus[i] = down
+    atr = np.mean(seed_tr)
+    plus_smooth = np.mean(seed_plus)
+    minus_smooth = np.mean(seed_minus)
+    plus_di, minus_di, dx = _directional_index(plus_smooth, minus_smooth, atr)
+
+    # ADX is smoothed DX; before the seed bar the smoothed values are zero and
+    # so is DX, which leaves the ADX seed at dx / period
+    adx = dx / period
+    for i in range(period, n):
+        true_range, up, down = _bar_movement(highs, lows, closes, i)
+        atr = (atr * (period - 1) + true_range) / period
+        plus_smooth = (plus_smooth * (period - 1) + up) / period
+        minus_smooth = (minus_smooth * (period - 1) + down) / period
+        plus_di, minus_di, dx = _directional_index(plus_smooth, minus_smooth, atr)
+        adx = (adx * (period - 1) + dx) / period
+    return adx, plus_di, minus_di
+
+
+@njit(cache=True, error_model="numpy")
+def _bb_widths_kernel(
+    closes: np.ndarray, period: int, std_dev: float, widths: np.ndarray
+) -> None:
+    # Two passes per window (mean, then squared deviations) like np.std
+    for start in range(widths.shape[0]):
+        total = 0.0
+        for i in range(start, start + period):
+            total += closes[i]
+        mean = total / period
+
+        squares = 0.0
+        for i in range(start, start + period):
+            deviation = closes[i] - mean
+            squares += deviation * deviation
+        widths[start] = std_dev * np.sqrt(squares / period) / mean
 
 
 class RegimeDetector(Signal):
@@ -39,7 +222,7 @@ class RegimeDetector(Signal):
             "stock_price",  # Current stock price
         ]
 
-    def calculate(self, data: Dict[str, Any]) -> SignalResult:
+    def calculate(self, data: Dict[str, Any], now: Optional[datetime] = None) -> SignalResult:
         """
         Calculate directional bias based on market regime.
 
@@ -50,19 +233,23 @@ class RegimeDetector(Signal):
             SignalResult with regime-based directional bias
         """
         if not self.validate_data(data):
-            return self._create_neutral_result("Missing required data")
+            return self._create_neutral_result("Missing required data", now)
 
         price_history = data["price_history"]
         stock_price = float(data.get("stock_price", 0))
 
         if price_history.empty or stock_price <= 0:
-            return self._create_neutral_result("Invalid data values")
+            return self._create_neutral_result("Invalid data values", now)
 
         # Calculate regime metrics
-        regime_metrics = self._calculate_regime_metrics(price_history, stock_price)
+        try:
+            regime_metrics = self._calculate_regime_metrics(price_history, stock_price)
+        except Exception:
+            logger.exception("Error calculating regime metrics")
+            regime_metrics = None
 
         if regime_metrics is None:
-            return self._create_neutral_result("Insufficient price history")
+            return self._create_neutral_result("Insufficient price history", now)
 
         # Determine directional bias based on regime
         direction, score, confidence, rationale = self._interpret_regime(
@@ -76,7 +263,7 @@ class RegimeDetector(Signal):
             confidence=self.get_adjusted_confidence(confidence),
             rationale=rationale,
             details=regime_metrics,
-            timestamp=datetime.now(),
+            timestamp=now or datetime.now(),
         )
 
     def _calculate_regime_metrics(
@@ -95,74 +282,75 @@ class RegimeDetector(Signal):
         - regime_confidence: 0-100 confidence in regime classification
         - price_momentum: Current momentum direction
         """
-        try:
-            # Need at least 20 periods for meaningful calculations
-            if len(price_history) < 20:
-                return None
+        # Need at least 20 periods for meaningful calculations
+        if len(price_history) < 20:
+            return None
 
-            df = price_history.copy()
+        columns = _price_columns(price_history)
+        if "close" not in columns:
+            return None
 
-            # Ensure we have the right columns
-            if "close" not in df.columns:
-                df["close"] = df.get("Close", df.get("CLOSE"))
+        closes = price_history[columns["close"]].to_numpy(dtype=np.float64)
+        highs = (
+            price_history[columns["high"]].to_numpy(dtype=np.float64) if "high" in columns else closes
+        )
+        lows = price_history[columns["low"]].to_numpy(dtype=np.float64) if "low" in columns else closes
 
-            closes = df["close"].values
-            highs = df.get("high", df.get("High", df.get("HIGH", closes))).values
-            lows = df.get("low", df.get("Low", df.get("LOW", closes))).values
+        # Repeat evaluations of an unchanged history reuse the earlier metrics
+        key = data_fingerprint(closes, highs, lows, stock_price)
+        cached = self._cached_metrics(key)
+        if cached is not None:
+            return cached
 
-            # 1. Calculate ADX (Average Directional Index)
-            adx, di_plus, di_minus = self._calculate_adx(highs, lows, closes)
+        # 1. Calculate ADX (Average Directional Index)
+        adx, di_plus, di_minus = self._calculate_adx(highs, lows, closes)
 
-            # Classify trend strength
-            if adx > 25:
-                adx_signal = "strong_trend"
-            elif adx > 20:
-                adx_signal = "weak_trend"
-            else:
-                adx_signal = "ranging"
+        # Classify trend strength
+        if adx > 25:
+            adx_signal = "strong_trend"
+        elif adx > 20:
+            adx_signal = "weak_trend"
+        else:
+            adx_signal = "ranging"
 
-            # 2. Calculate Bollinger Band Width
-            bb_width, bb_width_pct = self._calculate_bb_width(closes)
+        # 2. Calculate Bollinger Band Width
+        bb_width, bb_width_pct = self._calculate_bb_width(closes)
 
-            # 3. Calculate Linear Regression R-squared
-            r_squared, slope = self._calculate_trend_quality(closes)
+        # 3. Calculate Linear Regression R-squared
+        r_squared, slope = self._calculate_trend_quality(closes)
 
-            # 4. Determine overall regime
-            regime, regime_confidence = self._classify_regime(
-                adx, r_squared, bb_width_pct, slope, di_plus, di_minus
-            )
+        # 4. Determine overall regime
+        regime, regime_confidence = self._classify_regime(
+            adx, r_squared, bb_width_pct, slope, di_plus, di_minus
+        )
 
-            # 5. Current momentum direction
-            sma_20 = np.mean(closes[-20:])
-            price_vs_sma = ((stock_price - sma_20) / sma_20) * 100
+        # 5. Current momentum direction
+        sma_20 = np.mean(closes[-20:])
+        price_vs_sma = ((stock_price - sma_20) / sma_20) * 100
 
-            if price_vs_sma > 2:
-                momentum = "bullish"
-            elif price_vs_sma < -2:
-                momentum = "bearish"
-            else:
-                momentum = "neutral"
-
-            return {
-                "adx": float(adx),
-                "adx_signal": adx_signal,
-                "di_plus": float(di_plus),
-                "di_minus": float(di_minus),
-                "bb_width": float(bb_width),
-                "bb_width_percentile": float(bb_width_pct),
-                "r_squared": float(r_squared),
-                "regression_slope": float(slope),
-                "regime": regime,
-                "regime_confidence": float(regime_confidence),
-                "price_momentum": momentum,
-                "price_vs_sma20": float(price_vs_sma),
-            }
-
-        except Exception as e:
-            import traceback
-            print(f"Error calculating regime metrics: {e}")
-            traceback.print_exc()
-            return None
+        if price_vs_sma > 2:
+            momentum = "bullish"
+        elif price_vs_sma < -2:
+            momentum = "bearish"
+        else:
+            momentum = "neutral"
+
+        metrics = {
+            "adx": float(adx),
+            "adx_signal": adx_signal,
+            "di_plus": float(di_plus),
+            "di_minus": float(di_minus),
+            "bb_width": float(bb_width),
+            "bb_width_percentile": float(bb_width_pct),
+            "r_squared": float(r_squared),
+            "regression_slope": float(slope),
+            "regime": regime,
+            "regime_confidence": float(regime_confidence),
+            "price_momentum": momentum,
+            "price_vs_sma20": float(price_vs_sma),
+        }
+        self._remember_metrics(key, metrics)
+        return metrics
 
     def _calculate_adx(
         self, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int = 14
@@ -172,49 +360,16 @@ class RegimeDetector(Signal):
 
         Returns: (adx, di_plus, di_minus)
         """
-        # True Range
-        high_low = highs - lows
-        high_close = np.abs(highs - np.roll(closes, 1))
-        low_close = np.abs(lows - np.roll(closes, 1))
-        true_range = np.maximum(high_low, np.maximum(high_close, low_close))
-
-        # Directional Movement
-        plus_dm = np.maximum(highs - np.roll(highs, 1), 0)
-        minus_dm = np.maximum(np.roll(lows, 1) - lows, 0)
-
-        # When both are positive, only count the larger one
-        mask_plus = minus_dm > plus_dm
-        mask_minus = plus_dm > minus_dm
-        plus_dm[mask_plus] = 0
-        minus_dm[mask_minus] = 0
-
-        # Smooth the values using Wilder's smoothing
-        atr = self._wilder_smooth(true_range, period)
-        plus_di_smooth = self._wilder_smooth(plus_dm, period)
-        minus_di_smooth = self._wilder_smooth(minus_dm, period)
-
-        # Directional Indicators (add small epsilon to avoid division by zero)
-        epsilon = 1e-10
-        plus_di = 100 * plus_di_smooth / (atr + epsilon)
-        minus_di = 100 * minus_di_smooth / (atr + epsilon)
-
-        # Directional Index (DX)
-        dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di + 0.0001)
-
-        # ADX is smoothed DX
-        adx = self._wilder_smooth(dx, period)
-
-        return adx[-1], plus_di[-1], minus_di[-1]
+        return _adx_kernel(
+            np.ascontiguousarray(highs, dtype=np.float64),
+            np.ascontiguousarray(lows, dtype=np.float64),
+            np.ascontiguousarray(closes, dtype=np.float64),
+            period,
+        )
 
     def _wilder_smooth(self, data: np.ndarray, period: int) -> np.ndarray:
         """Wilder's smoothing (similar to EMA but different formula)."""
-        smoothed = np.zeros_like(data)
-        smoothed[period - 1] = np.mean(data[:period])
-
-        for i in range(period, len(data)):
-            smoothed[i] = (smoothed[i - 1] * (period - 1) + data[i]) / period
-
-        return smoothed
+        return _wilder_smooth_kernel(np.ascontiguousarray(data, dtype=np.float64), period)
 
     def _calculate_bb_width(
         self, closes: np.ndarray, period: int = 20, std_dev: float = 2.0
@@ -227,27 +382,23 @@ class RegimeDetector(Signal):
         if len(closes) < period:
             return 0.0, 50.0
 
-        # Current BB width
-        sma = np.mean(closes[-period:])
-        std = np.std(closes[-period:])
-        bb_width = (std_dev * std) / sma
+        # BB width of every trailing window; the last one is the current width
+        closes = np.ascontiguousarray(closes, dtype=np.float64)
+        if NUMBA_AVAILABLE:
+            widths = np.empty(closes.shape[0] - period + 1)
+            _bb_widths_kernel(closes, period, std_dev, widths)
+        else:
+            windows = np.lib.stride_tricks.sliding_window_view(closes, period)
+            widths = (std_dev * windows.std(axis=1)) / windows.mean(axis=1)
+        bb_width = widths[-1]
 
         # Historical BB widths for percentile
-        historical_widths = []
-        for i in range(period, len(closes)):
-            window_sma = np.mean(closes[i - period : i])
-            window_std = np.std(closes[i - period : i])
-            historical_widths.append((std_dev * window_std) / window_sma)
-
+        historical_widths = widths[:-1]
         if len(historical_widths) == 0:
             return bb_width, 50.0
 
         # Percentile (what % of historical widths are below current)
-        percentile = (
-            np.sum(np.array(historical_widths) < bb_width)
-            / len(historical_widths)
-            * 100
-        )
+        percentile = np.count_nonzero(historical_widths < bb_width) / historical_widths.size * 100
 
         return bb_width, percentile
 
@@ -260,31 +411,26 @@ class RegimeDetector(Signal):
         Returns: (r_squared, slope)
         """
         n = len(closes)
-        x = np.arange(n)
-        y = closes
-
-        # Linear regression
-        x_mean = np.mean(x)
-        y_mean = np.mean(y)
+        y = np.asarray(closes, dtype=np.float64)
 
-        numerator = np.sum((x - x_mean) * (y - y_mean))
-        denominator_x = np.sum((x - x_mean) ** 2)
-        denominator_y = np.sum((y - y_mean) ** 2)
+        # Linear regression against x = 0..n-1, whose mean and spread are closed-form
+        x_centered = _centered_x(n)
+        denominator_x = n * (n * n - 1) / 12.0
 
         if denominator_x == 0:
             return 0.0, 0.0
 
+        y_centered = y - np.mean(y)
+        numerator = float(np.dot(x_centered, y_centered))
         slope = numerator / denominator_x
 
-        # R-squared
-        y_pred = slope * (x - x_mean) + y_mean
-        ss_res = np.sum((y - y_pred) ** 2)
-        ss_tot = denominator_y
+        # R-squared; with a least-squares fit, ss_res = ss_tot - slope * numerator
+        ss_tot = float(np.dot(y_centered, y_centered))
 
         if ss_tot == 0:
             return 0.0, slope
 
-        r_squared = 1 - (ss_res / ss_tot)
+        r_squared = numerator * numerator / (denominator_x * ss_tot)
 
         return max(0.0, min(1.0, r_squared)), slope
 
@@ -366,55 +512,30 @@ class RegimeDetector(Signal):
         if regime == "trending_bullish":
             direction = Direction.BULLISH
             score = 60 + min(30, adx - 25)  # Stronger trends = higher score
-            rationale = (
-                f"Strong bullish trend detected (ADX={adx:.1f}, R²={r_squared:.2f}). "
-                f"Market is in momentum regime - follow the uptrend with calls. "
-                f"Trend strength suggests continuation is likely."
-            )
+            template = regime
 
         elif regime == "trending_bearish":
             direction = Direction.BEARISH
             score = -(60 + min(30, adx - 25))
-            rationale = (
-                f"Strong bearish trend detected (ADX={adx:.1f}, R²={r_squared:.2f}). "
-                f"Market is in momentum regime - follow the downtrend with puts. "
-                f"Trend strength suggests continuation is likely."
-            )
+            template = regime
 
         elif regime == "weak_bullish_trend":
             direction = Direction.BULLISH
             score = 30
             confidence = 55
-            rationale = (
-                f"Weak bullish trend forming (ADX={adx:.1f}). "
-                f"Early momentum phase - calls have edge but trend not fully established. "
-                f"Monitor for trend confirmation or reversal."
-            )
+            template = regime
 
         elif regime == "weak_bearish_trend":
             direction = Direction.BEARISH
             score = -30
             confidence = 55
-            rationale = (
-                f"Weak bearish trend forming (ADX={adx:.1f}). "
-                f"Early downside momentum - puts have slight edge but trend not confirmed. "
-                f"Watch for breakdown or bounce."
-            )
+            template = regime
 
         elif regime == "ranging" or regime == "tight_consolidation":
             direction = Direction.NEUTRAL
             score = 0
             confidence = 60
-
-            consolidation_note = ""
-            if regime == "tight_consolidation":
-                consolidation_note = " Price is coiling in tight consolidation - breakout likely imminent."
-
-            rationale = (
-                f"Ranging market regime (ADX={adx:.1f}). "
-                f"Mean reversion dominates - directional bias is low.{consolidation_note} "
-                f"Consider waiting for regime shift or using neutral strategies."
-            )
+            template = regime
 
         elif regime == "transitioning":
             # Use price momentum to guide during transition
@@ -422,44 +543,30 @@ class RegimeDetector(Signal):
                 direction = Direction.BULLISH
                 score = 20
                 confidence = 45
-                rationale = (
-                    f"Market transitioning between regimes (ADX={adx:.1f}). "
-                    f"Current price momentum is bullish but conviction is low. "
-                    f"Favor calls cautiously until regime clarity emerges."
-                )
+                template = "transitioning_bullish"
             elif price_momentum == "bearish":
                 direction = Direction.BEARISH
                 score = -20
                 confidence = 45
-                rationale = (
-                    f"Market transitioning between regimes (ADX={adx:.1f}). "
-                    f"Current price momentum is bearish but conviction is low. "
-                    f"Favor puts cautiously until regime clarity emerges."
-                )
+                template = "transitioning_bearish"
             else:
                 direction = Direction.NEUTRAL
                 score = 0
                 confidence = 40
-                rationale = (
-                    f"Market in transition with unclear direction (ADX={adx:.1f}). "
-                    f"Both trend and mean reversion signals are weak. "
-                    f"Wait for regime establishment before taking directional positions."
-                )
+                template = "transitioning"
 
         else:
             # trending_unclear
             direction = Direction.NEUTRAL
             score = 0
             confidence = 50
-            rationale = (
-                f"Trend strength detected but direction mixed (ADX={adx:.1f}). "
-                f"Conflicting directional signals reduce conviction. "
-                f"Monitor for trend resolution."
-            )
+            template = "trending_unclear"
+
+        rationale = _RATIONALE_TEMPLATES[template].format(adx=adx, r_squared=r_squared)
 
         return direction, score, confidence, rationale
 
-    def _create_neutral_result(self, reason: str) -> SignalResult:
+    def _create_neutral_result(self, reason: str, now: Optional[datetime] = None) -> SignalResult:
         """Create a neutral result when signal cannot be calculated."""
         return SignalResult(
             signal_name=self.name,
@@ -468,5 +575,5 @@ class RegimeDetector(Signal):
             confidence=0.0,
             rationale=f"No regime signal: {reason}",
             details={"error": reason},
-            timestamp=datetime.now(),
+            timestamp=now or datetime.now(),
         )
@@ -6,12 +6,54 @@ and combines them into a single directional prediction with confidence scoring.
 
 from __future__ import annotations
 
+import logging
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
-import numpy as np
+from .base import Direction, DirectionalScore, Signal, SignalResult, clip_scalar, direction_from_score
 
-from .base import Direction, DirectionalScore, Signal, SignalResult
+logger = logging.getLogger(__name__)
+
+
+# Strength label per confidence bucket (see _confidence_bucket)
+_STRENGTH_LABELS = ("Very Weak", "Weak", "Moderate", "Strong")
+
+
+def _confidence_bucket(confidence: float) -> int:
+    """0: below 45, 1: 45-60, 2: 60-75, 3: 75 and up (NaN falls in 0)."""
+    if confidence >= 75:
+        return 3
+    elif confidence >= 60:
+        return 2
+    elif confidence >= 45:
+        return 1
+    return 0
+
+
+def _recommendation_text(direction: Direction, bucket: int) -> str:
+    if direction == Direction.NEUTRAL:
+        return "No clear directional bias - consider strategies that profit from range-bound movement or wait for clearer signals."
+
+    strength = _STRENGTH_LABELS[bucket]
+    direction_label = direction.value.capitalize()
+    option_type = "calls" if direction == Direction.BULLISH else "puts"
+    opposite_type = "puts" if direction == Direction.BULLISH else "calls"
+
+    if bucket == 3:
+        return f"{strength} {direction_label} - Strong conviction to favor {option_type} over {opposite_type}. Multiple signals confirm this direction."
+    elif bucket == 2:
+        return f"{strength} {direction_label} - Moderate conviction to favor {option_type}. Consider sizing accordingly."
+    else:
+        return f"{strength} {direction_label} - Weak signal favoring {option_type}, but low confidence. Use cautiously or wait for confirmation."
+
+
+# The recommendation depends only on direction and confidence bucket, so every
+# variant is formatted once at import
+_RECOMMENDATIONS = {
+    (direction, bucket): _recommendation_text(direction, bucket)
+    for direction in Direction
+    for bucket in range(len(_STRENGTH_LABELS))
+}
 
 
 class SignalAggregator:
@@ -44,42 +86,93 @@ class SignalAggregator:
         Returns:
             DirectionalScore with unified prediction
         """
-        # Calculate all signal results
-        signal_results: List[SignalResult] = []
+        return self.aggregate_many([symbol], [data])[0]
+
+    def aggregate_many(
+        self, symbols: Sequence[str], data_per_symbol: Sequence[Dict[str, any]]
+    ) -> List[DirectionalScore]:
+        """
+        Calculate aggregate directional scores for several symbols in one pass.
+
+        Each signal sees all of its valid rows in one ``calculate_many`` call,
+        so signals that can vectorize across symbols do so.
+
+        Args:
+            symbols: Stock symbols being analyzed
+            data_per_symbol: Signal data for each symbol, in the same order
+
+        Returns:
+            One DirectionalScore per symbol, in input order
+        """
+        # One timestamp for the whole pass keeps the snapshot consistent
+        now = datetime.now()
 
+        # Calculate all signal results, one column of symbols per signal
+        signal_results: List[List[SignalResult]] = [[] for _ in symbols]
         for signal in self.signals:
+            for results, result in zip(signal_results, self._calculate_signal(signal, data_per_symbol, now)):
+                results.append(result)
+
+        return [self._combine(symbol, results, now) for symbol, results in zip(symbols, signal_results)]
+
+    def _calculate_signal(
+        self, signal: Signal, rows: Sequence[Dict[str, any]], now: datetime
+    ) -> List[SignalResult]:
+        """Run one signal over every row, substituting neutral results for missing data and errors."""
+        results: List[Optional[SignalResult]] = [None] * len(rows)
+        valid: List[int] = []
+
+        for index, data in enumerate(rows):
             try:
                 if signal.validate_data(data):
-                    result = signal.calculate(data)
-                    signal_results.append(result)
+                    valid.append(index)
                 else:
                     # Create neutral result for missing data
-                    signal_results.append(
-                        SignalResult(
-                            signal_name=signal.name,
-                            direction=Direction.NEUTRAL,
-                            score=0.0,
-                            confidence=0.0,
-                            rationale=f"Missing required data for {signal.name}",
-                            details={"error": "missing_data"},
-                            timestamp=datetime.now(),
-                        )
-                    )
-            except Exception as e:
-                print(f"Error calculating {signal.name}: {e}")
-                # Add error result
-                signal_results.append(
-                    SignalResult(
+                    results[index] = SignalResult(
                         signal_name=signal.name,
                         direction=Direction.NEUTRAL,
                         score=0.0,
                         confidence=0.0,
-                        rationale=f"Error in {signal.name}: {str(e)}",
-                        details={"error": str(e)},
-                        timestamp=datetime.now(),
+                        rationale=f"Missing required data for {signal.name}",
+                        details={"error": "missing_data"},
+                        timestamp=now,
                     )
-                )
+            except Exception as e:
+                results[index] = self._error_result(signal, e, now)
 
+        if len(valid) > 1:
+            try:
+                batch = signal.calculate_many([rows[index] for index in valid], now=now)
+            except Exception:
+                # Retry one row at a time so a bad row only neutralizes its own result
+                batch = [self._calculate_one(signal, rows[index], now) for index in valid]
+        else:
+            batch = [self._calculate_one(signal, rows[index], now) for index in valid]
+
+        for index, result in zip(valid, batch):
+            results[index] = result
+        return results
+
+    def _calculate_one(self, signal: Signal, data: Dict[str, any], now: datetime) -> SignalResult:
+        try:
+            return signal.calculate(data, now=now)
+        except Exception as e:
+            return self._error_result(signal, e, now)
+
+    def _error_result(self, signal: Signal, error: Exception, now: datetime) -> SignalResult:
+        logger.warning("Error calculating %s: %s", signal.name, error)
+        return SignalResult(
+            signal_name=signal.name,
+            direction=Direction.NEUTRAL,
+            score=0.0,
+            confidence=0.0,
+            rationale=f"Error in {signal.name}: {str(error)}",
+            details={"error": str(error)},
+            timestamp=now,
+        )
+
+    def _combine(self, symbol: str, signal_results: List[SignalResult], now: datetime) -> DirectionalScore:
+        """Fold one symbol's signal results into a DirectionalScore."""
         # Aggregate scores
         weighted_score = self._calculate_weighted_score(signal_results)
         confidence = self._calculate_aggregate_confidence(signal_results)
@@ -93,7 +186,7 @@ class SignalAggregator:
             confidence=confidence,
             signals=signal_results,
             recommendation=recommendation,
-            timestamp=datetime.now(),
+            timestamp=now,
         )
 
     def _calculate_weighted_score(self, results: List[SignalResult]) -> float:
@@ -148,7 +241,7 @@ class SignalAggregator:
         agreement_score = agreement_rate * 100
 
         # 2. Average individual confidence
-        avg_confidence = np.mean([r.confidence for r in meaningful_results])
+        avg_confidence = sum(r.confidence for r in meaningful_results) / len(meaningful_results)
 
         # 3. Diversification bonus (more signals = more reliable)
         diversification_factor = min(1.0, len(meaningful_results) / len(self.signals))
@@ -161,45 +254,19 @@ class SignalAggregator:
             disagreement_penalty = min(bullish_count, bearish_count) / len(meaningful_results) * 20
             base_confidence -= disagreement_penalty
 
-        return np.clip(base_confidence, 0, 95)
+        return clip_scalar(base_confidence, 0.0, 95.0)
 
     def _determine_direction(self, score: float) -> Direction:
         """Determine overall direction from aggregate score."""
-        if score > 15:
-            return Direction.BULLISH
-        elif score < -15:
-            return Direction.BEARISH
-        else:
-            return Direction.NEUTRAL
+        return direction_from_score(score)
 
     def _generate_recommendation(self, direction: Direction, confidence: float, score: float) -> str:
         """Generate human-readable recommendation."""
-        strength = self._get_strength_label(confidence)
-        direction_label = direction.value.capitalize()
-
-        if direction == Direction.NEUTRAL:
-            return "No clear directional bias - consider strategies that profit from range-bound movement or wait for clearer signals."
-
-        option_type = "calls" if direction == Direction.BULLISH else "puts"
-        opposite_type = "puts" if direction == Direction.BULLISH else "calls"
-
-        if confidence >= 75:
-            return f"{strength} {direction_label} - Strong conviction to favor {option_type} over {opposite_type}. Multiple signals confirm this direction."
-        elif confidence >= 60:
-            return f"{strength} {direction_label} - Moderate conviction to favor {option_type}. Consider sizing accordingly."
-        else:
-            return f"{strength} {direction_label} - Weak signal favoring {option_type}, but low confidence. Use cautiously or wait for confirmation."
+        return _RECOMMENDATIONS[direction, _confidence_bucket(confidence)]
 
     def _get_strength_label(self, confidence: float) -> str:
         """Get strength label based on confidence."""
-        if confidence >= 75:
-            return "Strong"
-        elif confidence >= 60:
-            return "Moderate"
-        elif confidence >= 45:
-            return "Weak"
-        else:
-            return "Very Weak"
+        return _STRENGTH_LABELS[_confidence_bucket(confidence)]
 
     def get_signal_breakdown(self, directional_score: DirectionalScore) -> Dict[str, any]:
         """
@@ -14,13 +14,53 @@ This signal looks at:
 
 from __future__ import annotations
 
+import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
 
-from .base import Direction, Signal, SignalResult
+from src.math.jit import NUMBA_AVAILABLE, njit
+
+from .base import CALL_CODE, PUT_CODE, Direction, Signal, SignalResult, clip_scalar, option_type_codes
+
+logger = logging.getLogger(__name__)
+
+# Rows of the per-side accumulators filled by _flow_sums; the columns are
+# indexed by option type code (CALL_CODE, PUT_CODE)
+_VOLUME, _WEIGHTED_AGGRESSION, _BLOCK_VOLUME = range(3)
+
+
+@njit(cache=True, error_model="numpy")
+def _flow_sums_kernel(
+    type_codes: np.ndarray,
+    volume: np.ndarray,
+    open_interest: np.ndarray,
+    bid: np.ndarray,
+    ask: np.ndarray,
+    last_price: np.ndarray,
+    sums: np.ndarray,
+) -> None:
+    # One pass over the chain; NaN terms are skipped like np.nansum
+    for i in range(type_codes.shape[0]):
+        side = type_codes[i]
+        if side < 0:
+            continue
+        contracts = volume[i]
+        if not np.isnan(contracts):
+            sums[_VOLUME, side] += contracts
+
+        midpoint = (bid[i] + ask[i]) / 2
+        weighted = (last_price[i] - midpoint) / midpoint * contracts
+        if not np.isnan(weighted):
+            sums[_WEIGHTED_AGGRESSION, side] += weighted
+
+        # Zero OI divides by 1; a NaN ratio never counts as a block
+        oi = open_interest[i]
+        ratio = contracts / oi if oi != 0 else contracts
+        if ratio > 0.5:
+            sums[_BLOCK_VOLUME, side] += contracts
 
 
 class SmartMoneyFlowDetector(Signal):
@@ -39,7 +79,7 @@ class SmartMoneyFlowDetector(Signal):
             "price_change",  # Price change (for flow direction)
         ]
 
-    def calculate(self, data: Dict[str, Any]) -> SignalResult:
+    def calculate(self, data: Dict[str, Any], now: Optional[datetime] = None) -> SignalResult:
         """
         Calculate directional bias from smart money flow.
 
@@ -50,7 +90,7 @@ class SmartMoneyFlowDetector(Signal):
             SignalResult with flow-based directional bias
         """
         if not self.validate_data(data):
-            return self._create_neutral_result("Missing required data")
+            return self._create_neutral_result("Missing required data", now)
 
         options_data = data["options_data"]
         historical_volume = data.get("historical_volume", {})
@@ -58,7 +98,7 @@ class SmartMoneyFlowDetector(Signal):
         price_change = float(data.get("price_change", 0))
 
         if options_data.empty or stock_price <= 0:
-            return self._create_neutral_result("Invalid data values")
+            return self._create_neutral_result("Invalid data values", now)
 
         # Calculate flow metrics
         flow_metrics = self._calculate_flow_metrics(
@@ -66,7 +106,7 @@ class SmartMoneyFlowDetector(Signal):
         )
 
         if flow_metrics is None:
-            return self._create_neutral_result("Insufficient flow data")
+            return self._create_neutral_result("Insufficient flow data", now)
 
         # Determine directional bias
         direction, score, confidence, rationale = self._interpret_flow(flow_metrics)
@@ -78,7 +118,7 @@ class SmartMoneyFlowDetector(Signal):
             confidence=self.get_adjusted_confidence(confidence),
             rationale=rationale,
             details=flow_metrics,
-            timestamp=datetime.now(),
+            timestamp=now or datetime.now(),
         )
 
     def _calculate_flow_metrics(
@@ -101,15 +141,23 @@ class SmartMoneyFlowDetector(Signal):
         - net_flow_score: Overall directional flow
         """
         try:
-            calls = options_data[options_data["type"] == "call"].copy()
-            puts = options_data[options_data["type"] == "put"].copy()
-
-            if calls.empty and puts.empty:
+            # Each column is read once; calls and puts are type codes, not filtered copies
+            type_codes = option_type_codes(options_data)
+            if (type_codes < 0).all():
                 return None
 
+            volume = options_data["volume"].to_numpy(dtype=np.float64)
+            open_interest, bid, ask, last_price = (
+                options_data[column].to_numpy(dtype=np.float64)
+                if column in options_data
+                else np.full(volume.shape[0], np.nan)
+                for column in ("openInterest", "bid", "ask", "lastPrice")
+            )
+            sums = self._flow_sums(type_codes, volume, open_interest, bid, ask, last_price)
+
             # 1. Unusual Volume Detection
-            call_volume = calls["volume"].sum() if not calls.empty else 0
-            put_volume = puts["volume"].sum() if not puts.empty else 0
+            call_volume = sums[_VOLUME, CALL_CODE]
+            put_volume = sums[_VOLUME, PUT_CODE]
 
             avg_call_volume = historical_volume.get("avg_call_volume", call_volume)
             avg_put_volume = historical_volume.get("avg_put_volume", put_volume)
@@ -127,12 +175,16 @@ class SmartMoneyFlowDetector(Signal):
             cp_ratio = call_volume / put_volume if put_volume > 0 else (5.0 if call_volume > 0 else 1.0)
 
             # 3. Bid/Ask Aggression (estimates who's initiating trades)
-            aggressive_call_flow = self._calculate_aggressive_flow(calls, "call")
-            aggressive_put_flow = self._calculate_aggressive_flow(puts, "put")
+            aggressive_call_flow = self._calculate_aggressive_flow(
+                sums[_WEIGHTED_AGGRESSION, CALL_CODE], call_volume, "call"
+            )
+            aggressive_put_flow = self._calculate_aggressive_flow(
+                sums[_WEIGHTED_AGGRESSION, PUT_CODE], put_volume, "put"
+            )
 
             # 4. Block Trade Detection (volume much higher than OI suggests large trades)
-            block_call_score = self._detect_block_trades(calls)
-            block_put_score = self._detect_block_trades(puts)
+            block_call_score = self._detect_block_trades(sums[_BLOCK_VOLUME, CALL_CODE], call_volume)
+            block_put_score = self._detect_block_trades(sums[_BLOCK_VOLUME, PUT_CODE], put_volume)
 
             # 5. Volume-Weighted Direction (combining price action with volume)
             # If stock is up and calls are active = bullish confirmation
@@ -169,7 +221,7 @@ class SmartMoneyFlowDetector(Signal):
             }
 
         except Exception as e:
-            print(f"Error calculating flow metrics: {e}")
+            logger.warning("Error calculating flow metrics: %s", e)
             return None
 
     def _calculate_unusual_score(self, current: float, average: float, std: float) -> float:
@@ -184,85 +236,86 @@ class SmartMoneyFlowDetector(Signal):
         z_score = (current - average) / std
 
         # Convert to 0-100 scale (3 std = 100)
-        score = np.clip((z_score / 3.0) * 100, 0, 100)
+        score = clip_scalar((z_score / 3.0) * 100, 0.0, 100.0)
         return score
 
-    def _calculate_aggressive_flow(self, options_df: pd.DataFrame, option_type: str) -> float:
+    def _flow_sums(
+        self,
+        type_codes: np.ndarray,
+        volume: np.ndarray,
+        open_interest: np.ndarray,
+        bid: np.ndarray,
+        ask: np.ndarray,
+        last_price: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Accumulate per-side volume, aggression and block volume in one pass.
+
+        Returns a (3, 2) array whose rows are total volume, volume-weighted
+        aggression and block trade volume, and whose columns are calls and
+        puts. Contracts of any other type are ignored and NaN terms skipped.
+        """
+        sums = np.zeros((3, 2))
+        if NUMBA_AVAILABLE:
+            _flow_sums_kernel(type_codes, volume, open_interest, bid, ask, last_price, sums)
+            return sums
+
+        # A zero midpoint gives +/-inf (or NaN) exactly as the compiled loop does
+        with np.errstate(divide="ignore", invalid="ignore"):
+            midpoint = (bid + ask) / 2
+            weighted = (last_price - midpoint) / midpoint * volume
+
+        # Volume/OI ratio - zero OI divides by 1, i.e. the ratio is the volume itself
+        vol_oi_ratio = np.divide(volume, open_interest, out=volume.copy(), where=open_interest != 0)
+        block_trades = vol_oi_ratio > 0.5
+
+        for side in (CALL_CODE, PUT_CODE):
+            mask = type_codes == side
+            sums[_VOLUME, side] = np.nansum(volume[mask])
+            sums[_WEIGHTED_AGGRESSION, side] = np.nansum(weighted[mask])
+            sums[_BLOCK_VOLUME, side] = np.nansum(volume[mask & block_trades])
+        return sums
+
+    def _calculate_aggressive_flow(self, weighted_aggression: float, side_volume: float, option_type: str) -> float:
         """
         Estimate aggressive buying vs selling by analyzing bid/ask spread.
 
         When buyers are aggressive, they lift the offer (buy at ask).
         When sellers are aggressive, they hit the bid (sell at bid).
 
-        We approximate this by comparing lastPrice to bid/ask midpoint.
+        We approximate this by comparing lastPrice to bid/ask midpoint:
+        ``weighted_aggression`` is the side's volume-weighted sum of
+        ``(lastPrice - midpoint) / midpoint`` from :meth:`_flow_sums`.
         """
-        if options_df.empty:
+        if side_volume <= 0:
             return 0.0
 
-        try:
-            # Calculate midpoint
-            options_df = options_df.copy()
-            options_df["midpoint"] = (options_df["bid"] + options_df["ask"]) / 2
+        avg_aggression = weighted_aggression / side_volume
 
-            # If lastPrice > midpoint, buyers are aggressive (bullish for calls, bearish for puts)
-            # If lastPrice < midpoint, sellers are aggressive (bearish for calls, bullish for puts)
-            options_df["aggression"] = (options_df["lastPrice"] - options_df["midpoint"]) / options_df["midpoint"]
+        # Convert to score (-100 to +100)
+        # For calls: positive aggression = bullish, negative = bearish
+        # For puts: positive aggression = bearish, negative = bullish
+        score = clip_scalar(avg_aggression * 100, -100.0, 100.0)
 
-            # Weight by volume
-            options_df["weighted_aggression"] = options_df["aggression"] * options_df["volume"]
+        if option_type == "put":
+            score = -score  # Invert for puts
 
-            total_weighted = options_df["weighted_aggression"].sum()
-            total_volume = options_df["volume"].sum()
-
-            if total_volume <= 0:
-                return 0.0
-
-            avg_aggression = total_weighted / total_volume
-
-            # Convert to score (-100 to +100)
-            # For calls: positive aggression = bullish, negative = bearish
-            # For puts: positive aggression = bearish, negative = bullish
-            score = np.clip(avg_aggression * 100, -100, 100)
-
-            if option_type == "put":
-                score = -score  # Invert for puts
-
-            return score
-
-        except Exception as e:
-            print(f"Error calculating aggressive flow: {e}")
-            return 0.0
+        return score
 
-    def _detect_block_trades(self, options_df: pd.DataFrame) -> float:
+    def _detect_block_trades(self, block_volume: float, side_volume: float) -> float:
         """
-        Detect block trades by finding options where volume >> open interest.
+        Score the share of one side's volume traded in block trades.
 
-        Large volume relative to OI suggests a big player is taking a position.
+        Block trades are contracts whose volume exceeds half their open
+        interest; large volume relative to OI suggests a big player is
+        taking a position.
         """
-        if options_df.empty:
+        if side_volume <= 0:
             return 0.0
 
-        try:
-            # Volume/OI ratio - high ratio indicates large trades today
-            options_df = options_df.copy()
-            options_df["vol_oi_ratio"] = options_df["volume"] / options_df["openInterest"].replace(0, 1)
-
-            # Find options with unusually high volume/OI (>0.5 is significant)
-            block_trades = options_df[options_df["vol_oi_ratio"] > 0.5]
-
-            if block_trades.empty:
-                return 0.0
+        block_score = (block_volume / side_volume) * 100
 
-            # Score based on how many block trades and their size
-            total_block_volume = block_trades["volume"].sum()
-            total_volume = options_df["volume"].sum()
-
-            block_score = (total_block_volume / total_volume) * 100 if total_volume > 0 else 0
-
-            return min(100, block_score)
-
-        except Exception:
-            return 0.0
+        return min(100, block_score)
 
     def _calculate_net_flow(
         self,
@@ -307,7 +360,7 @@ class SmartMoneyFlowDetector(Signal):
             flow_score += confirmation_bonus
 
         # Clip to range
-        return np.clip(flow_score, -100, 100)
+        return clip_scalar(flow_score, -100.0, 100.0)
 
     def _interpret_flow(self, metrics: Dict[str, Any]) -> tuple[Direction, float, float, str]:
         """
@@ -424,7 +477,7 @@ class SmartMoneyFlowDetector(Signal):
             f"Activity levels appear normal without significant directional positioning."
         )
 
-    def _create_neutral_result(self, reason: str) -> SignalResult:
+    def _create_neutral_result(self, reason: str, now: Optional[datetime] = None) -> SignalResult:
         """Create a neutral result when signal cannot be calculated."""
         return SignalResult(
             signal_name=self.name,
@@ -433,5 +486,5 @@ class SmartMoneyFlowDetector(Signal):
             confidence=0.0,
             rationale=f"No flow signal: {reason}",
             details={"error": reason},
-            timestamp=datetime.now(),
+            timestamp=now or datetime.now(),
         )
@@ -20,6 +20,7 @@ Trading Logic:
 
 from __future__ import annotations
 
+import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -28,6 +29,8 @@ import pandas as pd
 
 from .base import Direction, Signal, SignalResult
 
+logger = logging.getLogger(__name__)
+
 
 class VolumeProfileAnalyzer(Signal):
     """Analyze volume profile to predict directional momentum."""
@@ -43,7 +46,7 @@ class VolumeProfileAnalyzer(Signal):
             "stock_price",  # Current stock price
         ]
 
-    def calculate(self, data: Dict[str, Any]) -> SignalResult:
+    def calculate(self, data: Dict[str, Any], now: Optional[datetime] = None) -> SignalResult:
         """
         Calculate directional bias from volume profile analysis.
 
@@ -54,19 +57,19 @@ class VolumeProfileAnalyzer(Signal):
             SignalResult with volume profile-based directional bias
         """
         if not self.validate_data(data):
-            return self._create_neutral_result("Missing required data")
+            return self._create_neutral_result("Missing required data", now)
 
         price_history = data["price_history"]
         stock_price = float(data.get("stock_price", 0))
 
         if price_history.empty or stock_price <= 0:
-            return self._create_neutral_result("Invalid data values")
+            return self._create_neutral_result("Invalid data values", now)
 
         # Calculate volume profile metrics
         profile_metrics = self._calculate_volume_profile(price_history, stock_price)
 
         if profile_metrics is None:
-            return self._create_neutral_result("Insufficient price/volume history")
+            return self._create_neutral_result("Insufficient price/volume history", now)
 
         # Determine directional bias from volume profile
         direction, score, confidence, rationale = self._interpret_profile(
@@ -80,7 +83,7 @@ class VolumeProfileAnalyzer(Signal):
             confidence=self.get_adjusted_confidence(confidence),
             rationale=rationale,
             details=profile_metrics,
-            timestamp=datetime.now(),
+            timestamp=now or datetime.now(),
         )
 
     def _calculate_volume_profile(
@@ -104,16 +107,9 @@ class VolumeProfileAnalyzer(Signal):
             if len(price_history) < 20:
                 return None
 
-            df = price_history.copy()
-
-            # Normalize column names
-            if "close" not in df.columns:
-                df["close"] = df.get("Close", df.get("CLOSE"))
-            if "volume" not in df.columns:
-                df["volume"] = df.get("Volume", df.get("VOLUME"))
-
-            closes = df["close"].values
-            volumes = df["volume"].values
+            # Normalize column names without copying the history
+            closes = price_history.get("close", price_history.get("Close", price_history.get("CLOSE"))).values
+            volumes = price_history.get("volume", price_history.get("Volume", price_history.get("VOLUME"))).values
 
             # Create price bins for volume profile
             num_bins = min(50, len(closes) // 2)  # Adaptive binning
@@ -205,7 +201,7 @@ class VolumeProfileAnalyzer(Signal):
             }
 
         except Exception as e:
-            print(f"Error calculating volume profile: {e}")
+            logger.warning("Error calculating volume profile: %s", e)
             return None
 
     def _interpret_profile(
@@ -364,7 +360,7 @@ class VolumeProfileAnalyzer(Signal):
 
         return direction, score, min(90, confidence), rationale
 
-    def _create_neutral_result(self, reason: str) -> SignalResult:
+    def _create_neutral_result(self, reason: str, now: Optional[datetime] = None) -> SignalResult:
         """Create a neutral result when signal cannot be calculated."""
         return SignalResult(
             signal_name=self.name,
@@ -373,5 +369,5 @@ class VolumeProfileAnalyzer(Signal):
             confidence=0.0,
             rationale=f"No volume profile signal: {reason}",
             details={"error": reason},
-            timestamp=datetime.now(),
+            timestamp=now or datetime.now(),
         )
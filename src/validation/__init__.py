@@ -1,5 +1,5 @@
 """Data quality validation for options trading."""
 
-from .data_quality import DataQuality, OptionsDataValidator, OptionsDataQualityValidator, QualityReport
+from .data_quality import DataQuality, OptionsDataValidator, OptionsDataQualityValidator, QualityReport, UNTRADEABLE_QUALITIES
 
-__all__ = ["DataQuality", "OptionsDataValidator", "QualityReport"]
+__all__ = ["DataQuality", "OptionsDataValidator", "QualityReport", "UNTRADEABLE_QUALITIES"]
@@ -25,6 +25,10 @@ class DataQuality(Enum):
     REJECTED = "rejected"    # <40 points
 
 
+# Quality levels that are never surfaced as tradeable opportunities.
+UNTRADEABLE_QUALITIES = frozenset({DataQuality.REJECTED, DataQuality.LOW})
+
+
 @dataclass
 class QualityIssue:
     """Represents a specific data quality issue."""
@@ -63,7 +67,7 @@ class QualityReport:
     @property
     def is_tradeable(self) -> bool:
         """Whether this opportunity meets minimum quality standards."""
-        return self.quality not in [DataQuality.REJECTED, DataQuality.LOW]
+        return self.quality not in UNTRADEABLE_QUALITIES
     
     @property
     def critical_issues(self) -> List[QualityIssue]:
@@ -170,16 +174,7 @@ class OptionsDataQualityValidator:
         
         # Determine final quality level
         score = max(0.0, score)
-        if score >= 95:
-            quality = DataQuality.INSTITUTIONAL
-        elif score >= 80:
-            quality = DataQuality.HIGH  
-        elif score >= 60:
-            quality = DataQuality.MEDIUM
-        elif score >= 40:
-            quality = DataQuality.LOW
-        else:
-            quality = DataQuality.REJECTED
+        quality = self._quality_for_score(score)
             
         return QualityReport(
             symbol=symbol,
@@ -193,6 +188,322 @@ class OptionsDataQualityValidator:
             metadata=metadata
         )
     
+    def validate_frame(self, options: pd.DataFrame) -> pd.DataFrame:
+        """Validate every row of an options frame in one pass.
+
+        Applies the same rules as :meth:`validate_opportunity` with column
+        masks and returns a frame aligned to ``options.index`` with
+        ``quality``, ``score``, ``issues`` and ``warnings`` columns. Issue
+        objects are only created for the rows a rule flags.
+        """
+
+        row_count = len(options)
+        found: List[List[QualityIssue]] = [[] for _ in range(row_count)]
+
+        def column(name: str, default: Any = 0) -> tuple[np.ndarray, List[Any]]:
+            # Masks are evaluated on a float view; issue messages and values use the raw cells.
+            if name not in options.columns:
+                return np.zeros(row_count), [default] * row_count
+            values = options[name]
+            return pd.to_numeric(values, errors="coerce").to_numpy(dtype=np.float64), values.tolist()
+
+        def flag(mask: np.ndarray, build: Any) -> None:
+            for row in np.flatnonzero(mask):
+                found[row].append(build(int(row)))
+
+        is_market_open = self._is_market_hours()
+        stock_price, stock_price_values = column("stockPrice", None)
+
+        # Stock price
+        invalid_price = stock_price <= 0
+        flag(invalid_price, lambda row: QualityIssue(
+            severity="critical",
+            message="Missing or invalid stock price",
+            impact_points=50.0,
+            field="stockPrice",
+            value=stock_price_values[row]
+        ))
+        valid_price = ~invalid_price
+
+        age_seconds, age_values = column("_price_age_seconds", None)
+        if "_price_age_seconds" not in options.columns:
+            age_seconds = np.full(row_count, np.nan)
+        age_minutes = age_seconds / 60.0
+        age_minute_values = age_minutes.tolist()
+        if is_market_open:
+            stale = valid_price & (age_minutes > self.max_price_age_minutes)
+            flag(stale & (age_minutes > 60), lambda row: QualityIssue(
+                severity="critical",
+                message=f"Stock price is {age_minute_values[row]:.0f} minutes old - too stale",
+                impact_points=40.0,
+                field="_price_age_seconds",
+                value=age_values[row]
+            ))
+            flag(stale & ~(age_minutes > 60), lambda row: QualityIssue(
+                severity="warning",
+                message=f"Stock price is {age_minute_values[row]:.0f} minutes old",
+                impact_points=15.0,
+                field="_price_age_seconds",
+                value=age_values[row]
+            ))
+        else:
+            flag(valid_price & (age_minutes > 1440), lambda row: QualityIssue(
+                severity="warning",
+                message=f"Stock price is {age_minute_values[row] / 60:.1f} hours old (markets closed)",
+                impact_points=5.0,
+                field="_price_age_seconds",
+                value=age_values[row]
+            ))
+
+        if "_price_source" in options.columns:
+            price_source = options["_price_source"].fillna("").astype(str)
+        else:
+            price_source = pd.Series("", index=options.index)
+        source_values = price_source.tolist()
+        stale_source = price_source.str.upper().str.contains("STALE", regex=False).to_numpy()
+        previous_close = price_source.str.contains("previousClose", regex=False).to_numpy()
+        if is_market_open:
+            flag(valid_price & stale_source, lambda row: QualityIssue(
+                severity="warning",
+                message=f"Price from stale source: {source_values[row]}",
+                impact_points=20.0,
+                field="_price_source",
+                value=source_values[row]
+            ))
+            flag(valid_price & ~stale_source & previous_close, lambda row: QualityIssue(
+                severity="critical",
+                message="Using previous day's close during market hours",
+                impact_points=35.0,
+                field="_price_source",
+                value=source_values[row]
+            ))
+        else:
+            flag(valid_price & previous_close, lambda row: QualityIssue(
+                severity="info",
+                message=f"Using previous close (markets closed)",
+                impact_points=0.0,
+                field="_price_source",
+                value=source_values[row]
+            ))
+
+        # Option pricing
+        bid, bid_values = column("bid")
+        ask, ask_values = column("ask")
+        last_price, last_values = column("lastPrice")
+
+        no_prices = (bid <= 0) & (ask <= 0) & (last_price <= 0)
+        flag(no_prices, lambda row: QualityIssue(
+            severity="critical",
+            message="No valid option prices available",
+            impact_points=50.0,
+            field="pricing",
+            value={"bid": bid_values[row], "ask": ask_values[row], "lastPrice": last_values[row]}
+        ))
+        two_sided = ~no_prices & (bid > 0) & (ask > 0)
+        mid_price = (bid + ask) / 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            spread_pct = np.where(mid_price > 0, (ask - bid) / mid_price, np.inf)
+        spread_values = spread_pct.tolist()
+        excessive_spread = two_sided & (spread_pct > 0.50)
+        flag(excessive_spread, lambda row: QualityIssue(
+            severity="critical",
+            message=f"Excessive bid-ask spread: {spread_values[row]:.1%}",
+            impact_points=40.0,
+            field="spread",
+            value=spread_values[row]
+        ))
+        flag(two_sided & ~excessive_spread & (spread_pct > self.max_spread_pct), lambda row: QualityIssue(
+            severity="warning",
+            message=f"Wide bid-ask spread: {spread_values[row]:.1%}",
+            impact_points=15.0,
+            field="spread",
+            value=spread_values[row]
+        ))
+        flag(two_sided & (bid >= ask), lambda row: QualityIssue(
+            severity="critical",
+            message=f"Crossed market: bid ({bid_values[row]}) >= ask ({ask_values[row]})",
+            impact_points=50.0,
+            field="crossed_market",
+            value={"bid": bid_values[row], "ask": ask_values[row]}
+        ))
+        flag(
+            two_sided & (last_price > 0) & ((last_price < bid * 0.5) | (last_price > ask * 2)),
+            lambda row: QualityIssue(
+                severity="warning",
+                message=f"Last price ({last_values[row]}) seems inconsistent with bid-ask",
+                impact_points=10.0,
+                field="lastPrice",
+                value=last_values[row]
+            ),
+        )
+
+        # Liquidity
+        volume, volume_values = column("volume")
+        open_interest, open_interest_values = column("openInterest")
+        if is_market_open:
+            flag(volume == 0, lambda row: QualityIssue(
+                severity="critical",
+                message="Zero volume - no trading activity",
+                impact_points=40.0,
+                field="volume",
+                value=volume_values[row]
+            ))
+            flag((volume != 0) & (volume < self.min_volume), lambda row: QualityIssue(
+                severity="warning",
+                message=f"Low volume: {volume_values[row]} (min recommended: {self.min_volume})",
+                impact_points=20.0,
+                field="volume",
+                value=volume_values[row]
+            ))
+        else:
+            flag(volume == 0, lambda row: QualityIssue(
+                severity="info",
+                message="Zero volume (markets closed - normal)",
+                impact_points=0.0,
+                field="volume",
+                value=volume_values[row]
+            ))
+        flag(open_interest == 0, lambda row: QualityIssue(
+            severity="warning" if not is_market_open else "critical",
+            message="Zero open interest - illiquid contract",
+            impact_points=15.0 if not is_market_open else 40.0,
+            field="openInterest",
+            value=open_interest_values[row]
+        ))
+        flag((open_interest != 0) & (open_interest < self.min_open_interest), lambda row: QualityIssue(
+            severity="warning",
+            message=f"Low open interest: {open_interest_values[row]} (min recommended: {self.min_open_interest})",
+            impact_points=10.0,
+            field="openInterest",
+            value=open_interest_values[row]
+        ))
+
+        # Implied volatility
+        iv, iv_values = column("impliedVolatility")
+        flag(iv <= 0, lambda row: QualityIssue(
+            severity="critical",
+            message="Missing or invalid implied volatility",
+            impact_points=30.0,
+            field="impliedVolatility",
+            value=iv_values[row]
+        ))
+        flag(iv > self.max_iv_threshold, lambda row: QualityIssue(
+            severity="warning",
+            message=f"Extremely high IV: {iv_values[row]:.1%} (may be erroneous)",
+            impact_points=20.0,
+            field="impliedVolatility",
+            value=iv_values[row]
+        ))
+        flag(~(iv > self.max_iv_threshold) & (iv > 2.0), lambda row: QualityIssue(
+            severity="info",
+            message=f"Very high IV: {iv_values[row]:.1%}",
+            impact_points=5.0,
+            field="impliedVolatility",
+            value=iv_values[row]
+        ))
+
+        # Contract specifications
+        strike, strike_values = column("strike")
+        invalid_strike = strike <= 0
+        flag(invalid_strike, lambda row: QualityIssue(
+            severity="critical",
+            message="Invalid strike price",
+            impact_points=30.0,
+            field="strike",
+            value=strike_values[row]
+        ))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            moneyness = np.abs(strike - stock_price) / stock_price
+        moneyness_values = moneyness.tolist()
+        flag(~invalid_strike & (stock_price > 0) & (moneyness > 0.50), lambda row: QualityIssue(
+            severity="warning",
+            message=f"Deep OTM option: {moneyness_values[row]:.1%} from stock price",
+            impact_points=10.0,
+            field="moneyness",
+            value=moneyness_values[row]
+        ))
+
+        expirations = options["expiration"].tolist() if "expiration" in options.columns else [""] * row_count
+        days_by_expiration: Dict[Any, Optional[int]] = {}
+        today = datetime.now().date()
+        for row in np.flatnonzero(~invalid_strike):
+            expiration_str = expirations[row]
+            if not expiration_str:
+                continue
+            if expiration_str not in days_by_expiration:
+                try:
+                    exp_date = datetime.fromisoformat(expiration_str.replace('Z', '+00:00'))
+                    days_by_expiration[expiration_str] = (exp_date.date() - today).days
+                except (ValueError, AttributeError):
+                    days_by_expiration[expiration_str] = None
+            issue = self._expiration_issue(expiration_str, days_by_expiration[expiration_str])
+            if issue is not None:
+                found[row].append(issue)
+
+        qualities: List[DataQuality] = []
+        scores: List[float] = []
+        issues: List[List[QualityIssue]] = []
+        warnings: List[List[QualityIssue]] = []
+        for row_issues in found:
+            score = max(0.0, 100.0 - sum(issue.impact_points for issue in row_issues))
+            qualities.append(self._quality_for_score(score))
+            scores.append(score)
+            issues.append([issue for issue in row_issues if issue.severity == "critical"])
+            warnings.append([issue for issue in row_issues if issue.severity in ["warning", "info"]])
+
+        return pd.DataFrame(
+            {"quality": qualities, "score": scores, "issues": issues, "warnings": warnings},
+            index=options.index,
+        )
+
+    @staticmethod
+    def _quality_for_score(score: float) -> DataQuality:
+        if score >= 95:
+            return DataQuality.INSTITUTIONAL
+        if score >= 80:
+            return DataQuality.HIGH
+        if score >= 60:
+            return DataQuality.MEDIUM
+        if score >= 40:
+            return DataQuality.LOW
+        return DataQuality.REJECTED
+
+    @staticmethod
+    def _expiration_issue(expiration_str: Any, days_to_exp: Optional[int]) -> Optional[QualityIssue]:
+        if days_to_exp is None:
+            return QualityIssue(
+                severity="warning",
+                message="Could not parse expiration date",
+                impact_points=10.0,
+                field="expiration",
+                value=expiration_str
+            )
+        if days_to_exp < 0:
+            return QualityIssue(
+                severity="critical",
+                message="Option has already expired",
+                impact_points=100.0,
+                field="expiration",
+                value=expiration_str
+            )
+        if days_to_exp == 0:
+            return QualityIssue(
+                severity="critical",
+                message="Option expires today - extreme time risk",
+                impact_points=50.0,
+                field="expiration",
+                value=expiration_str
+            )
+        if days_to_exp == 1:
+            return QualityIssue(
+                severity="warning",
+                message="Option expires tomorrow - high time risk",
+                impact_points=25.0,
+                field="expiration",
+                value=expiration_str
+            )
+        return None
+
     def _validate_stock_price(self, opp: Dict[str, Any]) -> List[QualityIssue]:
         """Validate stock price data quality."""
         issues = []
@@ -465,42 +776,13 @@ class OptionsDataQualityValidator:
         expiration_str = opp.get('expiration', '')
         if expiration_str:
             try:
-                from datetime import datetime
                 exp_date = datetime.fromisoformat(expiration_str.replace('Z', '+00:00'))
-                days_to_exp = (exp_date.date() - datetime.now().date()).days
-                
-                if days_to_exp < 0:
-                    issues.append(QualityIssue(
-                        severity="critical",
-                        message="Option has already expired",
-                        impact_points=100.0,
-                        field="expiration",
-                        value=expiration_str
-                    ))
-                elif days_to_exp == 0:
-                    issues.append(QualityIssue(
-                        severity="critical",
-                        message="Option expires today - extreme time risk",
-                        impact_points=50.0,
-                        field="expiration", 
-                        value=expiration_str
-                    ))
-                elif days_to_exp == 1:
-                    issues.append(QualityIssue(
-                        severity="warning",
-                        message="Option expires tomorrow - high time risk",
-                        impact_points=25.0,
-                        field="expiration",
-                        value=expiration_str
-                    ))
+                days_to_exp: Optional[int] = (exp_date.date() - datetime.now().date()).days
             except (ValueError, AttributeError):
-                issues.append(QualityIssue(
-                    severity="warning",
-                    message="Could not parse expiration date",
-                    impact_points=10.0,
-                    field="expiration",
-                    value=expiration_str
-                ))
+                days_to_exp = None
+            issue = self._expiration_issue(expiration_str, days_to_exp)
+            if issue is not None:
+                issues.append(issue)
                 
         return issues
     
@@ -625,5 +907,6 @@ __all__ = [
     "QualityReport",
     "OptionsDataQualityValidator",
     "OptionsDataValidator",  # Alias for backward compatibility
-    "DataQualityFilter"
+    "DataQualityFilter",
+    "UNTRADEABLE_QUALITIES",
 ]
\ No newline at end of file
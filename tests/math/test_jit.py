@@ -0,0 +1,40 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from src.math import jit
+
+pytestmark = pytest.mark.skipif(not jit.NUMBA_AVAILABLE, reason="numba is not installed")
+
+
+def test_importing_signals_does_not_import_numba():
+    code = "import sys, src.signals, src.scanner.vectorized; print('numba' in sys.modules)"
+
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    assert output.strip() == "False"
+
+
+@jit.njit
+def _double(value):
+    return 2.0 * value
+
+
+@jit.njit(error_model="numpy")
+def _double_all(values, out):
+    for index in range(values.shape[0]):
+        out[index] = _double(values[index])
+
+
+def test_lazy_kernels_compile_on_first_call_and_replace_themselves():
+    placeholder = _double_all
+    out = np.empty(3)
+
+    placeholder(np.array([1.0, 2.0, 3.0]), out)
+
+    assert out.tolist() == [2.0, 4.0, 6.0]
+    assert hasattr(globals()["_double_all"], "signatures")
+    assert hasattr(globals()["_double"], "signatures")
+    assert placeholder.__name__ == "_double_all"
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+import src.scanner.service as service
+from src.scanner.service import ScanResult
+
+
+def test_deep_scan_runs_batches_concurrently_with_serialized_rotation(monkeypatch: pytest.MonkeyPatch) -> None:
+    rotation = {"position": 0}
+    universe = ["AAPL", "MSFT", "TSLA", "NVDA", "AMD", "META"]
+    threads: set[str] = set()
+
+    def builder(settings, batch_size, state):
+        position = rotation["position"]
+        time.sleep(0.01)  # widen the race window if selection were not serialized
+        rotation["position"] = position + batch_size
+        return universe[position : position + batch_size], {"position": rotation["position"]}
+
+    def fake_run_scan(
+        max_symbols, *, force_refresh, batch_builder, allow_relaxed_fallback, shared_cache, fetch_workers
+    ):
+        assert shared_cache is False
+        assert fetch_workers * 3 <= service.DEEP_SCAN_MAX_FETCH_WORKERS
+        threads.add(threading.current_thread().name)
+        symbols, _ = batch_builder(None, 2, None)
+        time.sleep(0.05)
+        opportunities: List[Dict[str, Any]] = [{"symbol": symbol, "maxReturn": 1.0, "score": 50.0} for symbol in symbols]
+        metadata = {"requestedSymbols": symbols, "symbols": symbols, "opportunityCount": 2, "totalOptions": 10}
+        return ScanResult(opportunities, metadata)
+
+    monkeypatch.setattr(service, "run_scan", fake_run_scan)
+
+    result = service.run_deep_scan(3, batch_builder=builder)
+
+    assert sorted(result.metadata["requestedSymbols"]) == sorted(universe)
+    assert result.metadata["totalOptions"] == 30
+    assert [meta["batch"] for meta in result.metadata["deepScan"]["metadata"]] == [1, 2, 3]
+    assert len(threads) > 1
+
+
+class FakeChain:
+    def __init__(self, frame: pd.DataFrame) -> None:
+        self.frame = frame
+
+    def to_dataframe(self) -> pd.DataFrame:
+        return self.frame
+
+
+class FakeAdapter:
+    """Adapter that records how many chain requests are in flight at once."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def get_expirations(self, symbol: str) -> List[str]:
+        return [(date.today() + timedelta(days=14)).isoformat()]
+
+    def get_chain(self, symbol: str, expiration: str) -> FakeChain:
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.05)
+        with self.lock:
+            self.in_flight -= 1
+        frame = pd.DataFrame(
+            {"symbol": [symbol], "type": ["call"], "strike": [100.0], "expiration": [expiration], "stockPrice": [100.0]}
+        )
+        return FakeChain(frame)
+
+
+def test_deep_scan_batches_fetch_their_own_chains_without_the_shared_cache(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    adapter = FakeAdapter()
+    monkeypatch.setattr("scripts.bulk_options_fetcher.get_options_data_adapter", lambda: adapter)
+    monkeypatch.setattr(service, "DEEP_SCAN_MAX_FETCH_WORKERS", 4)
+    monkeypatch.setattr(service, "RejectionTracker", MagicMock)
+
+    universe = [f"S{index:02d}" for index in range(12)]
+    rotation = {"position": 0}
+
+    def builder(settings, batch_size, state):
+        position = rotation["position"]
+        rotation["position"] = position + 4
+        return universe[position : position + 4], {"position": rotation["position"]}
+
+    analyzed: List[tuple[List[str], List[str]]] = []
+
+    def fake_analyze(self, options_data, **kwargs):
+        analyzed.append((sorted(self.current_batch_symbols), sorted(options_data["symbol"].unique())))
+        return []
+
+    monkeypatch.setattr(service.SmartOptionsScanner, "analyze_opportunities", fake_analyze)
+
+    result = service.run_deep_scan(3, max_symbols=4, batch_builder=builder, allow_relaxed_fallback=False)
+
+    assert sorted(result.metadata["symbols"]) == universe
+    assert len(analyzed) == 3
+    assert all(requested == fetched for requested, fetched in analyzed)
+    assert 1 < adapter.peak <= 4
+    assert not list(tmp_path.glob("*options_cache*"))
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from src.scanner.service import SmartOptionsScanner
+
+
+def make_scanner() -> SmartOptionsScanner:
+    return SmartOptionsScanner.__new__(SmartOptionsScanner)  # type: ignore[return-value]
+
+
+def make_option(option_type: str = "call") -> pd.Series:
+    return pd.Series(
+        {
+            "symbol": "AAPL",
+            "type": option_type,
+            "strike": 100.0,
+            "stockPrice": 102.0,
+            "lastPrice": 2.5,
+            "impliedVolatility": 0.35,
+            "expiration": (datetime.now() + timedelta(days=21)).date().isoformat(),
+        }
+    )
+
+
+SWING_SIGNAL = {
+    "factors": [
+        {"name": "Momentum Breakout", "details": {"momentum_zscore": 1.8}},
+        {"name": "News & Catalysts", "details": {"average_sentiment": 0.2}},
+        {"name": "Volatility Expansion", "details": {"atr_ratio": 1.2}},
+    ]
+}
+
+
+def test_bias_without_signals_matches_full_bias() -> None:
+    scanner = make_scanner()
+    option = make_option()
+
+    full = scanner.calculate_directional_bias(option, SWING_SIGNAL)
+    lean = scanner.calculate_directional_bias(option, SWING_SIGNAL, include_signals=False)
+
+    assert lean["signals"] is None
+    assert lean["relevantMetrics"] is None
+    for key in ("direction", "confidence", "alignment", "recommendation", "scores"):
+        assert lean[key] == full[key]
+    assert full["direction"] == "bullish"
+    assert full["scores"]["bullish"] == 40
+
+
+def test_attach_directional_signals_fills_deferred_fields() -> None:
+    scanner = make_scanner()
+    option = make_option("put")
+
+    full = scanner.calculate_directional_bias(option, SWING_SIGNAL)
+    lean = scanner.calculate_directional_bias(option, SWING_SIGNAL, include_signals=False)
+    scanner._attach_directional_signals(lean, option, SWING_SIGNAL)
+
+    assert lean == full
+    assert list(full["signals"]) == ["momentum", "news", "volatility", "moneyness", "delta"]
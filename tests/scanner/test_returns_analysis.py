@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+from src.scanner.service import DEFAULT_IMPLIED_VOLATILITY, MODEL_IV_COLUMN, SmartOptionsScanner, _model_iv, _nearest_scenario, _notna
+
+
+def make_scanner() -> SmartOptionsScanner:
+    return SmartOptionsScanner.__new__(SmartOptionsScanner)  # type: ignore[return-value]
+
+
+def make_option(option_type: str, dte: int, iv: float, strike: float = 100.0) -> pd.Series:
+    return pd.Series(
+        {
+            "symbol": "TEST",
+            "type": option_type,
+            "strike": strike,
+            "stockPrice": 100.0,
+            "lastPrice": 1.75,
+            "impliedVolatility": iv,
+            "expiration": (datetime.now() + timedelta(days=dte, hours=12)).date().isoformat(),
+        }
+    )
+
+
+def test_nearest_scenario_picks_closest_move() -> None:
+    moves = [-0.1, -0.05, 0.0, 0.05, 0.1]
+    scenarios = [{"move": move, "roi_percent": move * 100, "net_profit": move} for move in moves]
+
+    assert _nearest_scenario(moves, scenarios, 0.04)["move"] == 0.05
+    assert _nearest_scenario(moves, scenarios, -0.2)["move"] == -0.1
+    assert _nearest_scenario(moves, scenarios, 0.3)["move"] == 0.1
+    assert _nearest_scenario(moves, scenarios, 0.025)["move"] == 0.0
+    assert _nearest_scenario([], [], 0.1) == {"roi_percent": 0.0, "net_profit": 0.0}
+
+
+def test_model_iv_prefers_precomputed_column() -> None:
+    option = make_option("call", 10, float("nan"))
+    assert _model_iv(option) == DEFAULT_IMPLIED_VOLATILITY
+
+    option[MODEL_IV_COLUMN] = 0.42
+    assert _model_iv(option) == 0.42
+
+
+@pytest.mark.parametrize("value", [0.4, 0, float("nan"), None, float("inf")])
+def test_notna_matches_pandas_for_scalars(value) -> None:
+    assert _notna(value) == pd.notna(value)
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_expected_move_scenarios_match_linear_scan(option_type: str) -> None:
+    scanner = make_scanner()
+    rng = random.Random(7)
+
+    for _ in range(50):
+        dte = rng.choice([1, 2, 5, 7, 14, 45])
+        iv = rng.uniform(0.05, 1.2)
+        strike = rng.uniform(85.0, 115.0)
+        option = make_option(option_type, dte, iv, strike)
+
+        scenarios, metrics = scanner.calculate_returns_analysis(option)
+
+        expected_1sd = metrics["expectedMove1SD"] / 100
+        sign = 1 if option_type == "call" else -1
+        for target, key in ((sign * expected_1sd, "expectedMoveRoiPercent"), (sign * expected_1sd * 2, "optimisticMoveRoiPercent")):
+            closest = min(scenarios, key=lambda item: abs(item["movePct"] / 100 - target))
+            assert metrics[key] == pytest.approx(closest["return"])
+
+
+def test_option_days_to_expiration_reuses_prescored_column() -> None:
+    scanner = make_scanner()
+    option = make_option("call", 10, 0.4)
+    parsed = scanner.calculate_days_to_expiration(option["expiration"])
+
+    assert scanner._option_days_to_expiration(option) == parsed
+    option["_dte"] = 3
+    assert scanner._option_days_to_expiration(option) == 3
+    assert scanner.calculate_days_to_expiration("not a date") == 30
+
+
+def test_days_to_expiration_uses_pinned_scan_clock() -> None:
+    scanner = make_scanner()
+    now = datetime.now(timezone.utc)
+    expiration = (now.astimezone() + timedelta(days=10, hours=1)).replace(tzinfo=None).isoformat()
+
+    assert scanner.calculate_days_to_expiration(expiration, now=now) == 10
+    assert scanner.calculate_days_to_expiration(expiration, now=now + timedelta(days=4)) == 6
+    assert scanner.calculate_days_to_expiration(expiration, now=now + timedelta(days=30)) == 0
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, Dict, List, Mapping
+
+import pytest
+
+from src.scanner.service import SmartOptionsScanner
+
+
+def make_scanner(builder) -> SmartOptionsScanner:
+    scanner = SmartOptionsScanner.__new__(SmartOptionsScanner)
+    scanner.settings = None  # type: ignore[assignment]
+    scanner.fetcher = SimpleNamespace(priority_symbols=["AAPL", "MSFT", "TSLA"])  # type: ignore[assignment]
+    scanner.symbol_limit = 2
+    scanner.universe_builder = builder
+    scanner.rotation_state = {"mode": "round_robin"}
+    return scanner
+
+
+def test_rotation_state_is_read_only_and_adopted_without_copy() -> None:
+    seen: List[Mapping[str, Any]] = []
+    returned: Dict[str, Any] = {"mode": "round_robin", "position": 2}
+
+    def builder(settings, batch_size, state):
+        seen.append(state)
+        return ["AAPL", "MSFT"], returned
+
+    scanner = make_scanner(builder)
+
+    assert scanner._next_symbol_batch() == ["AAPL", "MSFT"]
+    assert seen == [{"mode": "round_robin"}]
+    assert scanner._rotation_state_raw is returned
+    assert scanner.rotation_state == returned
+    with pytest.raises(TypeError):
+        scanner.rotation_state["position"] = 0  # type: ignore[index]
+
+
+def test_scan_metadata_holds_a_copy_of_rotation_state() -> None:
+    def builder(settings, batch_size, state):
+        return ["AAPL", "MSFT"], {"mode": "round_robin", "position": 2}
+
+    scanner = make_scanner(builder)
+    scanner.data_freshness = None
+    scanner.get_current_options_data = lambda symbols, force_refresh=False: None  # type: ignore[method-assign]
+
+    result = scanner.scan_for_opportunities(allow_relaxed_fallback=False)
+    result.metadata["rotationState"]["position"] = 99
+
+    assert result.metadata["rotationState"] is not scanner._rotation_state_raw
+    assert scanner.rotation_state["position"] == 2
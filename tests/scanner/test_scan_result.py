@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import io
+import json
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+
+from src.models import serialization
+from src.scanner.service import ScanResult, _parse_args
+
+
+@dataclass
+class Issue:
+    message: str
+
+
+def make_result() -> ScanResult:
+    return ScanResult(
+        opportunities=[{"symbol": "AAPL", "score": 88.5, "issues": [Issue("wide spread")]}],
+        metadata={"totalEvaluated": 12, "symbols": ["AAPL"]},
+    )
+
+
+def test_to_json_round_trips_payload() -> None:
+    result = make_result()
+
+    payload = json.loads(result.to_json(indent=2))
+
+    assert payload["totalEvaluated"] == 12
+    assert payload["opportunities"][0]["score"] == 88.5
+    assert payload["opportunities"][0]["issues"] == [str(Issue("wide spread"))]
+    assert result.to_json_bytes() == result.to_json().encode("utf-8")
+
+
+def test_stdlib_fallback_matches_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("orjson")
+    result = make_result()
+    fast = json.loads(result.to_json())
+    fast_numpy = json.loads(serialization.dumps_json({1: np.float64(0.5)}))
+
+    monkeypatch.setattr(serialization, "orjson", None)
+
+    assert json.loads(result.to_json()) == fast
+    assert json.loads(serialization.dumps_json({1: np.float64(0.5)})) == fast_numpy
+
+
+def test_stdlib_fallback_serializes_payload(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(serialization, "orjson", None)
+    result = make_result()
+
+    payload = json.loads(result.to_json())
+
+    assert payload["opportunities"][0]["issues"] == [str(Issue("wide spread"))]
+    assert json.loads(serialization.dumps_json({1: np.float64(0.5)})) == {"1": 0.5}
+    assert serialization.dumps_json_bytes({"a": 1}, indent=2) == b'{\n  "a": 1\n}'
+    assert serialization.loads_json(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_dump_streams_same_payload(indent: int | None) -> None:
+    result = make_result()
+    result.opportunities.append({"symbol": "MSFT", "score": np.float64(71.0)})
+    buffer = io.BytesIO()
+
+    result.dump(buffer, indent=indent)
+
+    assert buffer.getvalue().endswith(b"\n")
+    assert json.loads(buffer.getvalue()) == json.loads(result.to_json())
+
+
+def test_dump_handles_empty_result() -> None:
+    buffer = io.BytesIO()
+
+    ScanResult([], {}).dump(buffer)
+
+    assert json.loads(buffer.getvalue()) == {"opportunities": [], "metadata": {}, "totalEvaluated": 0}
+
+
+def test_dump_lines_emits_one_record_per_line() -> None:
+    result = make_result()
+    buffer = io.BytesIO()
+
+    result.dump_lines(buffer)
+
+    lines = [json.loads(line) for line in buffer.getvalue().splitlines()]
+    assert lines[0]["symbol"] == "AAPL"
+    assert lines[-1] == {"__meta__": result.metadata}
+    assert len(lines) == len(result.opportunities) + 1
+
+
+def test_zero_indent_is_compact() -> None:
+    result = make_result()
+
+    assert result.to_json(indent=0) == result.to_json()
+    assert "\n" not in result.to_json(indent=0)
+    assert "\n" in result.to_json(indent=2)
+
+
+def test_cli_compact_flag_sets_zero_indent() -> None:
+    assert _parse_args([]).json_indent == 0
+    assert _parse_args(["--json-indent", "2", "--compact"]).json_indent == 0
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import List, Optional
+
+import pandas as pd
+import yfinance.multi
+
+from src.scanner.service import SmartOptionsScanner
+
+
+class StubScanner(SmartOptionsScanner):
+    def __init__(self, workers: int) -> None:
+        self.analysis_workers = workers
+        self.swing_analyzer = object()  # type: ignore[assignment]
+        self.swing_calls: List[str] = []
+        self.threads: set[str] = set()
+        self._lock = threading.Lock()
+
+    def _fetch_price_history(self, symbol: str) -> Optional[pd.DataFrame]:
+        with self._lock:
+            self.threads.add(threading.current_thread().name)
+        if symbol == "MISSING":
+            return None
+        return pd.DataFrame({"close": [1.0, 2.0]})
+
+    def _swing_signal_for(self, symbol: str):  # type: ignore[override]
+        with self._lock:
+            self.swing_calls.append(symbol)
+        return None, None
+
+
+def test_prefetch_sequential_keeps_swing_signals_lazy() -> None:
+    scanner = StubScanner(workers=1)
+
+    cache = scanner._prefetch_symbol_context(["AAPL", "MISSING", "MSFT"])
+
+    assert list(cache) == ["AAPL", "MSFT"]
+    assert scanner.swing_calls == []
+
+
+def test_prefetch_with_workers_warms_swing_signals() -> None:
+    scanner = StubScanner(workers=4)
+
+    cache = scanner._prefetch_symbol_context(["AAPL", "MISSING", "MSFT"])
+
+    assert list(cache) == ["AAPL", "MSFT"]
+    assert sorted(scanner.swing_calls) == ["AAPL", "MISSING", "MSFT"]
+    assert threading.main_thread().name not in scanner.threads
+
+
+class FakeTicker:
+    """Stand-in for ``yfinance.Ticker`` whose history is keyed to its symbol."""
+
+    def __init__(self, symbol: str) -> None:
+        self.symbol = symbol
+        self._price_history = None
+
+    def history(self, **_kwargs) -> pd.DataFrame:
+        time.sleep(0.02)
+        index = pd.date_range("2024-01-01", periods=2, freq="D", tz="America/New_York")
+        close = float(sum(map(ord, self.symbol)))
+        return pd.DataFrame(
+            {"Open": close, "High": close, "Low": close, "Close": close, "Volume": 1.0},
+            index=index,
+        )
+
+
+class DownloadingScanner(StubScanner):
+    _fetch_price_history = SmartOptionsScanner._fetch_price_history
+
+
+def test_concurrent_prefetch_returns_each_symbols_own_history(monkeypatch) -> None:
+    monkeypatch.setattr(yfinance.multi, "Ticker", FakeTicker)
+    symbols = ["AAPL", "MSFT", "NVDA", "AMZN", "META", "TSLA", "GOOG", "AMD"]
+    scanner = DownloadingScanner(workers=len(symbols))
+
+    cache = scanner._prefetch_symbol_context(symbols)
+
+    assert list(cache) == symbols
+    for symbol, history in cache.items():
+        assert list(history["close"]) == [float(sum(map(ord, symbol)))] * 2
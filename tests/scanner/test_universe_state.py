@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import gzip
+import json
+import random
+from pathlib import Path
+
+from src.scanner import universe
+from src.scanner.universe import (
+    UniverseRotationState,
+    _load_persisted_state,
+    _next_batch,
+    _persist_state,
+    _prepare_random,
+    _prepare_round_robin,
+)
+
+
+def test_persisted_state_round_trips(tmp_path: Path) -> None:
+    path = tmp_path / "state" / "universe.json.gz"
+    state = {"mode": "round_robin", "position": 40, "order": ["AAPL", "MSFT"], "seed": None}
+
+    _persist_state(path, state)
+
+    assert json.loads(gzip.decompress(path.read_bytes())) == state
+    assert UniverseRotationState.from_mapping(_load_persisted_state(path)).to_dict() == state
+
+
+def test_legacy_json_state_is_loaded(tmp_path: Path) -> None:
+    legacy = tmp_path / "universe.json"
+    legacy.write_text(json.dumps({"position": 7, "order": ["SPY"]}, indent=2), encoding="utf-8")
+
+    assert _load_persisted_state(tmp_path / "universe.json.gz") == {"position": 7, "order": ["SPY"]}
+
+
+def test_missing_or_corrupt_state_loads_empty(tmp_path: Path) -> None:
+    path = tmp_path / "universe.json.gz"
+    assert _load_persisted_state(path) == {}
+
+    path.write_bytes(b"\x1f\x8b not really gzip")
+    assert _load_persisted_state(path) == {}
+
+    path.write_bytes(gzip.compress(b"{not json"))
+    assert _load_persisted_state(path) == {}
+
+
+def test_round_robin_keeps_known_order_and_appends_new_symbols() -> None:
+    state = UniverseRotationState(order=["MSFT", "OLD", "AAPL"], position=2)
+
+    prepared = _prepare_round_robin(state, ["AAPL", "NVDA", "MSFT"])
+
+    assert prepared.order == ["MSFT", "AAPL", "NVDA"]
+    assert prepared.position == 2
+
+
+def test_random_order_reshuffles_only_when_universe_changes() -> None:
+    state = UniverseRotationState(mode="random", order=["B", "A", "C"], position=1, seed=3)
+
+    assert _prepare_random(state, ["A", "B", "C"]).order == ["B", "A", "C"]
+
+    reshuffled = _prepare_random(state, ["A", "B", "D"])
+    assert sorted(reshuffled.order) == ["A", "B", "D"]
+    assert reshuffled.position == 0
+
+
+def test_state_is_served_from_cache_until_file_changes(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "universe.json.gz"
+    _persist_state(path, {"position": 1, "order": ["AAPL"]})
+    assert [p.name for p in tmp_path.iterdir()] == ["universe.json.gz"]
+
+    def fail(_path: Path):
+        raise AssertionError("state should come from the cache")
+
+    monkeypatch.setattr(universe, "_read_state_file", fail)
+    cached = _load_persisted_state(path)
+    assert UniverseRotationState.from_mapping(cached) == UniverseRotationState(position=1, order=["AAPL"])
+    monkeypatch.undo()
+
+    path.write_bytes(gzip.compress(json.dumps({"position": 9, "order": ["AAPL", "MSFT"]}).encode()))
+    assert dict(_load_persisted_state(path)) == {"position": 9, "order": ("AAPL", "MSFT")}
+
+
+def test_next_batch_wraps_around_the_order() -> None:
+    order = ["A", "B", "C", "D", "E"]
+
+    assert _next_batch(order, 3, 4) == (["D", "E", "A", "B"], 2)
+    assert _next_batch(order, 1, 2) == (["B", "C"], 3)
+    assert _next_batch(order, 4, 9) == (order, 3)
+    assert order == ["A", "B", "C", "D", "E"]
+
+
+def test_cached_state_is_isolated_from_caller_mutation(tmp_path: Path) -> None:
+    path = tmp_path / "universe.json.gz"
+    payload = {"position": 0, "order": ["AAPL", "MSFT"]}
+    _persist_state(path, payload)
+
+    payload["order"].append("TSLA")
+
+    assert list(_load_persisted_state(path)["order"]) == ["AAPL", "MSFT"]
+
+
+def test_random_order_is_reproducible_from_bootstrapped_seed() -> None:
+    universe_symbols = ["A", "B", "C", "D", "E", "F"]
+
+    prepared = _prepare_random(UniverseRotationState(mode="random"), universe_symbols)
+
+    expected = list(universe_symbols)
+    random.Random(prepared.seed).shuffle(expected)
+    assert prepared.seed is not None
+    assert prepared.order == expected
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import math
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.scanner import vectorized
+from src.scanner.service import SmartOptionsScanner
+
+
+def make_scanner() -> SmartOptionsScanner:
+    return SmartOptionsScanner.__new__(SmartOptionsScanner)  # type: ignore[return-value]
+
+
+def make_chain(rows: int = 300, seed: int = 11) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    today = datetime.now()
+    stock_price = rng.uniform(5, 500, rows)
+    iv = rng.uniform(0.05, 1.5, rows)
+    iv[::17] = np.nan
+    return pd.DataFrame(
+        {
+            "symbol": rng.choice(["AAPL", "MSFT", "TSLA"], rows),
+            "type": rng.choice(["call", "put"], rows),
+            "stockPrice": stock_price,
+            "strike": stock_price * rng.uniform(0.1, 3.5, rows),
+            "lastPrice": rng.uniform(0.06, 40, rows),
+            "bid": rng.uniform(0.01, 30, rows),
+            "ask": rng.uniform(0.05, 45, rows),
+            "volume": rng.integers(101, 20_000, rows).astype(float),
+            "openInterest": rng.integers(101, 20_000, rows).astype(float),
+            "impliedVolatility": iv,
+            "expiration": [
+                (today + timedelta(days=int(days), hours=12)).date().isoformat()
+                for days in rng.choice([0, 1, 2, 3, 5, 7, 12, 30, 45, 90], rows)
+            ],
+        }
+    )
+
+
+def test_vectorized_metrics_match_scalar_methods() -> None:
+    scanner = make_scanner()
+    chain = make_chain()
+    dte = np.array([scanner.calculate_days_to_expiration(exp) for exp in chain["expiration"]])
+    model_iv = chain["impliedVolatility"].fillna(0.30).to_numpy()
+
+    metrics = vectorized.returns_metrics(
+        chain["stockPrice"].to_numpy(),
+        chain["strike"].to_numpy(),
+        chain["lastPrice"].to_numpy(),
+        model_iv,
+        dte,
+        (chain["type"] == "call").to_numpy(),
+    )
+    probability = vectorized.probability_scores(metrics.breakeven_move_percent, model_iv, dte)
+    scores = vectorized.opportunity_scores(
+        chain["volume"].to_numpy(),
+        chain["openInterest"].to_numpy(),
+        chain["bid"].to_numpy(),
+        chain["ask"].to_numpy(),
+        chain["lastPrice"].to_numpy(),
+        chain["impliedVolatility"].to_numpy(),
+        metrics,
+        probability,
+    )
+
+    for index, (_, option) in enumerate(chain.iterrows()):
+        _, expected = scanner.calculate_returns_analysis(option)
+        expected_probability = scanner.calculate_probability_score(option, expected)
+        expected_score = scanner.calculate_opportunity_score(option, expected, expected_probability)
+
+        assert metrics.best_roi_percent[index] == pytest.approx(expected["bestRoiPercent"], rel=1e-12)
+        assert metrics.expected_move_roi_percent[index] == pytest.approx(expected["expectedMoveRoiPercent"], rel=1e-12)
+        assert metrics.expected_move_net_profit[index] == pytest.approx(expected["expectedMoveNetProfit"], rel=1e-12)
+        assert metrics.breakeven_move_percent[index] == pytest.approx(expected["breakevenMovePercent"], rel=1e-12)
+        assert probability[index] == pytest.approx(expected_probability, rel=1e-12)
+        assert scores[index] == pytest.approx(expected_score, rel=1e-12, abs=1e-9)
+
+
+def test_prescore_contracts_matches_scalar_gates() -> None:
+    scanner = make_scanner()
+    chain = make_chain(seed=5)
+
+    survivors = scanner._prescore_contracts(chain)
+
+    expected_index = []
+    for index, option in chain.iterrows():
+        _, metrics = scanner.calculate_returns_analysis(option)
+        probability = scanner.calculate_probability_score(option, metrics)
+        score = scanner.calculate_opportunity_score(option, metrics, probability)
+        if score < 45 or probability < 5 or metrics["expectedMoveRoiPercent"] < 3:
+            continue
+        stock_price, strike = float(option["stockPrice"]), float(option["strike"])
+        if strike < stock_price * 0.20 or strike > stock_price * 3.0:
+            continue
+        moneyness = (stock_price - strike) if option["type"] == "call" else (strike - stock_price)
+        if moneyness / stock_price > 0.15:
+            continue
+        expected_index.append(index)
+
+    assert expected_index, "fixture should produce at least one survivor"
+    assert list(survivors.index) == expected_index
+    for index, option in survivors.iterrows():
+        assert option["_dte"] == scanner.calculate_days_to_expiration(option["expiration"])
+        assert math.isfinite(option["_opportunity_score"])
+
+
+def test_black_scholes_greeks_match_scalar_method() -> None:
+    scanner = make_scanner()
+    chain = make_chain(rows=120, seed=3)
+    chain["impliedVolatility"] = chain["impliedVolatility"].fillna(0.30)
+    dte = np.array([scanner.calculate_days_to_expiration(exp) for exp in chain["expiration"]])
+
+    greeks = vectorized.black_scholes_greeks(
+        chain["stockPrice"].to_numpy(),
+        chain["strike"].to_numpy(),
+        chain["impliedVolatility"].to_numpy(),
+        dte,
+        (chain["type"] == "call").to_numpy(),
+    )
+
+    for index, (_, option) in enumerate(chain.iterrows()):
+        expected = scanner.calculate_greeks_approximation(option)
+        for name in ("delta", "gamma", "theta", "vega"):
+            assert greeks[name][index] == pytest.approx(expected[name], rel=1e-9, abs=1e-12)
+
+
+def test_black_scholes_greeks_zero_for_invalid_inputs() -> None:
+    greeks = vectorized.black_scholes_greeks(
+        np.array([100.0, 0.0, 100.0]),
+        np.array([100.0, 100.0, 100.0]),
+        np.array([0.0, 0.3, np.nan]),
+        np.array([10, 10, 10]),
+        np.array([True, False, True]),
+    )
+
+    for values in greeks.values():
+        assert values.tolist() == [0.0, 0.0, 0.0]
+
+
+def test_greeks_use_prescored_columns() -> None:
+    scanner = make_scanner()
+    survivors = scanner._prescore_contracts(make_chain(seed=5))
+
+    for option in survivors.to_dict(orient="records"):
+        greeks = scanner.calculate_greeks_approximation(option)
+        assert greeks["delta"] == option["_delta"]
+        option = {key: value for key, value in option.items() if not key.startswith("_")}
+        option["impliedVolatility"] = option["impliedVolatility"] if pd.notna(option["impliedVolatility"]) else 0.30
+        scalar = scanner.calculate_greeks_approximation(option)
+        assert greeks == pytest.approx(scalar, rel=1e-9, abs=1e-12)
+
+
+def test_black_scholes_greeks_numpy_fallback_matches(monkeypatch: pytest.MonkeyPatch) -> None:
+    chain = make_chain(rows=60, seed=9)
+    args = (
+        chain["stockPrice"].to_numpy(),
+        chain["strike"].to_numpy(),
+        chain["impliedVolatility"].to_numpy(),
+        np.full(len(chain), 12.0),
+        (chain["type"] == "call").to_numpy(),
+    )
+    default = vectorized.black_scholes_greeks(*args)
+
+    monkeypatch.setattr(vectorized, "NUMBA_AVAILABLE", False)
+    fallback = vectorized.black_scholes_greeks(*args)
+
+    for name, values in default.items():
+        np.testing.assert_allclose(fallback[name], values, rtol=1e-9, atol=1e-12)
+
+
+def test_probability_scores_numpy_fallback_matches(monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = np.random.default_rng(21)
+    breakeven = rng.uniform(-40, 40, 200)
+    iv = rng.uniform(0.0, 1.5, 200)
+    iv[::25] = 0.0
+    dte = rng.integers(-1, 60, 200)
+    default = vectorized.probability_scores(breakeven, iv, dte)
+
+    monkeypatch.setattr(vectorized, "NUMBA_AVAILABLE", False)
+    fallback = vectorized.probability_scores(breakeven, iv, dte)
+
+    np.testing.assert_allclose(fallback, default, rtol=1e-12)
+    assert default[dte <= 0].tolist() == [0.0] * int((dte <= 0).sum())
+
+
+def test_returns_analysis_rows_match_scalar_method() -> None:
+    scanner = make_scanner()
+    chain = make_chain(rows=150, seed=17)
+    dte = np.array([scanner.calculate_days_to_expiration(exp) for exp in chain["expiration"]])
+
+    metrics = vectorized.returns_metrics(
+        chain["stockPrice"].to_numpy(),
+        chain["strike"].to_numpy(),
+        chain["lastPrice"].to_numpy(),
+        chain["impliedVolatility"].fillna(0.30).to_numpy(),
+        dte,
+        (chain["type"] == "call").to_numpy(),
+    )
+
+    for index, (_, option) in enumerate(chain.iterrows()):
+        expected_scenarios, expected_metrics = scanner.calculate_returns_analysis(option)
+        scenarios, row_metrics = metrics.analysis(index)
+
+        assert [item["move"] for item in scenarios] == [item["move"] for item in expected_scenarios]
+        assert [item["return"] for item in scenarios] == pytest.approx([item["return"] for item in expected_scenarios], rel=1e-12)
+        assert row_metrics.keys() == expected_metrics.keys()
+        assert row_metrics == pytest.approx(expected_metrics, rel=1e-12)
+
+
+def test_liquidity_mask_numpy_fallback_matches(monkeypatch: pytest.MonkeyPatch) -> None:
+    chain = make_chain(rows=200, seed=13)
+    chain.loc[::7, "volume"] = 50.0
+    chain.loc[::11, "bid"] = 0.0
+    chain.loc[::19, "openInterest"] = np.nan
+    args = [chain[column].to_numpy() for column in ("volume", "openInterest", "lastPrice", "bid", "ask")]
+    thresholds = {"min_volume": 100, "min_open_interest": 100, "min_last_price": 0.05}
+
+    default = vectorized.liquidity_mask(*args, **thresholds)
+    monkeypatch.setattr(vectorized, "numexpr", None)
+    fallback = vectorized.liquidity_mask(*args, **thresholds)
+
+    assert default.dtype == bool
+    assert default.tolist() == fallback.tolist()
+    assert not default[::7].any()
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import random
 from datetime import date, timedelta
 
+import pytest
+
 from src.models.option import OptionContract, OptionGreeks
+from src.scoring.base import build_batch_frame
+from src.scoring.config import DEFAULT_SCORER_CONFIG, merge_config
 from src.scoring.engine import CompositeScoringEngine
 
 
@@ -92,3 +97,112 @@ def test_custom_score_bounds_are_respected():
 
     assert result.score.total_score <= 60
 
+
+def build_random_batch(rows: int = 300, seed: int = 7):
+    rng = random.Random(seed)
+    contracts, greeks, market = [], [], []
+    for _ in range(rows):
+        stock_price = rng.uniform(20, 400)
+        contracts.append(
+            OptionContract.parse_obj(
+                {
+                    "symbol": rng.choice(["AAPL", "MSFT", "NVDA"]),
+                    "type": rng.choice(["call", "put"]),
+                    "strike": stock_price * rng.uniform(0.85, 1.15),
+                    "expiration": (date.today() + timedelta(days=rng.randint(0, 60))).isoformat(),
+                    "lastPrice": rng.uniform(0.05, 15),
+                    "bid": 1.0,
+                    "ask": 1.1,
+                    "volume": rng.randint(0, 20_000),
+                    "openInterest": rng.choice([100, 499, 500, 1500, 2001, 4000, 6000]),
+                    "impliedVolatility": rng.uniform(0.1, 1.2),
+                    "stockPrice": stock_price,
+                }
+            )
+        )
+        greeks.append(OptionGreeks(gamma=rng.uniform(0, 0.03), vega=rng.uniform(0, 0.3)))
+        data = {}
+        for key, value in (
+            ("volume_ratio", rng.uniform(0, 7)),
+            ("spread_pct", rng.uniform(0, 0.15)),
+            ("theta_ratio", rng.uniform(0, 0.08)),
+            ("moneyness", rng.uniform(0, 0.12)),
+            ("iv_rank", rng.uniform(0, 100)),
+            ("projected_returns", {"10%": rng.uniform(0, 7)}),
+        ):
+            if rng.random() < 0.7:
+                data[key] = value
+        if rng.random() < 0.6:
+            data["gamma_squeeze"] = rng.choice(
+                [
+                    rng.uniform(0, 15),
+                    {"score": 20.0, "risk_level": rng.choice(["low", "HIGH", "EXTREME", "unknown"])},
+                    {"risk_level": "MODERATE", "call_volume_ratio": rng.uniform(0, 3)},
+                ]
+            )
+        if rng.random() < 0.7:
+            data["iv_anomaly"] = {
+                "current_iv": 40.0,
+                "realized_vol": 30.0,
+                **{
+                    key: value
+                    for key, value in (
+                        ("zscore", rng.uniform(-4, 4)),
+                        ("percentile", rng.uniform(0, 1)),
+                        ("iv_rv_spread", rng.uniform(-20, 20)),
+                    )
+                    if rng.random() < 0.8
+                },
+            }
+        if rng.random() < 0.8:
+            data["event_intel"] = {
+                key: value
+                for key, value in (
+                    ("earnings_in_days", rng.uniform(-10, 20)),
+                    ("news_sentiment_score", rng.uniform(-1, 1)),
+                    ("political_hits", rng.choice([[], ["congress"]])),
+                    ("ai_infra_hits", rng.choice([[], ["gpu"]])),
+                    ("volatility_label", rng.choice(["calm", "elevated", "extreme"])),
+                    ("unique_drivers", rng.choice([[], ["buyback"]])),
+                )
+                if rng.random() < 0.5
+            }
+        market.append(data)
+    return contracts, greeks, market
+
+
+def test_score_batch_matches_scalar_scores():
+    contracts, greeks, market = build_random_batch()
+    engine = CompositeScoringEngine({"weights": {"volume": 2.0}, "score_bounds": {"min": 0, "max": 160}})
+    frame = build_batch_frame(contracts, greeks, market)
+
+    totals = engine.score_batch(frame)
+    raw_by_scorer = {scorer.key: scorer.score_vector(frame) for scorer, _ in engine._scorer_weights}
+
+    for index, (contract, greek, data) in enumerate(zip(contracts, greeks, market)):
+        result = engine.score(contract, greek, data)
+        for breakdown in result.score.breakdowns:
+            assert raw_by_scorer[breakdown.scorer][index] == pytest.approx(breakdown.raw_score), breakdown.scorer
+        assert totals[index] == pytest.approx(result.score.total_score, abs=0.005)
+
+
+def test_score_batch_applies_bounds():
+    contracts, greeks, market = build_random_batch(rows=20)
+    frame = build_batch_frame(contracts, greeks, market)
+
+    totals = CompositeScoringEngine({"score_bounds": {"min": 40, "max": 60}}).score_batch(frame)
+
+    assert totals.shape == (20,)
+    assert totals.min() >= 40 and totals.max() <= 60
+
+
+def test_merge_config_shares_read_only_defaults():
+    default = merge_config(None)
+
+    with pytest.raises(TypeError):
+        default["weights"]["volume"] = 9.0  # type: ignore[index]
+
+    merged = merge_config({"weights": {"volume": 2.0}})
+    assert merged["weights"]["volume"] == 2.0
+    assert merged["score_bounds"] is default["score_bounds"]
+    assert merge_config(None)["weights"]["volume"] == DEFAULT_SCORER_CONFIG["weights"]["volume"]
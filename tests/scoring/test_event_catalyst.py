@@ -69,3 +69,15 @@ def test_event_catalyst_penalizes_negative_headlines():
     assert score < 0
     assert any("Headline risk" in reason for reason in reasons)
     assert "headline-risk" in tags
+
+
+def test_event_catalyst_reuses_numeric_intel_for_shared_mapping():
+    scorer = EventCatalystScorer()
+    intel = {"earnings_in_days": "5", "news_sentiment_score": "bad"}
+    first = scorer.score(_build_context(intel))
+
+    cached = scorer._numeric_intel(intel)
+    assert cached.earnings_in_days == 5.0
+    assert cached.news_sentiment_score is None
+    assert scorer.score(_build_context(intel)) == first
+    assert scorer._numeric_intel(dict(intel)) is not cached
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from src.models.option import OptionContract, OptionGreeks
+from src.scoring.base import ScoreContext
+from src.scoring.volume import VolumeScorer
+
+
+def _build_context(ratio: float) -> ScoreContext:
+    contract = OptionContract.model_validate(
+        {
+            "symbol": "AAPL",
+            "type": "call",
+            "strike": 150.0,
+            "expiration": "2030-01-17",
+            "lastPrice": 5.4,
+            "bid": 5.3,
+            "ask": 5.5,
+            "volume": 8000,
+            "openInterest": 12000,
+            "impliedVolatility": 0.45,
+            "stockPrice": 151.0,
+        }
+    )
+    return ScoreContext(contract=contract, greeks=OptionGreeks(), market_data={"volume_ratio": ratio}, config={})
+
+
+def test_volume_bands_use_strict_thresholds():
+    scorer = VolumeScorer()
+    ratios = [0.0, 1.0, 1.5, 2.0, 3.0, 4.0, 5.0, 5.5, math.nan]
+    expected = [3.0, 3.0, 8.0, 8.0, 15.0, 25.0, 25.0, 35.0, 3.0]
+
+    assert [scorer.score(_build_context(ratio))[0] for ratio in ratios] == expected
+
+    scores, bands = VolumeScorer.score_batch(np.array(ratios))
+    assert scores.tolist() == expected
+    assert bands.tolist() == [0, 0, 1, 1, 2, 3, 3, 4, 0]
+
+
+def test_volume_reasons_and_tags_follow_band():
+    score, reasons, tags = VolumeScorer().score(_build_context(6.0))
+
+    assert score == 35.0
+    assert reasons == ["Extreme unusual volume (6.0x open interest)"]
+    assert tags == ["unusual-volume", "smart-money"]
+    assert VolumeScorer().score(_build_context(1.5))[1:] == ([], [])
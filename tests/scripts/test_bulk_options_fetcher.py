@@ -6,7 +6,12 @@ from types import SimpleNamespace
 import pandas as pd
 import pytest
 
-from scripts.bulk_options_fetcher import BulkOptionsFetcher, RuntimeBudgetExceeded
+from scripts.bulk_options_fetcher import (
+    BASE_PRIORITY_SYMBOLS,
+    BulkOptionsFetcher,
+    RuntimeBudgetExceeded,
+    build_priority_symbols,
+)
 
 
 def make_fetcher(monkeypatch: pytest.MonkeyPatch) -> BulkOptionsFetcher:
@@ -234,3 +239,56 @@ def test_fetch_bulk_options_parallel_respects_time_budget(monkeypatch: pytest.Mo
     assert set(timeout_exc.partial_results["symbol"].unique()) == {"AAA", "CCC"}
     assert timeout_exc.successful_symbols == 2
     assert timeout_exc.total_symbols == 3
+
+
+def test_build_priority_symbols_matches_fetcher_universe(monkeypatch: pytest.MonkeyPatch) -> None:
+    fetcher = make_fetcher(monkeypatch)
+    settings = SimpleNamespace(watchlists={"custom": ["spy", " pltr ", "ZZZZ"]})
+
+    symbols = build_priority_symbols(settings)
+
+    assert build_priority_symbols(fetcher.settings) == fetcher.priority_symbols
+    assert symbols[: len(BASE_PRIORITY_SYMBOLS)] == list(BASE_PRIORITY_SYMBOLS)
+    assert symbols[-1] == "ZZZZ"
+    assert symbols.count("SPY") == 1
+
+
+def test_save_to_cache_replaces_the_file_atomically(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    fetcher = make_fetcher(monkeypatch)
+    cache_path = tmp_path / "options_cache.json"
+    frame = pd.DataFrame([{"symbol": "TSLA", "lastPrice": 4.2}])
+
+    fetcher.save_to_cache(frame, filename=str(cache_path))
+    assert json.loads(cache_path.read_text())["symbols"] == ["TSLA"]
+
+    # A write that fails midway leaves the previous snapshot and no temp file behind
+    unserializable = pd.DataFrame([{"symbol": "AAPL", "lastPrice": object()}])
+    fetcher.save_to_cache(unserializable, filename=str(cache_path))
+
+    assert json.loads(cache_path.read_text())["symbols"] == ["TSLA"]
+    assert [path.name for path in tmp_path.iterdir()] == ["options_cache.json"]
+
+
+def test_disabled_cache_is_neither_read_nor_written(monkeypatch: pytest.MonkeyPatch):
+    fetcher = make_fetcher(monkeypatch)
+    fetcher.cache_enabled = False
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("the shared cache should not be touched")
+
+    monkeypatch.setattr(BulkOptionsFetcher, "fetch_bulk_options_parallel", lambda self, **_kwargs: None)
+    monkeypatch.setattr(BulkOptionsFetcher, "load_from_cache", fail)
+    monkeypatch.setattr(BulkOptionsFetcher, "save_to_cache", fail)
+
+    # No stale fallback when the live fetch fails
+    assert fetcher.get_fresh_options_data(use_cache=True, symbols=["TSLA"]) is None
+
+    monkeypatch.setattr(
+        BulkOptionsFetcher,
+        "fetch_bulk_options_parallel",
+        lambda self, **_kwargs: pd.DataFrame(
+            [{"symbol": "TSLA", "expiration": (datetime.now(timezone.utc) + timedelta(days=3)).isoformat()}]
+        ),
+    )
+    frame = fetcher.get_fresh_options_data(use_cache=True, symbols=["TSLA"])
+    assert frame.attrs["cache_source"] == "adapter-live"
@@ -0,0 +1,47 @@
+"""Tests for the crypto quant blend signal."""
+
+import math
+
+from src.signals import CryptoQuantSignal, Direction
+from src.signals import crypto_quant_signal
+from src.signals.base import clip_scalar
+
+
+class TestCryptoQuantSignal:
+    """Composite scoring and clipping."""
+
+    def test_components_are_clipped_and_blended(self):
+        insights = {
+            "news": {"sentiment_score": 2.0, "momentum_score": 1.0, "buzz_score": 1.0, "article_count": 3},
+            "derivatives": {"basis_score": 0.5, "funding_score": 0.2, "open_interest_score": -0.4},
+            "onchain": {"momentum_score": -0.2, "volume_score": 0.1, "volatility_bias": 0.0, "macro_bias": 0.3},
+        }
+
+        result = CryptoQuantSignal().calculate({"quant_insights": insights})
+
+        structure = -0.2 * 0.5 + 0.1 * 0.25 + 0.3 * 0.10
+        derivatives = 0.5 * 0.6 + 0.2 * 0.25 - 0.4 * 0.15
+        assert result.details["sentiment_component"] == 1.0
+        assert math.isclose(result.details["derivatives_component"], derivatives)
+        assert math.isclose(result.score, (0.45 + derivatives * 0.35 + structure * 0.20) * 100.0)
+        assert result.direction == Direction.BULLISH
+        assert 0.0 <= result.confidence <= 95.0
+
+    def test_clip_matches_numpy_semantics(self):
+        assert clip_scalar(1.5, -1.0, 1.0) == 1.0
+        assert clip_scalar(-3.0, -1.0, 1.0) == -1.0
+        assert clip_scalar(0.25, -1.0, 1.0) == 0.25
+        assert math.isnan(clip_scalar(math.nan, -1.0, 1.0))
+
+    def test_format_components_labels_each_tone(self):
+        labels = CryptoQuantSignal()._format_components(0.5, -0.15, -2.0)
+
+        assert labels == ("75% bullish", "42% neutral", "0% bearish")
+
+    def test_raw_inputs_only_attached_in_debug_mode(self, monkeypatch):
+        data = {"quant_insights": {"news": {"sentiment_score": 0.4, "top_headlines": ["..."] * 50}}}
+
+        assert "inputs" not in CryptoQuantSignal().calculate(data).details
+
+        monkeypatch.setattr(crypto_quant_signal, "_DEBUG_DETAILS", True)
+        assert CryptoQuantSignal().calculate(data).details["inputs"] is data["quant_insights"]
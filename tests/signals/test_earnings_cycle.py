@@ -0,0 +1,164 @@
+"""Tests for the earnings cycle phase classification."""
+
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+import yfinance
+
+from src.signals import earnings_cycle
+from src.signals.earnings_cycle import EarningsCycleAnalyzer
+
+
+class TestEarningsPhaseClassification:
+    """Phase classification by days to earnings."""
+
+    @pytest.mark.parametrize(
+        ("days", "phase"),
+        [
+            (15, "pre_runup"),
+            (5, "pre_runup"),
+            (4, "imminent"),
+            (0, "imminent"),
+            (-1, "post_reaction"),
+            (-3, "post_reaction"),
+            (-4, "post_drift"),
+            (-10, "post_drift"),
+            (-11, "mid_cycle"),
+            (16, "mid_cycle"),
+            (20, "dead_zone"),
+            (-60, "dead_zone"),
+            (61, "mid_cycle"),
+        ],
+    )
+    def test_phase_boundaries(self, days, phase):
+        assert EarningsCycleAnalyzer()._classify_earnings_phase(days) == phase
+
+    @pytest.mark.parametrize(
+        ("days", "snippet"),
+        [
+            (10, "run-up phase: 10 days until earnings."),
+            (-2, "reaction phase (2 days since announcement)."),
+            (30, "dead zone (30 days until earnings)."),
+            (-45, "dead zone (45 days since earnings)."),
+            (90, "(90 days until next earnings)."),
+            (16, "(mid-cycle period)."),
+        ],
+    )
+    def test_rationale_templates(self, days, snippet):
+        analyzer = EarningsCycleAnalyzer()
+        metrics = {"days_to_earnings": days, "earnings_phase": analyzer._classify_earnings_phase(days)}
+
+        assert snippet in analyzer._interpret_earnings_cycle(metrics, "AAPL")[3]
+        assert set(earnings_cycle._RATIONALE_TEMPLATES) == set(earnings_cycle._PHASE_LABELS)
+
+    def test_interpretation_is_cached_per_phase_and_quality(self):
+        analyzer = EarningsCycleAnalyzer()
+        full = {"days_to_earnings": 8, "earnings_phase": "pre_runup", "data_quality": "full"}
+        calendar = dict(full, data_quality="calendar_only")
+
+        first = analyzer._interpret_earnings_cycle(full, "AAPL")
+
+        assert analyzer._interpret_earnings_cycle(dict(full), "MSFT") is first
+        assert analyzer._interpret_earnings_cycle(calendar, "AAPL")[2] == first[2] - 10
+
+
+class TestEarningsDateCache:
+    """yfinance earnings lookups are cached per symbol."""
+
+    @pytest.fixture
+    def fake_ticker(self, monkeypatch):
+        today = date.today()
+        index = pd.DatetimeIndex(
+            [pd.Timestamp(today + timedelta(days=12)), pd.Timestamp(today - timedelta(days=80))],
+            tz="America/New_York",
+        )
+        calls = []
+
+        def ticker(symbol):
+            calls.append(symbol)
+            return SimpleNamespace(earnings_dates=pd.DataFrame({"EPS Estimate": [1.0, 0.9]}, index=index))
+
+        monkeypatch.setattr(earnings_cycle, "_EARNINGS_CACHE", {})
+        monkeypatch.setattr(yfinance, "Ticker", ticker)
+        return calls
+
+    def test_metrics_reuse_cached_dates(self, fake_ticker):
+        analyzer = EarningsCycleAnalyzer()
+
+        first = analyzer._get_earnings_cycle_metrics("AAPL")
+        second = analyzer._get_earnings_cycle_metrics("AAPL")
+
+        assert fake_ticker == ["AAPL"]
+        assert first == second
+        assert first["days_to_earnings"] == 12
+        assert first["earnings_phase"] == "pre_runup"
+        assert first["last_earnings_date"] == (date.today() - timedelta(days=80)).isoformat()
+
+    def test_expired_entries_are_refetched(self, fake_ticker):
+        earnings_cycle._fetch_earnings_cached("MSFT")
+        earnings_cycle._fetch_earnings_cached("MSFT", ttl=0)
+
+        assert fake_ticker == ["MSFT", "MSFT"]
+
+    def test_only_past_dates_count_backwards(self, monkeypatch):
+        today = date.today()
+        index = pd.DatetimeIndex([pd.Timestamp(today - timedelta(days=6)), pd.NaT, pd.Timestamp(today - timedelta(days=95))])
+        frame = pd.DataFrame({"EPS Estimate": [1.0, 1.1, 0.9]}, index=index)
+        monkeypatch.setattr(earnings_cycle, "_EARNINGS_CACHE", {})
+        monkeypatch.setattr(yfinance, "Ticker", lambda symbol: SimpleNamespace(earnings_dates=frame))
+
+        metrics = EarningsCycleAnalyzer()._get_earnings_cycle_metrics("TSLA")
+
+        assert metrics["days_to_earnings"] == -6
+        assert metrics["next_earnings_date"] is None
+        assert metrics["earnings_phase"] == "post_drift"
+
+    def test_misses_are_cached_briefly(self, monkeypatch):
+        calls = []
+
+        def ticker(symbol):
+            calls.append(symbol)
+            return SimpleNamespace(earnings_dates=None, calendar=None)
+
+        monkeypatch.setattr(earnings_cycle, "_EARNINGS_CACHE", {})
+        monkeypatch.setattr(yfinance, "Ticker", ticker)
+
+        assert earnings_cycle._fetch_earnings_cached("NOPE") is None
+        assert earnings_cycle._fetch_earnings_cached("NOPE") is None
+        assert calls == ["NOPE"]
+
+        monkeypatch.setattr(earnings_cycle, "EARNINGS_MISS_TTL_SECONDS", 0)
+        earnings_cycle._fetch_earnings_cached("NOPE")
+        assert calls == ["NOPE", "NOPE"]
+
+    def test_earnings_dates_errors_fall_back_to_calendar(self, monkeypatch):
+        next_date = date.today() + timedelta(days=30)
+
+        class Ticker:
+            calendar = pd.DataFrame({"Earnings Date": [pd.Timestamp(next_date)]})
+
+            @property
+            def earnings_dates(self):
+                raise KeyError("Earnings Date")
+
+        monkeypatch.setattr(yfinance, "Ticker", lambda symbol: Ticker())
+
+        assert earnings_cycle._fetch_earnings_dates("AAPL")[0] == "calendar_only"
+
+
+class TestNeutralResults:
+    """Results for symbols the signal cannot score."""
+
+    def test_neutral_results_use_the_pass_timestamp(self):
+        analyzer = EarningsCycleAnalyzer()
+        now = datetime(2024, 5, 1, 9, 30)
+
+        first = analyzer.calculate({"symbol": "", "stock_price": 10.0}, now=now)
+        second = analyzer.calculate({"symbol": "XYZ"}, now=now)
+
+        assert first.timestamp is now and second.timestamp is now
+        assert first.details == {"error": "Invalid data values"}
+        assert second.details == {"error": "Missing required data"}
+        assert first.details is not analyzer.calculate({"symbol": "", "stock_price": 1.0}, now=now).details
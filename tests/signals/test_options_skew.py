@@ -0,0 +1,93 @@
+"""Tests for options skew metrics."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.signals import OptionsSkewAnalyzer
+
+
+def reference_skew_metrics(chain, stock_price, atm_iv):
+    """The per-side pandas formulation the shared band masks replaced."""
+
+    calls = chain[chain["type"] == "call"].copy()
+    puts = chain[chain["type"] == "put"].copy()
+    calls["moneyness"] = (calls["strike"] - stock_price) / stock_price
+    puts["moneyness"] = (stock_price - puts["strike"]) / stock_price
+    otm_calls = calls[(calls["moneyness"] >= 0.05) & (calls["moneyness"] <= 0.15)]
+    otm_puts = puts[(puts["moneyness"] >= 0.05) & (puts["moneyness"] <= 0.15)]
+    rr_calls = calls[(calls["moneyness"] >= 0.10) & (calls["moneyness"] <= 0.15)]
+    rr_puts = puts[(puts["moneyness"] >= 0.10) & (puts["moneyness"] <= 0.15)]
+    put_skew = (otm_puts["impliedVolatility"].mean() - atm_iv) / atm_iv * 100
+    call_skew = (otm_calls["impliedVolatility"].mean() - atm_iv) / atm_iv * 100
+    risk_reversal = None
+    if len(rr_puts) and len(rr_calls):
+        risk_reversal = rr_puts["impliedVolatility"].mean() - rr_calls["impliedVolatility"].mean()
+    return {
+        "put_skew": put_skew,
+        "call_skew": call_skew,
+        "risk_reversal": risk_reversal,
+        "otm_put_count": len(otm_puts),
+        "otm_call_count": len(otm_calls),
+    }
+
+
+def make_chain(seed, rows=80):
+    rng = np.random.default_rng(seed)
+    iv = rng.uniform(0.15, 0.9, rows)
+    iv[::11] = np.nan
+    return pd.DataFrame(
+        {
+            "type": rng.choice(["call", "put"], rows),
+            "strike": 100 * rng.uniform(0.75, 1.25, rows),
+            "impliedVolatility": iv,
+        }
+    )
+
+
+class TestOptionsSkewMetrics:
+    """Band masks against the per-side selection."""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_matches_per_side_selection(self, seed):
+        rng = np.random.default_rng(seed)
+        rows = 200
+        iv = rng.uniform(0.15, 0.9, rows)
+        iv[::13] = np.nan
+        chain = pd.DataFrame(
+            {
+                "type": rng.choice(["call", "put"], rows),
+                "strike": 100 * rng.uniform(0.75, 1.25, rows),
+                "impliedVolatility": iv,
+            }
+        )
+
+        metrics = OptionsSkewAnalyzer()._calculate_skew_metrics(chain, 100.0, 0.35)
+        expected = reference_skew_metrics(chain, 100.0, 0.35)
+
+        for name, value in expected.items():
+            assert metrics[name] == pytest.approx(value, rel=1e-12)
+
+    def test_band_edges_are_inclusive(self):
+        chain = pd.DataFrame(
+            {
+                "type": ["call", "call", "put", "put", "call", "put"],
+                "strike": [105.0, 115.0, 95.0, 85.0, 116.0, 96.0],
+                "impliedVolatility": [0.30, 0.34, 0.40, 0.44, 0.90, 0.90],
+            }
+        )
+
+        metrics = OptionsSkewAnalyzer()._calculate_skew_metrics(chain, 100.0, 0.35)
+
+        assert metrics["otm_call_count"] == 2 and metrics["otm_put_count"] == 2
+        assert metrics["risk_reversal"] == pytest.approx(0.44 - 0.34)
+
+    def test_malformed_chain_is_logged_and_neutral(self, caplog):
+        chain = make_chain(3).drop(columns=["strike"])
+
+        with caplog.at_level("ERROR", logger="src.signals.options_skew"):
+            result = OptionsSkewAnalyzer().calculate({"options_chain": chain, "stock_price": 100.0, "atm_iv": 0.3})
+
+        assert result.direction.value == "neutral"
+        assert result.rationale == "No skew signal: Insufficient options data"
+        assert "Error calculating skew metrics" in caplog.text
@@ -0,0 +1,193 @@
+"""Tests for the regime detection ADX kernel."""
+
+import numpy as np
+import pytest
+
+from src.signals import RegimeDetector, regime_detection
+
+
+def reference_adx(highs, lows, closes, period=14):
+    """Array formulation of ADX; the first bar has no previous bar."""
+
+    def wilder_smooth(data):
+        smoothed = np.zeros_like(data)
+        smoothed[period - 1] = np.mean(data[:period])
+        for i in range(period, len(data)):
+            smoothed[i] = (smoothed[i - 1] * (period - 1) + data[i]) / period
+        return smoothed
+
+    true_range = highs - lows
+    plus_dm = np.zeros_like(highs)
+    minus_dm = np.zeros_like(lows)
+    high_close = np.abs(highs[1:] - closes[:-1])
+    low_close = np.abs(lows[1:] - closes[:-1])
+    true_range[1:] = np.maximum(true_range[1:], np.maximum(high_close, low_close))
+    plus_dm[1:] = np.maximum(np.diff(highs), 0)
+    minus_dm[1:] = np.maximum(-np.diff(lows), 0)
+    mask_plus = minus_dm > plus_dm
+    mask_minus = plus_dm > minus_dm
+    plus_dm[mask_plus] = 0
+    minus_dm[mask_minus] = 0
+
+    atr = wilder_smooth(true_range)
+    plus_di = 100 * wilder_smooth(plus_dm) / (atr + 1e-10)
+    minus_di = 100 * wilder_smooth(minus_dm) / (atr + 1e-10)
+    dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di + 0.0001)
+    return wilder_smooth(dx)[-1], plus_di[-1], minus_di[-1]
+
+
+class TestRegimeADX:
+    """Compiled ADX against the array formulation."""
+
+    def test_steady_uptrend_has_no_minus_movement(self):
+        closes = np.linspace(100.0, 130.0, 40)
+
+        adx, di_plus, di_minus = RegimeDetector()._calculate_adx(closes + 1, closes - 1, closes)
+
+        # With np.roll the first bar saw the last close as its predecessor and
+        # booked a large minus movement that lingered in the smoothed values
+        assert di_minus == 0.0
+        assert di_plus > 0.0 and adx > 50.0
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_adx_matches_reference(self, seed):
+        rng = np.random.default_rng(seed)
+        closes = 100 + np.cumsum(rng.normal(0, 1.5, 120))
+        highs = closes + rng.uniform(0, 2, 120)
+        lows = closes - rng.uniform(0, 2, 120)
+
+        result = RegimeDetector()._calculate_adx(highs, lows, closes)
+
+        assert result == pytest.approx(reference_adx(highs, lows, closes), rel=1e-9)
+
+    def test_single_period_history_uses_the_seed_window(self):
+        rng = np.random.default_rng(4)
+        closes = 100 + np.cumsum(rng.normal(0, 1.0, 14))
+        highs, lows = closes + 0.5, closes - 0.5
+
+        result = RegimeDetector()._calculate_adx(highs, lows, closes)
+
+        assert result == pytest.approx(reference_adx(highs, lows, closes), rel=1e-9)
+        with pytest.raises(ValueError):
+            RegimeDetector()._calculate_adx(highs[:13], lows[:13], closes[:13])
+
+    def test_wilder_smooth_seeds_with_the_first_window_mean(self):
+        smoothed = RegimeDetector()._wilder_smooth(np.arange(1.0, 6.0), 3)
+
+        assert smoothed.tolist() == [0.0, 0.0, 2.0, 8.0 / 3.0, (8.0 / 3.0 * 2 + 5.0) / 3]
+
+
+def reference_bb_width(closes, period=20, std_dev=2.0):
+    """The per-window loop the sliding-window version replaced."""
+
+    current = std_dev * np.std(closes[-period:]) / np.mean(closes[-period:])
+    history = [
+        std_dev * np.std(closes[i - period : i]) / np.mean(closes[i - period : i])
+        for i in range(period, len(closes))
+    ]
+    if not history:
+        return current, 50.0
+    return current, np.sum(np.array(history) < current) / len(history) * 100
+
+
+class TestRegimeBollingerWidth:
+    """Bollinger width percentile over every trailing window."""
+
+    @pytest.mark.parametrize("length", [20, 21, 60, 250])
+    def test_matches_per_window_loop(self, length):
+        closes = 100 + np.cumsum(np.random.default_rng(length).normal(0, 1, length))
+
+        width, percentile = RegimeDetector()._calculate_bb_width(closes)
+        expected_width, expected_percentile = reference_bb_width(closes)
+
+        # The compiled kernel sums each window sequentially, NumPy pairwise
+        assert width == pytest.approx(expected_width, rel=1e-12)
+        assert percentile == expected_percentile
+
+    @pytest.mark.parametrize("length", [20, 21, 60, 250])
+    def test_numpy_fallback_matches_per_window_loop(self, length, monkeypatch):
+        closes = 100 + np.cumsum(np.random.default_rng(length).normal(0, 1, length))
+        monkeypatch.setattr(regime_detection, "NUMBA_AVAILABLE", False)
+
+        assert RegimeDetector()._calculate_bb_width(closes) == reference_bb_width(closes)
+
+    def test_flat_prices_have_zero_width_and_percentile(self):
+        assert RegimeDetector()._calculate_bb_width(np.full(60, 50.0)) == (0.0, 0.0)
+
+
+class TestRegimeMetricsCache:
+    """Metrics are reused while the price history is unchanged."""
+
+    def test_unchanged_history_hits_the_cache(self, monkeypatch):
+        import pandas as pd
+
+        closes = 100 + np.cumsum(np.random.default_rng(4).normal(0, 1, 80))
+        history = pd.DataFrame({"close": closes, "high": closes + 1, "low": closes - 1})
+        detector = RegimeDetector()
+        first = detector._calculate_regime_metrics(history, closes[-1])
+
+        monkeypatch.setattr(detector, "_calculate_adx", lambda *args: pytest.fail("expected a cache hit"))
+        second = detector._calculate_regime_metrics(history.copy(), closes[-1])
+        assert second == first and second is not first
+
+        monkeypatch.undo()
+        history.loc[79, "close"] += 5.0
+        assert detector._calculate_regime_metrics(history, closes[-1]) != first
+
+
+class TestRegimePriceColumns:
+    """OHLC columns are resolved regardless of the feed's capitalization."""
+
+    def test_capitalized_columns_match_lower_case(self):
+        import pandas as pd
+
+        closes = 100 + np.cumsum(np.random.default_rng(6).normal(0, 1, 60))
+        lower = pd.DataFrame({"close": closes, "high": closes + 1, "low": closes - 1})
+        upper = pd.DataFrame({"Close": closes, "HIGH": closes + 1, "Low": closes - 1})
+
+        expected = RegimeDetector()._calculate_regime_metrics(lower, closes[-1])
+
+        assert RegimeDetector()._calculate_regime_metrics(upper, closes[-1]) == expected
+
+    def test_lower_case_label_wins_and_missing_close_is_rejected(self):
+        import pandas as pd
+
+        closes = 100 + np.cumsum(np.random.default_rng(7).normal(0, 1, 30))
+        both = pd.DataFrame({"Close": closes * 0, "close": closes})
+
+        metrics = RegimeDetector()._calculate_regime_metrics(both, closes[-1])
+
+        assert metrics == RegimeDetector()._calculate_regime_metrics(both[["close"]], closes[-1])
+        assert RegimeDetector()._calculate_regime_metrics(pd.DataFrame({"open": closes}), closes[-1]) is None
+
+
+def reference_trend_quality(closes):
+    """The multi-pass regression the closed-form version replaced."""
+
+    x = np.arange(len(closes))
+    x_mean, y_mean = np.mean(x), np.mean(closes)
+    denominator_x = np.sum((x - x_mean) ** 2)
+    slope = np.sum((x - x_mean) * (closes - y_mean)) / denominator_x
+    ss_res = np.sum((closes - (slope * (x - x_mean) + y_mean)) ** 2)
+    ss_tot = np.sum((closes - y_mean) ** 2)
+    return max(0.0, min(1.0, 1 - ss_res / ss_tot)), slope
+
+
+class TestRegimeTrendQuality:
+    """Regression slope and R-squared."""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_matches_multi_pass_regression(self, seed):
+        rng = np.random.default_rng(seed)
+        closes = 100 + np.cumsum(rng.normal(0.2, 1.0, 120))
+
+        result = RegimeDetector()._calculate_trend_quality(closes)
+
+        assert result == pytest.approx(reference_trend_quality(closes), rel=1e-10)
+
+    def test_degenerate_histories(self):
+        detector = RegimeDetector()
+
+        assert detector._calculate_trend_quality(np.array([5.0])) == (0.0, 0.0)
+        assert detector._calculate_trend_quality(np.full(30, 42.0)) == (0.0, 0.0)
+        assert detector._calculate_trend_quality(np.arange(30.0)) == (1.0, 1.0)
@@ -1,14 +1,29 @@
 """Integration tests for directional signals."""
 
+import json
+from datetime import datetime
+
+import numpy as np
 import pandas as pd
 import pytest
 
 from src.signals import (
     Direction,
+    DirectionalScore,
     OptionsSkewAnalyzer,
+    Signal,
     SignalAggregator,
+    SignalResult,
     SmartMoneyFlowDetector,
 )
+from src.signals.base import (
+    CALL_CODE,
+    OPTION_TYPE_CODE_COLUMN,
+    PUT_CODE,
+    data_fingerprint,
+    direction_from_score,
+    option_type_codes,
+)
 
 
 class TestOptionsSkewAnalyzer:
@@ -278,6 +293,191 @@ class TestSignalAggregator:
         assert breakdown["overall"]["symbol"] == "TEST"
         assert all(key in breakdown["signals"][0] for key in ["name", "weight", "direction", "score", "confidence"])
 
+    def test_results_share_the_pass_timestamp(self):
+        """Test that one aggregation pass stamps every result identically."""
+        aggregator = SignalAggregator([OptionsSkewAnalyzer(weight=0.5), SmartMoneyFlowDetector(weight=0.5)])
+
+        # Empty data sends both signals down the missing-data path
+        result = aggregator.aggregate("TEST", {})
+
+        assert len(result.signals) == 2
+        assert all(signal.timestamp is result.timestamp for signal in result.signals)
+
+    def test_aggregate_many_batches_each_signal_and_isolates_errors(self, caplog):
+        """Test that a batch pass calls each signal once and keeps bad rows local."""
+
+        class PriceSignal(Signal):
+            def __init__(self):
+                super().__init__("Price", weight=1.0)
+                self.batches = []
+
+            def get_required_data(self):
+                return ["stock_price"]
+
+            def calculate(self, data, now=None):
+                if data["stock_price"] < 0:
+                    raise ValueError("negative price")
+                score = 50.0 if data["stock_price"] > 100 else -50.0
+                return SignalResult(self.name, Direction.NEUTRAL, score, 80.0, "", {}, now)
+
+            def calculate_many(self, rows, now=None):
+                self.batches.append(len(rows))
+                return super().calculate_many(rows, now=now)
+
+        signal = PriceSignal()
+        aggregator = SignalAggregator([signal])
+
+        results = aggregator.aggregate_many(["A", "B", "C"], [{"stock_price": 150.0}, {}, {"stock_price": 50.0}])
+
+        assert signal.batches == [2]
+        assert [r.symbol for r in results] == ["A", "B", "C"]
+        assert [r.direction for r in results] == [Direction.BULLISH, Direction.NEUTRAL, Direction.BEARISH]
+        assert results[1].signals[0].details == {"error": "missing_data"}
+        assert len({r.timestamp for r in results}) == 1
+
+        results = aggregator.aggregate_many(["A", "B"], [{"stock_price": 150.0}, {"stock_price": -1.0}])
+        assert results[0].direction == Direction.BULLISH
+        assert results[1].signals[0].details == {"error": "negative price"}
+        assert "Error calculating Price: negative price" in caplog.text
+
+
+    def test_aggregate_confidence_blend(self):
+        """Test agreement, mean confidence, coverage and disagreement terms."""
+        aggregator = SignalAggregator([OptionsSkewAnalyzer(weight=0.5), SmartMoneyFlowDetector(weight=0.5)])
+        now = datetime(2024, 1, 2)
+
+        def result(score, confidence):
+            return SignalResult("S", Direction.NEUTRAL, score, confidence, "", {}, now)
+
+        # One bullish, one bearish: 50% agreement, mean 70, full coverage, 10 point penalty
+        confidence = aggregator._calculate_aggregate_confidence([result(40, 60.0), result(-40, 80.0), result(0, 5.0)])
+
+        assert type(confidence) is float
+        assert confidence == pytest.approx(50 * 0.4 + 70 * 0.5 + 10 - 10)
+        assert aggregator._calculate_aggregate_confidence([result(90, 100.0)] * 2) == 95.0
+
+    def test_recommendations_follow_confidence_buckets(self):
+        """Test the precomputed recommendation for each confidence band."""
+        aggregator = SignalAggregator([])
+
+        assert aggregator._generate_recommendation(Direction.BULLISH, 80, 50).startswith(
+            "Strong Bullish - Strong conviction to favor calls over puts."
+        )
+        assert aggregator._generate_recommendation(Direction.BEARISH, 60, -50).startswith(
+            "Moderate Bearish - Moderate conviction to favor puts."
+        )
+        assert aggregator._generate_recommendation(Direction.BULLISH, 44.9, 50).startswith("Very Weak Bullish - Weak signal")
+        assert aggregator._generate_recommendation(Direction.NEUTRAL, 90, 0).startswith("No clear directional bias")
+        assert aggregator._get_strength_label(float("nan")) == "Very Weak"
+
+
+class TestDirection:
+    """Test Direction values and score thresholds."""
+
+    def test_direction_is_a_plain_string(self):
+        assert Direction.BULLISH == "bullish"
+        assert json.dumps({"direction": Direction.BEARISH}) == '{"direction": "bearish"}'
+
+    def test_direction_from_score_thresholds(self):
+        assert direction_from_score(15.01) is Direction.BULLISH
+        assert direction_from_score(15.0) is Direction.NEUTRAL
+        assert direction_from_score(-15.0) is Direction.NEUTRAL
+        assert direction_from_score(-15.01) is Direction.BEARISH
+        assert direction_from_score(float("nan")) is Direction.NEUTRAL
+        assert direction_from_score(np.float64(-40.0)) is Direction.BEARISH
+
+
+class TestResultDataclasses:
+    """Test the result containers stay slotted."""
+
+    def test_results_have_no_instance_dict(self):
+        result = SignalResult("Skew", Direction.NEUTRAL, 0.0, 0.0, "n/a", {}, datetime.now())
+        score = DirectionalScore("TEST", Direction.NEUTRAL, 0.0, 0.0, [result], "n/a", result.timestamp)
+
+        for instance in (result, score):
+            assert not hasattr(instance, "__dict__")
+            with pytest.raises(AttributeError):
+                instance.extra = 1
+
+
+class TestSignalMetricsCache:
+    """Test content-keyed metric reuse."""
+
+    def test_fingerprint_tracks_content_not_identity(self):
+        frame = pd.DataFrame({"type": ["call", "put"], "strike": [105.0, 95.0]})
+
+        key = data_fingerprint(frame["type"], frame["strike"], 100.0)
+
+        assert data_fingerprint(frame["type"].copy(), frame["strike"].copy(), 100.0) == key
+        assert data_fingerprint(frame["type"], frame["strike"], 100.5) != key
+        assert data_fingerprint(frame["type"][::-1], frame["strike"], 100.0) != key
+
+    def test_skew_metrics_are_reused_for_an_unchanged_chain(self):
+        analyzer = OptionsSkewAnalyzer()
+        chain = pd.DataFrame(
+            {
+                "type": ["call"] * 3 + ["put"] * 3,
+                "strike": [106, 110, 114, 94, 90, 86],
+                "impliedVolatility": [0.30, 0.31, 0.32, 0.40, 0.42, 0.44],
+            }
+        )
+
+        first = analyzer._calculate_skew_metrics(chain, 100.0, 0.35)
+        chain["volume"] = 10  # columns the metrics ignore do not change the key
+        second = analyzer._calculate_skew_metrics(chain, 100.0, 0.35)
+        chain.loc[0, "impliedVolatility"] = 0.50
+        third = analyzer._calculate_skew_metrics(chain, 100.0, 0.35)
+
+        assert len(analyzer._metrics_cache) == 2
+        assert second == first and second is not first
+        assert third["otm_call_iv_avg"] != first["otm_call_iv_avg"]
+
+    def test_skew_metrics_skip_missing_ivs_and_other_types(self):
+        chain = pd.DataFrame(
+            {
+                "type": ["call", "call", "call", "put", "put", "put", "other"],
+                "strike": [106, 110, 112, 94, 90, 88, 110],
+                "impliedVolatility": [0.30, np.nan, 0.34, 0.40, 0.44, np.nan, 0.90],
+            }
+        )
+
+        metrics = OptionsSkewAnalyzer()._calculate_skew_metrics(chain, 100.0, 0.35)
+
+        assert metrics["otm_call_count"] == 3 and metrics["otm_put_count"] == 3
+        assert metrics["otm_call_iv_avg"] == pytest.approx(0.32)
+        assert metrics["otm_put_iv_avg"] == pytest.approx(0.42)
+        assert metrics["risk_reversal"] == pytest.approx(0.44 - 0.34)
+
+
+class TestOptionTypeCodes:
+    """Test call/put encoding shared by the chain-based signals."""
+
+    def test_codes_are_derived_or_read_from_the_precomputed_column(self):
+        chain = pd.DataFrame({"type": ["call", "put", "CALL", None]})
+
+        codes = option_type_codes(chain)
+        assert codes.dtype == np.int8
+        assert codes.tolist() == [CALL_CODE, PUT_CODE, -1, -1]
+
+        chain[OPTION_TYPE_CODE_COLUMN] = np.array([PUT_CODE] * 4, dtype=np.int8)
+        assert option_type_codes(chain).tolist() == [PUT_CODE] * 4
+
+
+class TestSignalValidation:
+    """Test required-field validation."""
+
+    def test_required_fields_are_read_once(self, monkeypatch):
+        analyzer = OptionsSkewAnalyzer()
+        calls = []
+        original = analyzer.get_required_data
+        monkeypatch.setattr(analyzer, "get_required_data", lambda: calls.append(1) or original())
+        data = {"options_chain": pd.DataFrame(), "stock_price": 100.0, "atm_iv": 0.3}
+
+        assert analyzer.validate_data(data)
+        assert not analyzer.validate_data(dict(data, atm_iv=None))
+        assert not analyzer.validate_data({"stock_price": 100.0})
+        assert calls == [1]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
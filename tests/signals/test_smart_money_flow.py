@@ -0,0 +1,164 @@
+"""Tests for the smart money flow components."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.signals import SmartMoneyFlowDetector, smart_money_flow
+from src.signals.base import CALL_CODE, PUT_CODE
+
+
+def make_contracts(seed, rows=40):
+    rng = np.random.default_rng(seed)
+    contracts = pd.DataFrame(
+        {
+            "bid": rng.uniform(0, 5, rows),
+            "ask": rng.uniform(0, 8, rows),
+            "lastPrice": rng.uniform(0, 8, rows),
+            "volume": rng.integers(0, 500, rows).astype(float),
+            "openInterest": rng.integers(0, 800, rows).astype(float),
+        }
+    )
+    contracts.loc[::4, "bid"] = np.nan
+    contracts.loc[::9, "volume"] = np.nan
+    return contracts
+
+
+def flow_sums(contracts, type_codes):
+    columns = ("volume", "openInterest", "bid", "ask", "lastPrice")
+    return SmartMoneyFlowDetector()._flow_sums(type_codes, *(contracts[column].to_numpy() for column in columns))
+
+
+@pytest.fixture(params=[True, False], ids=["compiled", "numpy"])
+def numba_available(request, monkeypatch):
+    monkeypatch.setattr(smart_money_flow, "NUMBA_AVAILABLE", request.param)
+    return request.param
+
+
+def reference_aggressive_flow(contracts, option_type):
+    """The pandas column formulation the array version replaced."""
+
+    midpoint = (contracts["bid"] + contracts["ask"]) / 2
+    aggression = (contracts["lastPrice"] - midpoint) / midpoint
+    total_volume = contracts["volume"].sum()
+    if total_volume <= 0:
+        return 0.0
+    score = np.clip((aggression * contracts["volume"]).sum() / total_volume * 100, -100, 100)
+    return -score if option_type == "put" else score
+
+
+class TestSmartMoneyAggressiveFlow:
+    """Volume-weighted distance of the last trade from the midpoint."""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2, 3])
+    @pytest.mark.parametrize("option_type", ["call", "put"])
+    def test_matches_series_formulation(self, seed, option_type, numba_available):
+        contracts = make_contracts(seed)
+        # Tighten quotes so the score is not simply clipped
+        contracts["ask"] = contracts["bid"].fillna(1.0) + 0.5
+        contracts["lastPrice"] = contracts["ask"] - np.random.default_rng(seed).uniform(0, 0.5, len(contracts))
+        side = CALL_CODE if option_type == "call" else PUT_CODE
+        type_codes = np.full(len(contracts), side, dtype=np.int8)
+
+        sums = flow_sums(contracts, type_codes)
+        result = SmartMoneyFlowDetector()._calculate_aggressive_flow(sums[1, side], sums[0, side], option_type)
+
+        assert result == pytest.approx(reference_aggressive_flow(contracts, option_type), rel=1e-12)
+        assert -100 < result < 100
+
+    def test_zero_midpoint_and_missing_volume(self, numba_available):
+        contracts = pd.DataFrame(
+            {
+                "bid": [0.0, 1.0],
+                "ask": [0.0, 2.0],
+                "lastPrice": [0.5, 1.8],
+                "volume": [10.0, np.nan],
+                "openInterest": [1.0, 1.0],
+            }
+        )
+        detector = SmartMoneyFlowDetector()
+        calls = np.array([CALL_CODE, CALL_CODE], dtype=np.int8)
+
+        # The zero-midpoint contract divides to +inf, as the Series version did
+        sums = flow_sums(contracts, calls)
+        assert detector._calculate_aggressive_flow(sums[1, CALL_CODE], sums[0, CALL_CODE], "call") == 100.0
+        sums = flow_sums(contracts.assign(volume=0.0), calls)
+        assert detector._calculate_aggressive_flow(sums[1, CALL_CODE], sums[0, CALL_CODE], "call") == 0.0
+        assert detector._calculate_aggressive_flow(0.0, 0.0, "call") == 0.0
+
+    def test_type_codes_select_the_side(self, numba_available):
+        contracts = make_contracts(5)
+        type_codes = (np.arange(len(contracts)) % 3 - 1).astype(np.int8)
+        is_put = type_codes == PUT_CODE
+
+        sums = flow_sums(contracts, type_codes)
+        result = SmartMoneyFlowDetector()._calculate_aggressive_flow(sums[1, PUT_CODE], sums[0, PUT_CODE], "put")
+
+        assert result == pytest.approx(reference_aggressive_flow(contracts[is_put], "put"), rel=1e-12)
+        assert sums[0, CALL_CODE] == np.nansum(contracts["volume"][type_codes == CALL_CODE])
+
+
+def reference_block_trades(contracts):
+    """The filtered-DataFrame formulation the masked version replaced."""
+
+    ratio = contracts["volume"] / contracts["openInterest"].replace(0, 1)
+    block_trades = contracts[ratio > 0.5]
+    if block_trades.empty:
+        return 0.0
+    total_volume = contracts["volume"].sum()
+    return min(100, block_trades["volume"].sum() / total_volume * 100 if total_volume > 0 else 0)
+
+
+class TestSmartMoneyBlockTrades:
+    """Share of volume traded in contracts whose volume rivals open interest."""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_matches_filtered_frame(self, seed, numba_available):
+        contracts = make_contracts(seed)
+        contracts.loc[::5, "openInterest"] = 0.0
+        contracts.loc[::7, "openInterest"] = np.nan
+        is_put = np.random.default_rng(seed).random(len(contracts)) < 0.5
+        type_codes = np.where(is_put, PUT_CODE, CALL_CODE).astype(np.int8)
+
+        sums = flow_sums(contracts, type_codes)
+        result = SmartMoneyFlowDetector()._detect_block_trades(sums[2, PUT_CODE], sums[0, PUT_CODE])
+
+        assert result == pytest.approx(reference_block_trades(contracts[is_put]), rel=1e-12)
+
+    def test_no_block_trades(self, numba_available):
+        contracts = make_contracts(0, rows=2).assign(volume=[10.0, 20.0], openInterest=[1000.0, 1000.0])
+
+        sums = flow_sums(contracts, np.array([CALL_CODE, CALL_CODE], dtype=np.int8))
+
+        assert sums[2].tolist() == [0.0, 0.0]
+        assert SmartMoneyFlowDetector()._detect_block_trades(sums[2, CALL_CODE], sums[0, CALL_CODE]) == 0.0
+        assert SmartMoneyFlowDetector()._detect_block_trades(5.0, 0.0) == 0.0
+
+
+class TestSmartMoneyFlowSums:
+    """The compiled single-pass accumulation against the NumPy fallback."""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_compiled_matches_numpy_fallback(self, seed, monkeypatch):
+        contracts = make_contracts(seed, rows=300)
+        contracts.loc[::6, "openInterest"] = 0.0
+        contracts.loc[::8, ["bid", "ask"]] = 0.0
+        type_codes = np.random.default_rng(seed).integers(-1, 2, len(contracts)).astype(np.int8)
+
+        compiled = flow_sums(contracts, type_codes)
+        monkeypatch.setattr(smart_money_flow, "NUMBA_AVAILABLE", False)
+        fallback = flow_sums(contracts, type_codes)
+
+        np.testing.assert_allclose(compiled, fallback, rtol=1e-12)
+
+
+class TestSmartMoneyNetFlow:
+    """Blend of the flow components into one clipped score."""
+
+    def test_components_blend_and_clip(self):
+        detector = SmartMoneyFlowDetector()
+
+        # (80 - 20) / 2 + (10 - -10) / 4 + (40 - 0) / 4 + 15 (ratio 3.0) + 1 * 0.5 * 20
+        assert detector._calculate_net_flow(80, 20, 10, -10, 40, 0, 3.0, 1, 0.5) == 70.0
+        assert detector._calculate_net_flow(100, 0, 100, -100, 100, 0, 10.0, 1, 1.0) == 100.0
+        assert detector._calculate_net_flow(0, 100, -100, 100, 0, 100, 0.1, -1, 1.0) == -100.0
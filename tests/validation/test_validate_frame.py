@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.validation import OptionsDataValidator
+
+
+def make_frame(rows: int = 400, seed: int = 4) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    today = datetime.now().date()
+    stock_price = rng.uniform(5, 300, rows)
+    stock_price[::37] = 0.0
+    bid = rng.uniform(0, 20, rows)
+    ask = bid * rng.uniform(0.8, 2.5, rows)
+    ask[::29] = 0.0
+    return pd.DataFrame(
+        {
+            "symbol": rng.choice(["AAPL", "MSFT"], rows),
+            "type": rng.choice(["call", "put"], rows),
+            "stockPrice": stock_price,
+            "strike": stock_price * rng.uniform(-0.1, 2.5, rows),
+            "bid": bid,
+            "ask": ask,
+            "lastPrice": bid * rng.uniform(0.2, 3.0, rows),
+            "volume": rng.choice([0, 2, 50, 5000], rows),
+            "openInterest": rng.choice([0, 4, 500], rows),
+            "impliedVolatility": rng.choice([np.nan, -0.1, 0.4, 2.5, 3.5], rows),
+            "expiration": [
+                "garbage" if days is None else (today + timedelta(days=int(days))).isoformat()
+                for days in rng.choice([None, -1, 0, 1, 2, 30], rows)
+            ],
+            "_price_source": rng.choice(["fast_info.last_price", "STALE_cache", "previousClose"], rows),
+            "_price_age_seconds": rng.choice([None, 30.0, 1800.0, 7200.0, 100_000.0], rows),
+        }
+    )
+
+
+@pytest.mark.parametrize("market_open", [True, False])
+def test_validate_frame_matches_row_validator(monkeypatch: pytest.MonkeyPatch, market_open: bool) -> None:
+    validator = OptionsDataValidator()
+    monkeypatch.setattr(validator, "_is_market_hours", lambda: market_open)
+    frame = make_frame()
+
+    result = validator.validate_frame(frame)
+
+    assert list(result.index) == list(frame.index)
+    for index, option in zip(frame.index, frame.to_dict(orient="records")):
+        report = validator.validate_option(option)
+        row = result.loc[index]
+        assert row["quality"] is report.quality
+        assert row["score"] == report.score
+        assert row["issues"] == report.issues
+        assert row["warnings"] == report.warnings
+
+
+def test_validate_frame_handles_missing_columns() -> None:
+    validator = OptionsDataValidator()
+    frame = pd.DataFrame({"symbol": ["AAPL"], "strike": [100.0]})
+
+    result = validator.validate_frame(frame)
+    report = validator.validate_option(frame.to_dict(orient="records")[0])
+
+    assert result.iloc[0]["score"] == report.score
+    assert result.iloc[0]["issues"] == report.issues
+    assert result.iloc[0]["warnings"] == report.warnings